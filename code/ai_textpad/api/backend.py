@@ -0,0 +1,354 @@
+"""Base client for OpenAI-compatible chat completion backends."""
+
+import hashlib
+import json
+import time
+import httpx
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .prompt_compiler import PromptCompiler
+from .singleflight import SingleFlight
+
+
+class TokenUsage:
+    """Token usage of the requests made within a metered_usage() block."""
+
+    def __init__(self):
+        """Initialize usage counters."""
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+
+
+# Usage accumulator of the current task (inherited by the tasks it starts)
+_current_usage: ContextVar[Optional[TokenUsage]] = ContextVar("current_usage", default=None)
+
+
+@contextmanager
+def metered_usage() -> Iterator[TokenUsage]:
+    """Add up the token usage of every request made inside the block.
+
+    Only requests made by the current task (and tasks it starts) count, so
+    concurrent work elsewhere in the process is not included. A request
+    shared by coalesced callers counts for each of them.
+
+    Yields:
+        Usage totals, updated as responses arrive
+    """
+    usage = TokenUsage()
+    token = _current_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _current_usage.reset(token)
+
+
+class BackendCapabilities(NamedTuple):
+    """Optional features a backend supports."""
+
+    # Server-sent event streaming of completions
+    streaming: bool = True
+    # response_format={"type": "json_object"}
+    json_mode: bool = False
+    # Provider-side prompt prefix caching (cache_control hints honoured)
+    prompt_caching: bool = False
+
+
+class ChatBackend:
+    """Client for an OpenAI-compatible /chat/completions endpoint.
+
+    Each instance owns its own HTTP connection pool, so backends never
+    compete for connections. Subclasses set the endpoint, capabilities and
+    any provider-specific request fields.
+    """
+
+    # Backend identifier used in frontmatter (``backend: local``)
+    name = "openai-compatible"
+
+    BASE_URL = "http://127.0.0.1:8080/v1"
+
+    capabilities = BackendCapabilities()
+
+    # Per-request timeout in seconds
+    TIMEOUT = 60.0
+
+    # Connection pool size
+    MAX_CONNECTIONS = 100
+
+    # Shared across client instances so compiled prompts survive between requests
+    compiler = PromptCompiler()
+
+    def __init__(self, api_key: str = "", model: str = "",
+                 base_url: Optional[str] = None,
+                 max_connections: Optional[int] = None):
+        """Initialize backend client.
+
+        Args:
+            api_key: API key (sent as a bearer token when non-empty)
+            model: Default model identifier
+            base_url: API base URL (default: BASE_URL)
+            max_connections: Connection pool size (default: MAX_CONNECTIONS)
+        """
+        self.api_key = api_key
+        self.model = model
+        self.base_url = (base_url or self.BASE_URL).rstrip("/")
+        self.client = httpx.AsyncClient(
+            timeout=self.TIMEOUT,
+            limits=httpx.Limits(max_connections=max_connections or self.MAX_CONNECTIONS)
+        )
+        # Coalescing of identical concurrent requests made through this client,
+        # so a shared request runs on the connection pool its callers share
+        self.flights = SingleFlight()
+        self.last_usage: Dict[str, Any] = {}
+        self.total_prompt_tokens = 0
+        self.total_cached_tokens = 0
+        # Called with (model, seconds to first token or None on failure,
+        # tokens per second) after each streamed request
+        self.observer: Optional[Callable[[str, Optional[float], float], None]] = None
+
+    def _headers(self) -> Dict[str, str]:
+        """Build request headers."""
+        headers = {"Content-Type": "application/json"}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        return headers
+
+    def _extra_payload(self) -> Dict[str, Any]:
+        """Provider-specific fields added to every request payload."""
+        return {}
+
+    async def transform_text(
+        self,
+        text: str,
+        transformations: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        temperature: float = 0.0,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        context: Optional[str] = None,
+        output_instructions: Optional[str] = None,
+        json_mode: bool = False
+    ) -> str:
+        """Apply transformations to text using LLM.
+
+        Args:
+            text: Text to transform
+            transformations: List of transformation prompts
+            user_details: Optional user details to inject
+            temperature: Temperature for generation (default: 0.0 for consistency)
+            model: Model override for this request (default: client model)
+            max_tokens: Optional cap on generated tokens
+            context: Optional surrounding text given for reference only
+            output_instructions: Optional response format instructions
+                appended to the system prompt
+            json_mode: Request a JSON object response (if the backend
+                supports it; the instructions must ask for JSON either way)
+
+        Returns:
+            Transformed text
+
+        Raises:
+            httpx.HTTPError: If API request fails
+        """
+        payload = self._build_payload(
+            text, transformations, user_details, temperature, model, max_tokens,
+            context, output_instructions, json_mode
+        )
+        headers = self._headers()
+
+        async def post() -> Tuple[str, Optional[Dict[str, Any]]]:
+            response = await self.client.post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload
+            )
+            response.raise_for_status()
+
+            data = response.json()
+            self._record_usage(data.get("usage"))
+            return data["choices"][0]["message"]["content"], data.get("usage")
+
+        # Identical concurrent requests share a single HTTP call
+        content, usage = await self.flights.do(self._fingerprint(payload), post)
+        self._meter_usage(usage)
+        return content
+
+    async def stream_text(
+        self,
+        text: str,
+        transformations: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        temperature: float = 0.0,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        **options
+    ) -> AsyncIterator[str]:
+        """Apply transformations to text, yielding the output as it is generated.
+
+        Backends without streaming support yield the whole output at once.
+        Streamed requests are not coalesced. Their time to first token and
+        generation rate are reported to ``observer``, if set.
+
+        Args:
+            text: Text to transform
+            transformations: List of transformation prompts
+            user_details: Optional user details to inject
+            temperature: Temperature for generation
+            model: Model override for this request (default: client model)
+            max_tokens: Optional cap on generated tokens
+            **options: Further transform_text options (context,
+                output_instructions, json_mode)
+
+        Yields:
+            Output text fragments, in order
+
+        Raises:
+            httpx.HTTPError: If API request fails
+        """
+        if not self.capabilities.streaming:
+            yield await self.transform_text(
+                text, transformations, user_details, temperature, model, max_tokens, **options
+            )
+            return
+
+        payload = self._build_payload(
+            text, transformations, user_details, temperature, model, max_tokens, **options
+        )
+        payload["stream"] = True
+
+        started = time.perf_counter()
+        first_token_at: Optional[float] = None
+        deltas = 0
+        usage: Dict[str, Any] = {}
+        try:
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                headers=self._headers(),
+                json=payload
+            ) as response:
+                response.raise_for_status()
+                # Server-sent events: one "data: {json}" line per chunk
+                async for line in response.aiter_lines():
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    if chunk.get("usage"):
+                        usage = chunk["usage"]
+                        self._record_usage(usage)
+                        self._meter_usage(usage)
+                    choices = chunk.get("choices") or []
+                    delta = choices[0].get("delta", {}).get("content") if choices else None
+                    if delta:
+                        if first_token_at is None:
+                            first_token_at = time.perf_counter()
+                        deltas += 1
+                        yield delta
+        except httpx.HTTPError:
+            if self.observer:
+                self.observer(payload["model"], None, 0.0)
+            raise
+
+        if self.observer and first_token_at is not None:
+            generating = time.perf_counter() - first_token_at
+            tokens = int(usage.get("completion_tokens") or deltas)
+            self.observer(
+                payload["model"], first_token_at - started,
+                tokens / generating if generating > 0 else 0.0
+            )
+
+    def _build_payload(
+        self,
+        text: str,
+        transformations: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        temperature: float = 0.0,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        context: Optional[str] = None,
+        output_instructions: Optional[str] = None,
+        json_mode: bool = False
+    ) -> Dict[str, Any]:
+        """Build a chat completions request payload (see transform_text)."""
+        model = model or self.model
+
+        # Build messages with a stable, cacheable prefix
+        messages = self.compiler.build_messages(
+            model, text, transformations, user_details,
+            cache_hints=self.capabilities.prompt_caching,
+            context=context,
+            output_instructions=output_instructions
+        )
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "temperature": temperature,
+            **self._extra_payload(),
+        }
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        if json_mode and self.capabilities.json_mode:
+            payload["response_format"] = {"type": "json_object"}
+        return payload
+
+    def _fingerprint(self, payload: Dict[str, Any]) -> str:
+        """Build a request fingerprint for single-flight coalescing.
+
+        Args:
+            payload: Request payload
+
+        Returns:
+            Hex digest identifying the request
+        """
+        key_source = json.dumps(
+            [self.base_url, self.api_key, payload], sort_keys=True, ensure_ascii=False
+        )
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    def _record_usage(self, usage: Optional[Dict[str, Any]]):
+        """Record token usage reported by the API.
+
+        Args:
+            usage: `usage` object from the response, if any
+        """
+        self.last_usage = usage or {}
+        self.total_prompt_tokens += int(self.last_usage.get("prompt_tokens") or 0)
+        self.total_cached_tokens += self.compiler.cached_tokens(self.last_usage)
+
+    def _meter_usage(self, usage: Optional[Dict[str, Any]]):
+        """Add a response's token usage to the caller's metered_usage() block.
+
+        Args:
+            usage: `usage` object from the response, if any
+        """
+        meter = _current_usage.get()
+        if meter is not None and usage:
+            meter.prompt_tokens += int(usage.get("prompt_tokens") or 0)
+            meter.cached_tokens += self.compiler.cached_tokens(usage)
+
+    async def warm_up(self):
+        """Open a pooled connection to the API ahead of the first request.
+
+        Errors are ignored; the request path will surface them if they persist.
+        """
+        try:
+            await self.client.head(self.base_url)
+        except httpx.HTTPError:
+            pass
+
+    async def close(self):
+        """Close the HTTP client."""
+        await self.client.aclose()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
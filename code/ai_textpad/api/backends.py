@@ -0,0 +1,140 @@
+"""Registry of chat backends, selected per transformation by frontmatter."""
+
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from ..storage.database import ConfigDatabase
+from ..transforms.routing import DEFAULT_BACKEND, resolve_backend, resolve_request_options
+from .backend import ChatBackend
+from .local import LocalBackend
+from .model_registry import AUTO_MODEL, ModelRegistry
+from .openrouter import OpenRouterClient
+
+BACKEND_CLASSES: Dict[str, Type[ChatBackend]] = {
+    OpenRouterClient.name: OpenRouterClient,
+    LocalBackend.name: LocalBackend,
+}
+
+DEFAULT_LOCAL_MODEL = "local"
+
+
+def backend_settings(db: ConfigDatabase, name: str) -> Dict[str, Any]:
+    """Read a backend's connection settings.
+
+    Args:
+        db: Database instance
+        name: Backend name
+
+    Returns:
+        Dictionary with api_key, model and base_url
+    """
+    if name == LocalBackend.name:
+        return {
+            "api_key": db.get_config("local_backend_api_key", ""),
+            "model": db.get_config("local_backend_model") or DEFAULT_LOCAL_MODEL,
+            "base_url": db.get_config("local_backend_url") or LocalBackend.BASE_URL,
+        }
+    return {
+        "api_key": db.get_config("openrouter_api_key", ""),
+        "model": db.get_config("model", "openai/gpt-4o-mini"),
+        "base_url": OpenRouterClient.BASE_URL,
+    }
+
+
+class BackendRegistry:
+    """Creates one client (and connection pool) per backend on first use.
+
+    Settings are re-read on every lookup, so saving the settings dialog
+    takes effect without dropping pooled connections. The "auto:fastest"
+    model setting is resolved on every lookup too, to the best performing
+    candidate measured by ``models``.
+    """
+
+    def __init__(self, db: ConfigDatabase):
+        """Initialize backend registry.
+
+        Args:
+            db: Database instance holding backend settings
+        """
+        self.db = db
+        self.clients: Dict[str, ChatBackend] = {}
+        self.models = ModelRegistry(db)
+
+    def get(self, name: str = DEFAULT_BACKEND) -> ChatBackend:
+        """Get the client for a backend, creating it on first use.
+
+        Unknown names fall back to the default backend with a warning.
+
+        Args:
+            name: Backend name
+
+        Returns:
+            Backend client
+        """
+        if name not in BACKEND_CLASSES:
+            print(f"Unknown backend '{name}', using {DEFAULT_BACKEND}")
+            name = DEFAULT_BACKEND
+
+        settings = backend_settings(self.db, name)
+        if settings["model"] == AUTO_MODEL:
+            settings["model"] = self.models.fastest()
+        client = self.clients.get(name)
+        if client is None:
+            client = BACKEND_CLASSES[name](
+                settings["api_key"], settings["model"], settings["base_url"]
+            )
+            client.observer = self.models.record
+            self.clients[name] = client
+        else:
+            client.api_key = settings["api_key"]
+            client.model = settings["model"]
+            client.base_url = settings["base_url"].rstrip("/")
+        return client
+
+    def route(self, metadata_list: List[Dict[str, Any]],
+              model: Optional[str] = None) -> Tuple[ChatBackend, Dict[str, Any]]:
+        """Pick the backend and request options for a set of transformations.
+
+        Args:
+            metadata_list: Frontmatter metadata of each selected transformation
+            model: Explicit model override
+
+        Returns:
+            Tuple of (backend client, transform_text keyword options)
+        """
+        client = self.get(resolve_backend(metadata_list))
+        options = resolve_request_options(metadata_list, client.model)
+        if model:
+            options["model"] = model
+        return client, options
+
+    def step_options(self, metadata_list: List[Dict[str, Any]],
+                     model: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Build per-step routing for TransformPipeline.
+
+        Args:
+            metadata_list: Frontmatter metadata of each step
+            model: Explicit model override for every step
+
+        Returns:
+            One options dictionary per step, each including its backend name
+        """
+        steps = []
+        for metadata in metadata_list:
+            client, options = self.route([metadata], model)
+            options["backend"] = client.name
+            steps.append(options)
+        return steps
+
+    async def warm_up(self):
+        """Open a connection to every backend that is configured."""
+        client = self.get()
+        if client.api_key:
+            await client.warm_up()
+        if self.db.get_config("local_backend_url"):
+            await self.get(LocalBackend.name).warm_up()
+
+    async def close(self):
+        """Close every client's connection pool."""
+        clients, self.clients = self.clients, {}
+        for client in clients.values():
+            await client.close()
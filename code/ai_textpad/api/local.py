@@ -0,0 +1,23 @@
+"""Client for a local OpenAI-compatible server (llama.cpp server, vLLM...)."""
+
+from .backend import BackendCapabilities, ChatBackend
+
+
+class LocalBackend(ChatBackend):
+    """Client for a self-hosted OpenAI-compatible endpoint.
+
+    No API key is required. CPU-hosted models are slow and serve few
+    requests in parallel, so the timeout is longer and the connection pool
+    small; extra requests wait for a connection instead of piling up on
+    the server.
+    """
+
+    name = "local"
+
+    BASE_URL = "http://127.0.0.1:8080/v1"
+
+    capabilities = BackendCapabilities(streaming=True, json_mode=True, prompt_caching=False)
+
+    TIMEOUT = 300.0
+
+    MAX_CONNECTIONS = 4
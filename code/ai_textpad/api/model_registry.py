@@ -0,0 +1,251 @@
+"""Model catalog (cached /models metadata) and measured model performance."""
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+import httpx
+
+from .backend import ChatBackend
+
+# Model setting that picks the fastest candidate for each request
+AUTO_MODEL = "auto:fastest"
+
+# Used by AUTO_MODEL before any candidate has been measured
+FALLBACK_MODEL = "openai/gpt-4o-mini"
+
+# Models AUTO_MODEL chooses between unless "auto_model_candidates" is set
+DEFAULT_CANDIDATES = [
+    "openai/gpt-4o-mini",
+    "google/gemini-2.5-flash-lite",
+    "x-ai/grok-4-fast",
+]
+
+# Config key holding the cached /models response
+CATALOG_KEY = "model_catalog"
+
+# Seconds before the cached catalog is fetched again
+CATALOG_TTL = 24 * 3600.0
+
+# Measurements kept per model (rolling window)
+WINDOW = 10
+
+# Seconds between probes of a model that has no newer measurement
+PROBE_INTERVAL = 300.0
+
+# Probe request: a short, cheap completion
+PROBE_PROMPT = "Repeat the text exactly."
+PROBE_TEXT = "The quick brown fox jumps over the lazy dog."
+PROBE_MAX_TOKENS = 32
+
+# Response length models are ranked for (latency + generation time)
+REFERENCE_TOKENS = 400
+
+# (measured at, time to first token, tokens per second); failures have an
+# infinite time to first token
+Sample = Tuple[float, float, float]
+
+
+class ModelRegistry:
+    """Tracks which models exist and how fast each is currently performing.
+
+    The provider's /models metadata (context length, pricing) is cached in
+    the config table for CATALOG_TTL. Each model keeps its last WINDOW
+    measurements, from background probes and from streamed requests, and
+    ``fastest()`` ranks the candidates by median time to first token plus
+    the time to generate REFERENCE_TOKENS at their median throughput.
+    """
+
+    def __init__(self, db):
+        """Initialize model registry.
+
+        Args:
+            db: Database instance holding the catalog cache and settings
+        """
+        self.db = db
+        self.samples: Dict[str, Deque[Sample]] = {}
+
+    # --- Catalog -------------------------------------------------------------
+
+    def catalog(self) -> List[Dict[str, Any]]:
+        """Get the cached model catalog, however old.
+
+        Returns:
+            Model dictionaries with id, context_length and pricing
+        """
+        return (self.db.get_config(CATALOG_KEY) or {}).get("models", [])
+
+    def catalog_stale(self) -> bool:
+        """Whether the cached catalog is missing or older than CATALOG_TTL."""
+        fetched_at = (self.db.get_config(CATALOG_KEY) or {}).get("fetched_at", 0)
+        return time.time() - fetched_at > CATALOG_TTL
+
+    async def refresh_catalog(self, client: ChatBackend,
+                              force: bool = False) -> List[Dict[str, Any]]:
+        """Fetch the provider's model list if the cached copy is stale.
+
+        Args:
+            client: Backend whose /models endpoint is queried
+            force: Fetch even if the cache is fresh
+
+        Returns:
+            Model dictionaries with id, context_length and pricing
+
+        Raises:
+            httpx.HTTPError: If the request fails
+        """
+        if not force and not self.catalog_stale():
+            return self.catalog()
+
+        response = await client.client.get(
+            f"{client.base_url}/models", headers=client._headers()
+        )
+        response.raise_for_status()
+
+        models = []
+        for entry in response.json().get("data", []):
+            pricing = entry.get("pricing") or {}
+            models.append({
+                "id": entry["id"],
+                "context_length": entry.get("context_length"),
+                "pricing": {
+                    "prompt": pricing.get("prompt"),
+                    "completion": pricing.get("completion"),
+                },
+            })
+        self.db.set_config(CATALOG_KEY, {"fetched_at": time.time(), "models": models})
+        return models
+
+    def describe(self, model: str) -> str:
+        """Summarize a model's catalog entry and measured speed for display.
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            Description, empty if nothing is known about the model
+        """
+        parts = []
+        entry = next((m for m in self.catalog() if m["id"] == model), None)
+        if entry:
+            if entry.get("context_length"):
+                parts.append(f"{entry['context_length'] // 1000}k context")
+            prices = [entry["pricing"].get("prompt"), entry["pricing"].get("completion")]
+            if all(price is not None for price in prices):
+                per_million = "/".join(f"${float(price) * 1e6:.2f}" for price in prices)
+                parts.append(f"{per_million} per M tokens (prompt/completion)")
+        estimate = self.estimated_seconds(model)
+        if estimate is not None:
+            parts.append(
+                "failing" if estimate == float("inf") else f"~{estimate:.1f}s per response"
+            )
+        return ", ".join(parts)
+
+    # --- Performance ---------------------------------------------------------
+
+    def record(self, model: str, ttft: Optional[float], tokens_per_second: float = 0.0):
+        """Record a measured request.
+
+        Args:
+            model: Model identifier
+            ttft: Seconds to the first output token (None if the request failed)
+            tokens_per_second: Generation rate (0 if it could not be measured)
+        """
+        window = self.samples.setdefault(model, deque(maxlen=WINDOW))
+        window.append((time.time(), float("inf") if ttft is None else ttft, tokens_per_second))
+
+    def estimated_seconds(self, model: str) -> Optional[float]:
+        """Estimate how long a model currently takes for a typical response.
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            Estimated seconds (infinite if most requests fail), or None if
+            the model has not been measured
+        """
+        window = self.samples.get(model)
+        if not window:
+            return None
+        latency = statistics.median(ttft for _, ttft, _ in window)
+        rates = [rate for _, ttft, rate in window if rate > 0 and ttft != float("inf")]
+        if rates:
+            latency += REFERENCE_TOKENS / statistics.median(rates)
+        return latency
+
+    def candidates(self) -> List[str]:
+        """Get the models AUTO_MODEL chooses between.
+
+        Candidates missing from the cached catalog are left out, since the
+        provider no longer serves them.
+
+        Returns:
+            Model identifiers
+        """
+        candidates = self.db.get_config("auto_model_candidates") or DEFAULT_CANDIDATES
+        available = {m["id"] for m in self.catalog()}
+        if available:
+            candidates = [model for model in candidates if model in available] or candidates
+        return list(candidates)
+
+    def fastest(self) -> str:
+        """Pick the best currently performing candidate.
+
+        Returns:
+            Model identifier (the first candidate if none has been measured)
+        """
+        candidates = self.candidates()
+        measured = [
+            (estimate, model) for model in candidates
+            for estimate in [self.estimated_seconds(model)] if estimate is not None
+        ]
+        if measured:
+            return min(measured)[1]
+        return candidates[0] if candidates else FALLBACK_MODEL
+
+    # --- Probing -------------------------------------------------------------
+
+    def probe_due(self, model: str) -> bool:
+        """Whether a model has no measurement from the last PROBE_INTERVAL."""
+        window = self.samples.get(model)
+        return not window or time.time() - window[-1][0] > PROBE_INTERVAL
+
+    async def probe(self, client: ChatBackend, model: str):
+        """Measure a model with a short streamed request.
+
+        The client's observer records the result; errors are not raised.
+
+        Args:
+            client: Backend to send the probe through
+            model: Model identifier
+        """
+        try:
+            async for _ in client.stream_text(
+                PROBE_TEXT, [PROBE_PROMPT], model=model, max_tokens=PROBE_MAX_TOKENS
+            ):
+                pass
+        except (httpx.HTTPError, ValueError) as e:
+            print(f"Probe of {model} failed: {e}")
+
+    async def run_probes(self, get_client: Callable[[], ChatBackend]):
+        """Keep candidate measurements fresh while AUTO_MODEL is selected.
+
+        Probes run one at a time and only for candidates that real traffic
+        has not measured recently. Runs until cancelled.
+
+        Args:
+            get_client: Returns the backend to probe through
+        """
+        while True:
+            if self.db.get_config("model") == AUTO_MODEL:
+                client = get_client()
+                try:
+                    await self.refresh_catalog(client)
+                except httpx.HTTPError as e:
+                    print(f"Model catalog refresh failed: {e}")
+                for model in self.candidates():
+                    if self.probe_due(model):
+                        await self.probe(client, model)
+            await asyncio.sleep(PROBE_INTERVAL / 5)
@@ -0,0 +1,160 @@
+"""Stable prompt assembly for provider-side prompt caching."""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from ..transforms.templates import compile_template
+
+
+class PromptCompiler:
+    """Builds chat messages whose prefixes stay byte-identical between calls.
+
+    Providers cache prompts by exact prefix, so the system message holds
+    only the transformation instructions, with the user details each one
+    refers to filled into its placeholders (see transforms.templates), and
+    the user's text always comes last. A prompt that refers to no details
+    is byte-identical whatever the settings. Compiled system prompts are
+    memoized per transformation set and referenced detail values, so
+    saving settings only invalidates the prompts that use what changed.
+    """
+
+    # Model prefixes that need explicit cache_control breakpoints.
+    # Other providers (OpenAI, DeepSeek, Grok...) cache prefixes automatically.
+    CACHE_HINT_PREFIXES = ("anthropic/", "google/gemini")
+
+    MULTI_EDIT_HEADER = "Please apply the following list of edits to the text:"
+
+    CONTEXT_HEADER = (
+        "The text is an excerpt. For reference only, it follows this passage "
+        "(do not include the passage in your output):"
+    )
+
+    def __init__(self, max_entries: int = 128):
+        """Initialize prompt compiler.
+
+        Args:
+            max_entries: Maximum number of memoized system prompts
+        """
+        self.max_entries = max_entries
+        self._system_prompts: Dict[Tuple, str] = {}
+
+    def compile_system_prompt(
+        self,
+        transformations: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        output_instructions: Optional[str] = None
+    ) -> str:
+        """Compile (or fetch memoized) system prompt.
+
+        Args:
+            transformations: List of transformation prompts, in order
+            user_details: Optional user details for the prompts' placeholders
+            output_instructions: Optional response format instructions,
+                placed after the transformation instructions
+
+        Returns:
+            System prompt text
+        """
+        templates = [compile_template(t) for t in transformations]
+        referenced: Dict[str, str] = {}
+        for template in templates:
+            referenced.update(template.referenced(user_details))
+        key = (tuple(transformations), tuple(sorted(referenced.items())), output_instructions)
+
+        cached = self._system_prompts.get(key)
+        if cached is not None:
+            return cached
+
+        system_parts = []
+
+        # Transformation instructions, with referenced user details filled in
+        rendered = [template.render(referenced) for template in templates]
+        if len(rendered) == 1:
+            system_parts.append(rendered[0])
+        else:
+            system_parts.append(self.MULTI_EDIT_HEADER)
+            system_parts.append("\n\n---\n\n".join(rendered))
+
+        if output_instructions:
+            system_parts.append(output_instructions)
+
+        system_prompt = "\n\n".join(system_parts)
+
+        if len(self._system_prompts) >= self.max_entries:
+            # Drop the oldest entry (dicts keep insertion order)
+            self._system_prompts.pop(next(iter(self._system_prompts)))
+        self._system_prompts[key] = system_prompt
+
+        return system_prompt
+
+    def supports_cache_hints(self, model: str) -> bool:
+        """Check whether a model needs explicit cache breakpoints.
+
+        Args:
+            model: Model identifier
+
+        Returns:
+            True if cache_control hints should be emitted
+        """
+        return model.startswith(self.CACHE_HINT_PREFIXES)
+
+    def build_messages(
+        self,
+        model: str,
+        text: str,
+        transformations: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        cache_hints: bool = True,
+        context: Optional[str] = None,
+        output_instructions: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Build the chat messages for a transformation request.
+
+        Args:
+            model: Model identifier
+            text: Text to transform
+            transformations: List of transformation prompts
+            user_details: Optional user details to inject
+            cache_hints: Whether the backend honours cache_control hints
+            context: Optional surrounding text, sent after the cacheable
+                system prompt so the prefix stays stable
+            output_instructions: Optional response format instructions
+
+        Returns:
+            List of chat messages
+        """
+        system_prompt = self.compile_system_prompt(
+            transformations, user_details, output_instructions
+        )
+
+        if cache_hints and self.supports_cache_hints(model):
+            system_content: Any = [{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
+        else:
+            system_content = system_prompt
+
+        messages = [{"role": "system", "content": system_content}]
+        if context:
+            messages.append({
+                "role": "system",
+                "content": f"{self.CONTEXT_HEADER}\n\n{context}",
+            })
+        messages.append({"role": "user", "content": text})
+        return messages
+
+    @staticmethod
+    def cached_tokens(usage: Optional[Dict[str, Any]]) -> int:
+        """Extract the number of prompt tokens served from cache.
+
+        Args:
+            usage: `usage` object from a chat completion response
+
+        Returns:
+            Number of cached prompt tokens (0 if not reported)
+        """
+        if not usage:
+            return 0
+        details = usage.get("prompt_tokens_details") or {}
+        return int(details.get("cached_tokens") or usage.get("cache_read_input_tokens") or 0)
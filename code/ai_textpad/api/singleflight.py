@@ -0,0 +1,86 @@
+"""Single-flight coalescing of identical concurrent requests."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """Shares one in-flight call between concurrent callers with the same key.
+
+    The first caller for a key starts the call as a task; callers arriving
+    while it is still running await the same task instead of issuing their
+    own request. The task is shielded, so one caller being cancelled does
+    not cancel the call for the others, but it is cancelled once every
+    caller waiting on it has been.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._waiters: Dict[str, int] = {}
+        self.calls_made = 0
+        self.calls_saved = 0
+        self.calls_cancelled = 0
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run call, or join an identical call that is already in flight.
+
+        Args:
+            key: Request fingerprint
+            call: Zero-argument coroutine factory performing the request
+
+        Returns:
+            Result of the (possibly shared) call
+        """
+        task = self._inflight.get(key)
+
+        if task is None:
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            self.calls_made += 1
+            task.add_done_callback(lambda _: self._forget(key, task))
+        else:
+            self.calls_saved += 1
+
+        self._waiters[key] = self._waiters.get(key, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            # Nobody is left to use the result: stop the request
+            if self._waiters[key] == 1 and not task.done():
+                task.cancel()
+                self.calls_cancelled += 1
+            raise
+        finally:
+            self._waiters[key] -= 1
+            if not self._waiters[key]:
+                del self._waiters[key]
+
+    def _forget(self, key: str, task: asyncio.Task):
+        """Drop a finished task from the in-flight table."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Mark the exception as retrieved if every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Get the number of distinct calls currently in flight.
+
+        Returns:
+            Number of in-flight calls
+        """
+        return len(self._inflight)
+
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing counters.
+
+        Returns:
+            Dictionary with calls_made, calls_saved, calls_cancelled and in_flight
+        """
+        return {
+            "calls_made": self.calls_made,
+            "calls_saved": self.calls_saved,
+            "calls_cancelled": self.calls_cancelled,
+            "in_flight": self.in_flight(),
+        }
@@ -0,0 +1,111 @@
+"""Thin command-line client for the AI-Textpad daemon.
+
+Reads text from stdin, sends it to the running daemon and writes the result
+to stdout. Only the standard library is imported, so startup is near-instant:
+
+    echo "some text" | ai-textpad-cli -t "Basic Text Fixes"
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+
+def _default_socket_path() -> Path:
+    """Get the daemon socket path without importing the daemon module."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and Path(runtime_dir).is_dir():
+        return Path(runtime_dir) / "ai-textpad.sock"
+    return Path.home() / ".config" / "ai-textpad" / "daemon.sock"
+
+
+def send_request(request: Dict[str, Any], socket_path: Path) -> Dict[str, Any]:
+    """Send a single request to the daemon.
+
+    Args:
+        request: Request object
+        socket_path: Daemon Unix socket path
+
+    Returns:
+        Response object
+
+    Raises:
+        ConnectionError: If the daemon is not running
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(
+                f"AI-Textpad daemon is not running at {socket_path} "
+                "(start it with: ai-textpad-daemon)"
+            ) from e
+
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+
+        chunks = []
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            if chunk.endswith(b"\n"):
+                break
+
+    return json.loads(b"".join(chunks))
+
+
+def main():
+    """CLI entry point."""
+    parser = argparse.ArgumentParser(description="Transform stdin via the AI-Textpad daemon")
+    parser.add_argument("-t", "--transform", action="append", default=[],
+                        help="Transformation name or ID (repeat to apply several)")
+    parser.add_argument("-m", "--model", help="Model override")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="Apply transformations one at a time with step caching")
+    parser.add_argument("--list", action="store_true", help="List available transformations")
+    parser.add_argument("--reload", action="store_true",
+                        help="Ask the daemon to reload settings and catalog")
+    parser.add_argument("--socket", type=Path, default=None, help="Daemon socket path")
+    args = parser.parse_args()
+
+    socket_path = args.socket or _default_socket_path()
+
+    if args.list:
+        request = {"op": "list"}
+    elif args.reload:
+        request = {"op": "reload"}
+    else:
+        if not args.transform:
+            parser.error("at least one --transform is required")
+        request = {
+            "op": "transform",
+            "text": sys.stdin.read(),
+            "transformations": args.transform,
+            "model": args.model,
+            "pipeline": args.pipeline,
+        }
+
+    try:
+        response = send_request(request, socket_path)
+    except ConnectionError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(2)
+
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}", file=sys.stderr)
+        sys.exit(1)
+
+    if args.list:
+        for trans in response["transformations"]:
+            print(f"{trans['id']}\t{trans['category']}\t{trans['name']}")
+    elif "text" in response:
+        sys.stdout.write(response["text"])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Headless resident daemon serving transforms over a Unix socket.
+
+The daemon keeps the transformation catalog, settings and warm backend
+clients (see ``ai_textpad.api.backends``) in memory, so clients (see
+``ai_textpad.cli``) pay no startup cost. The protocol is one JSON object
+per line in each direction.
+
+Requests:
+    {"op": "ping"}
+    {"op": "list"}
+    {"op": "reload"}
+    {"op": "transform", "text": "...", "transformations": ["Basic Text Fixes"],
+     "model": "optional/model", "pipeline": false}
+
+Responses:
+    {"ok": true, ...}  or  {"ok": false, "error": "..."}
+"""
+
+import argparse
+import asyncio
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .api.backends import BackendRegistry
+from .api.openrouter import OpenRouterClient
+from .storage.database import ConfigDatabase, default_config_dir
+from .transforms.loader import load_default_transformations
+from .transforms.pipeline import TransformPipeline
+from .transforms.templates import referenced_details
+
+# Allow multi-megabyte documents on a single protocol line
+STREAM_LIMIT = 64 * 1024 * 1024
+
+
+def default_socket_path() -> Path:
+    """Get the default daemon socket path.
+
+    Uses $XDG_RUNTIME_DIR when available, otherwise the config directory.
+
+    Returns:
+        Path to Unix socket
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and Path(runtime_dir).is_dir():
+        return Path(runtime_dir) / "ai-textpad.sock"
+    return default_config_dir() / "daemon.sock"
+
+
+class TransformDaemon:
+    """Resident transform server."""
+
+    def __init__(self, db: ConfigDatabase, socket_path: Optional[Path] = None):
+        """Initialize daemon.
+
+        Args:
+            db: Database instance
+            socket_path: Unix socket path (defaults to default_socket_path())
+        """
+        self.db = db
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.catalog: Dict[str, dict] = {}
+        self.backends = BackendRegistry(db)
+        self.requests_served = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    def reload(self):
+        """Reload catalog and settings from the database."""
+        load_default_transformations(self.db)
+        self.catalog = {}
+        for trans in self.db.get_transformations():
+            self.catalog[trans['name'].lower()] = trans
+            self.catalog[str(trans['id'])] = trans
+
+        # Keep the pooled connections, just refresh credentials/model
+        self.backends.get()
+
+    def _resolve(self, names: List[str]) -> List[dict]:
+        """Resolve transformation names or IDs to catalog entries.
+
+        Args:
+            names: Transformation names (case-insensitive) or IDs
+
+        Returns:
+            List of transformation dictionaries
+
+        Raises:
+            KeyError: If a transformation is unknown
+        """
+        resolved = []
+        for name in names:
+            trans = self.catalog.get(str(name).lower())
+            if trans is None:
+                raise KeyError(f"Unknown transformation: {name}")
+            resolved.append(trans)
+        return resolved
+
+    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle a single protocol request.
+
+        Args:
+            request: Decoded request object
+
+        Returns:
+            Response object
+        """
+        op = request.get("op")
+
+        if op == "ping":
+            return {
+                "ok": True,
+                "requests_served": self.requests_served,
+                "coalescing": self.backends.get().flights.stats(),
+            }
+
+        if op == "list":
+            seen = set()
+            items = []
+            for trans in self.catalog.values():
+                if trans['id'] in seen:
+                    continue
+                seen.add(trans['id'])
+                items.append({"id": trans['id'], "name": trans['name'],
+                              "category": trans['category']})
+            return {"ok": True, "transformations": items}
+
+        if op == "reload":
+            self.reload()
+            return {"ok": True}
+
+        if op == "transform":
+            text = request.get("text", "")
+            selected = self._resolve(request.get("transformations", []))
+            if not selected:
+                return {"ok": False, "error": "No transformations given"}
+
+            prompts = [t['prompt'] for t in selected]
+            metadata = [t['metadata'] for t in selected]
+            user_details = referenced_details(prompts, self.db.get_all_user_details()) or None
+            # An explicit model in the request overrides frontmatter routing
+            model = request.get("model")
+
+            # Frontmatter picks the backend per transformation (or per step)
+            pipeline_mode = request.get("pipeline") and len(prompts) > 1
+            if pipeline_mode:
+                step_options = self.backends.step_options(metadata, model)
+                backends = {options["backend"] for options in step_options}
+            else:
+                client, options = self.backends.route(metadata, model)
+                backends = {client.name}
+            if OpenRouterClient.name in backends and not self.backends.get().api_key:
+                return {"ok": False, "error": "OpenRouter API key is not configured"}
+
+            if pipeline_mode:
+                pipeline = TransformPipeline(self.backends.get(), self.db, self.backends)
+                outputs = await pipeline.run(
+                    text, prompts, user_details, step_options=step_options
+                )
+                result = outputs[-1]
+            else:
+                result = await client.transform_text(
+                    text, prompts, user_details, **options
+                )
+
+            self.requests_served += 1
+            return {"ok": True, "text": result}
+
+        return {"ok": False, "error": f"Unknown op: {op}"}
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """Serve requests on one client connection."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    response = await self.handle_request(json.loads(line))
+                except Exception as e:
+                    response = {"ok": False, "error": str(e)}
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve_forever(self):
+        """Start listening and serve until cancelled."""
+        self.reload()
+
+        if self.socket_path.exists():
+            self.socket_path.unlink()
+
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path=str(self.socket_path), limit=STREAM_LIMIT
+        )
+        os.chmod(self.socket_path, 0o600)
+        print(f"AI-Textpad daemon listening on {self.socket_path}")
+
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.backends.close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+
+def main():
+    """Daemon entry point."""
+    parser = argparse.ArgumentParser(description="AI-Textpad resident transform daemon")
+    parser.add_argument("--socket", type=Path, default=None,
+                        help="Unix socket path (default: $XDG_RUNTIME_DIR/ai-textpad.sock)")
+    args = parser.parse_args()
+
+    db = ConfigDatabase()
+    daemon = TransformDaemon(db, args.socket)
+    try:
+        asyncio.run(daemon.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Developer tools: local mock API server and load-test harness."""
@@ -0,0 +1,197 @@
+"""Concurrency load test for OpenRouterClient.
+
+Drives the client at increasing concurrency levels against a local mock
+server (started in-process by default) or any OpenAI-compatible base URL,
+and reports throughput, latency percentiles and error rates per level:
+
+    python -m ai_textpad.devtools.loadtest --concurrency 1,4,16,64 --requests 200 \\
+        --latency lognormal:-2,0.5 --tokens-per-second 200 --errors 429:0.02
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+import httpx
+
+from ..api.openrouter import OpenRouterClient
+from .mock_server import MockOpenRouterServer
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of values.
+
+    Args:
+        values: Sample values
+        fraction: Percentile as a fraction (0.99 = p99)
+
+    Returns:
+        Percentile value (0.0 for an empty list)
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+async def run_level(
+    client: OpenRouterClient,
+    concurrency: int,
+    requests: int,
+    text_size: int = 2000
+) -> Dict[str, Any]:
+    """Run one load level with a fixed number of concurrent workers.
+
+    Every request carries a distinct document so single-flight coalescing
+    does not hide load.
+
+    Args:
+        client: Client under test
+        concurrency: Number of concurrent workers
+        requests: Total requests to send
+        text_size: Approximate document size in characters
+
+    Returns:
+        Dictionary with throughput, latency percentiles and error counts
+    """
+    latencies: List[float] = []
+    errors: Counter = Counter()
+    queue: asyncio.Queue = asyncio.Queue()
+    filler = "lorem ipsum dolor sit amet " * (text_size // 27 + 1)
+    for i in range(requests):
+        queue.put_nowait(f"Request {i}: {filler[:text_size]}")
+
+    async def worker():
+        while True:
+            try:
+                text = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            try:
+                await client.transform_text(text, ["Fix punctuation."])
+                latencies.append(time.perf_counter() - start)
+            except httpx.HTTPStatusError as e:
+                errors[str(e.response.status_code)] += 1
+            except httpx.HTTPError as e:
+                errors[type(e).__name__] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - start
+
+    failed = sum(errors.values())
+    return {
+        "concurrency": concurrency,
+        "requests": requests,
+        "elapsed": elapsed,
+        "throughput": len(latencies) / elapsed if elapsed else 0.0,
+        "p50": percentile(latencies, 0.50),
+        "p90": percentile(latencies, 0.90),
+        "p99": percentile(latencies, 0.99),
+        "max": max(latencies, default=0.0),
+        "error_rate": failed / requests if requests else 0.0,
+        "errors": dict(errors),
+    }
+
+
+async def run_load_test(
+    levels: List[int],
+    requests: int,
+    base_url: Optional[str] = None,
+    api_key: str = "load-test",
+    model: str = "openai/gpt-4o-mini",
+    text_size: int = 2000,
+    server_options: Optional[Dict[str, Any]] = None,
+    on_level=None
+) -> List[Dict[str, Any]]:
+    """Run the load test over several concurrency levels.
+
+    Args:
+        levels: Concurrency levels, run in order
+        requests: Requests per level
+        base_url: Target base URL (default: start an in-process mock server)
+        api_key: API key sent to the target
+        model: Model identifier
+        text_size: Approximate document size in characters
+        server_options: Keyword arguments for MockOpenRouterServer
+        on_level: Optional callback receiving each level's result
+
+    Returns:
+        List of per-level results
+    """
+    server = None
+    if base_url is None:
+        server = MockOpenRouterServer(**(server_options or {}))
+        await server.start()
+        base_url = server.base_url
+
+    results = []
+    try:
+        async with OpenRouterClient(api_key, model, base_url=base_url) as client:
+            for level in levels:
+                result = await run_level(client, level, requests, text_size)
+                results.append(result)
+                if on_level:
+                    on_level(result)
+    finally:
+        if server:
+            await server.stop()
+    return results
+
+
+def _print_result(result: Dict[str, Any]):
+    """Print one result row."""
+    errors = ", ".join(f"{k}x{v}" for k, v in sorted(result["errors"].items())) or "-"
+    print(f"{result['concurrency']:>6d} {result['throughput']:>10.1f} "
+          f"{result['p50'] * 1000:>9.1f} {result['p90'] * 1000:>9.1f} "
+          f"{result['p99'] * 1000:>9.1f} {result['error_rate']:>7.1%}  {errors}")
+
+
+def main():
+    """Load test entry point."""
+    parser = argparse.ArgumentParser(description="Load-test OpenRouterClient")
+    parser.add_argument("--concurrency", default="1,2,4,8,16,32,64",
+                        help="Comma-separated concurrency levels")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per level")
+    parser.add_argument("--text-size", type=int, default=2000, help="Document size in characters")
+    parser.add_argument("--base-url", default=None,
+                        help="Target base URL (default: in-process mock server)")
+    parser.add_argument("--api-key", default="load-test")
+    parser.add_argument("--model", default="openai/gpt-4o-mini")
+    parser.add_argument("--latency", default="lognormal:-2.5,0.5",
+                        help="Mock server latency distribution (see mock_server --help)")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0,
+                        help="Mock server generation speed (0 = instant)")
+    parser.add_argument("--errors", default="", help="Mock server error injection, e.g. 429:0.05")
+    parser.add_argument("--seed", type=int, default=0, help="Mock server random seed")
+    parser.add_argument("--json", dest="json_path", default=None,
+                        help="Also write results to this JSON file")
+    args = parser.parse_args()
+
+    levels = [int(level) for level in args.concurrency.split(",") if level]
+    server_options = {
+        "latency": args.latency,
+        "tokens_per_second": args.tokens_per_second,
+        "errors": args.errors,
+        "seed": args.seed,
+    }
+
+    print(f"{'conc':>6s} {'req/s':>10s} {'p50 ms':>9s} {'p90 ms':>9s} "
+          f"{'p99 ms':>9s} {'errors':>7s}")
+    results = asyncio.run(run_load_test(
+        levels, args.requests, args.base_url, args.api_key, args.model,
+        args.text_size, server_options, on_level=_print_result
+    ))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
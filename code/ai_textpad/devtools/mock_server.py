@@ -0,0 +1,359 @@
+"""Local OpenAI-compatible stand-in for the OpenRouter API.
+
+Serves ``POST /api/v1/chat/completions`` (plain JSON or SSE streaming) and
+``GET /api/v1/models`` on localhost, with configurable latency, token rate
+and injected errors, so the client can be load-tested without network
+access or cost:
+
+    python -m ai_textpad.devtools.mock_server --port 8765 \\
+        --latency lognormal:-1.5,0.5 --tokens-per-second 120 --errors 429:0.05,503:0.01
+
+Point the client at it with ``OpenRouterClient(..., base_url=server.base_url)``.
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+MOCK_MODELS = [
+    {"id": "openai/gpt-4o-mini", "context_length": 128000,
+     "pricing": {"prompt": "0.00000015", "completion": "0.0000006"}},
+    {"id": "google/gemini-2.5-flash-lite", "context_length": 1048576,
+     "pricing": {"prompt": "0.0000001", "completion": "0.0000004"}},
+    {"id": "x-ai/grok-4-fast", "context_length": 2000000,
+     "pricing": {"prompt": "0.0000002", "completion": "0.0000005"}},
+]
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 429: "Too Many Requests",
+           500: "Internal Server Error", 502: "Bad Gateway", 503: "Service Unavailable"}
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """Parse a latency distribution spec into a sampler (seconds).
+
+    Supported specs: ``fixed:S``, ``uniform:LO,HI``, ``normal:MU,SIGMA``,
+    ``lognormal:MU,SIGMA`` (of the underlying normal) and ``exponential:MEAN``.
+
+    Args:
+        spec: Distribution spec
+
+    Returns:
+        Function sampling a non-negative delay from a Random instance
+
+    Raises:
+        ValueError: If the spec is invalid
+    """
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",")] if args else []
+
+    samplers = {
+        "fixed": (1, lambda rng, v: v[0]),
+        "uniform": (2, lambda rng, v: rng.uniform(v[0], v[1])),
+        "normal": (2, lambda rng, v: rng.gauss(v[0], v[1])),
+        "lognormal": (2, lambda rng, v: rng.lognormvariate(v[0], v[1])),
+        "exponential": (1, lambda rng, v: rng.expovariate(1.0 / v[0])),
+    }
+    if kind not in samplers or len(values) != samplers[kind][0]:
+        raise ValueError(f"Invalid latency spec: {spec}")
+
+    sampler = samplers[kind][1]
+    return lambda rng: max(0.0, sampler(rng, values))
+
+
+def parse_errors(spec: str) -> List[Tuple[int, float]]:
+    """Parse an error injection spec like ``429:0.05,503:0.01``.
+
+    Args:
+        spec: Comma-separated status:probability pairs
+
+    Returns:
+        List of (status, probability) tuples
+    """
+    errors = []
+    for part in filter(None, spec.split(",")):
+        status, _, probability = part.partition(":")
+        errors.append((int(status), float(probability)))
+    return errors
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count (about four characters per token)."""
+    return max(1, math.ceil(len(text) / 4))
+
+
+class MockOpenRouterServer:
+    """asyncio HTTP/1.1 server imitating the chat completions API."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "fixed:0",
+        tokens_per_second: float = 0.0,
+        errors: str = "",
+        seed: Optional[int] = None
+    ):
+        """Initialize mock server.
+
+        Args:
+            host: Bind address
+            port: Bind port (0 picks a free port)
+            latency: Time-to-first-token distribution spec (see parse_latency)
+            tokens_per_second: Simulated generation rate (0 = instant)
+            errors: Error injection spec (see parse_errors)
+            seed: Random seed for reproducible runs
+        """
+        self.host = host
+        self.port = port
+        self.sample_latency = parse_latency(latency)
+        self.tokens_per_second = tokens_per_second
+        self.errors = parse_errors(errors)
+        self.rng = random.Random(seed)
+
+        self.stats: Dict[str, int] = {"requests": 0, "streamed": 0, "errors": 0}
+        self._prefix_cache: Set[str] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._handlers: Set[asyncio.Task] = set()
+
+    @property
+    def base_url(self) -> str:
+        """Base URL to pass to OpenRouterClient."""
+        return f"http://{self.host}:{self.port}/api/v1"
+
+    async def start(self):
+        """Start listening."""
+        self._server = await asyncio.start_server(
+            self._handle, self.host, self.port, limit=64 * 1024 * 1024
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        """Stop listening and drop open connections."""
+        if self._server:
+            self._server.close()
+            for task in list(self._handlers):
+                task.cancel()
+            await asyncio.gather(*self._handlers, return_exceptions=True)
+            await self._server.wait_closed()
+
+    async def serve_forever(self):
+        """Start and serve until cancelled."""
+        await self.start()
+        print(f"Mock OpenRouter listening on {self.base_url}")
+        async with self._server:
+            await self._server.serve_forever()
+
+    # --- HTTP plumbing -------------------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve keep-alive requests on one connection."""
+        task = asyncio.current_task()
+        self._handlers.add(task)
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode("latin-1").split(" ", 2)
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, _, value = line.decode("latin-1").partition(":")
+                    headers[key.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length", 0)))
+
+                await self._route(method, path, body, writer)
+        except (asyncio.IncompleteReadError, asyncio.CancelledError, ConnectionError, ValueError):
+            pass
+        finally:
+            self._handlers.discard(task)
+            writer.close()
+
+    def _send_json(self, writer: asyncio.StreamWriter, status: int, data: Any,
+                   extra_headers: str = ""):
+        """Write a complete JSON response."""
+        body = json.dumps(data).encode("utf-8")
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\n{extra_headers}"
+            f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+        )
+
+    async def _route(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter):
+        """Dispatch one request."""
+        path = path.split("?", 1)[0].rstrip("/")
+
+        if method == "GET" and path.endswith("/models"):
+            self._send_json(writer, 200, {"data": MOCK_MODELS})
+        elif method == "POST" and path.endswith("/chat/completions"):
+            await self._chat_completions(json.loads(body or b"{}"), writer)
+        elif method == "HEAD":
+            writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+        else:
+            self._send_json(writer, 404, {"error": {"message": f"No route for {method} {path}"}})
+        await writer.drain()
+
+    # --- Chat completions ----------------------------------------------------
+
+    def _pick_error(self) -> Optional[int]:
+        """Decide whether to inject an error for this request."""
+        roll = self.rng.random()
+        for status, probability in self.errors:
+            if roll < probability:
+                return status
+            roll -= probability
+        return None
+
+    def _usage(self, messages: List[Dict[str, Any]], completion: str) -> Dict[str, Any]:
+        """Build a usage object, simulating provider prefix caching."""
+        system = "".join(
+            m["content"] if isinstance(m["content"], str)
+            else "".join(part.get("text", "") for part in m["content"])
+            for m in messages if m.get("role") == "system"
+        )
+        prompt_text = system + "".join(
+            m["content"] for m in messages
+            if m.get("role") != "system" and isinstance(m.get("content"), str)
+        )
+
+        cached = 0
+        if system:
+            key = hashlib.sha256(system.encode("utf-8")).hexdigest()
+            if key in self._prefix_cache:
+                cached = count_tokens(system)
+            self._prefix_cache.add(key)
+
+        return {
+            "prompt_tokens": count_tokens(prompt_text),
+            "completion_tokens": count_tokens(completion),
+            "total_tokens": count_tokens(prompt_text) + count_tokens(completion),
+            "prompt_tokens_details": {"cached_tokens": cached},
+        }
+
+    def _completion_text(self, payload: Dict[str, Any]) -> str:
+        """Echo the last user message, truncated to max_tokens."""
+        messages = payload.get("messages") or [{"content": ""}]
+        text = messages[-1].get("content") or ""
+        if not isinstance(text, str):
+            text = "".join(part.get("text", "") for part in text)
+        max_tokens = payload.get("max_tokens")
+        if max_tokens:
+            text = text[:max_tokens * 4]
+        return text
+
+    async def _chat_completions(self, payload: Dict[str, Any], writer: asyncio.StreamWriter):
+        """Answer a chat completion request."""
+        self.stats["requests"] += 1
+
+        await asyncio.sleep(self.sample_latency(self.rng))
+
+        status = self._pick_error()
+        if status is not None:
+            self.stats["errors"] += 1
+            retry_after = "Retry-After: 1\r\n" if status == 429 else ""
+            self._send_json(writer, status, {
+                "error": {"code": status, "message": f"Injected {REASONS.get(status, 'error')}"}
+            }, retry_after)
+            return
+
+        completion = self._completion_text(payload)
+        model = payload.get("model", "mock/model")
+        usage = self._usage(payload.get("messages", []), completion)
+        completion_id = f"mock-{self.stats['requests']}"
+
+        if payload.get("stream"):
+            self.stats["streamed"] += 1
+            await self._stream(writer, completion_id, model, completion, usage)
+            return
+
+        if self.tokens_per_second:
+            await asyncio.sleep(count_tokens(completion) / self.tokens_per_second)
+
+        self._send_json(writer, 200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": completion},
+                "finish_reason": "stop",
+            }],
+            "usage": usage,
+        })
+
+    async def _stream(self, writer: asyncio.StreamWriter, completion_id: str, model: str,
+                      completion: str, usage: Dict[str, Any]):
+        """Stream a completion as server-sent events with chunked encoding."""
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\n"
+            b"Cache-Control: no-cache\r\nTransfer-Encoding: chunked\r\n\r\n"
+        )
+
+        def send_event(data: str):
+            event = f"data: {data}\n\n".encode("utf-8")
+            writer.write(f"{len(event):x}\r\n".encode("ascii") + event + b"\r\n")
+
+        # Roughly one token (four characters) per chunk
+        pieces = [completion[i:i + 4] for i in range(0, len(completion), 4)] or [""]
+        delay = 1.0 / self.tokens_per_second if self.tokens_per_second else 0.0
+
+        for index, piece in enumerate(pieces):
+            chunk = {
+                "id": completion_id,
+                "object": "chat.completion.chunk",
+                "model": model,
+                "choices": [{"index": 0, "delta": {"content": piece}, "finish_reason": None}],
+            }
+            send_event(json.dumps(chunk))
+            if delay:
+                await writer.drain()
+                await asyncio.sleep(delay)
+            elif index % 64 == 0:
+                await writer.drain()
+
+        send_event(json.dumps({
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "model": model,
+            "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}],
+            "usage": usage,
+        }))
+        send_event("[DONE]")
+        writer.write(b"0\r\n\r\n")
+
+
+def main():
+    """Run the mock server from the command line."""
+    parser = argparse.ArgumentParser(description="Local mock of the OpenRouter chat API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", default="fixed:0",
+                        help="Time to first token: fixed:S, uniform:LO,HI, normal:MU,SIGMA, "
+                             "lognormal:MU,SIGMA or exponential:MEAN (seconds)")
+    parser.add_argument("--tokens-per-second", type=float, default=0.0,
+                        help="Simulated generation speed (0 = instant)")
+    parser.add_argument("--errors", default="",
+                        help="Injected errors as status:probability pairs, e.g. 429:0.05,503:0.01")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed")
+    args = parser.parse_args()
+
+    server = MockOpenRouterServer(
+        args.host, args.port, args.latency, args.tokens_per_second, args.errors, args.seed
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Event-loop lag watchdog for the shared qasync UI/HTTP loop.
+
+A heartbeat coroutine sleeps for a fixed interval and records how late it
+wakes up (loop lag). A monitor thread notices when the heartbeat stalls for
+longer than the threshold, captures the loop thread's stack while it is
+still blocked and prints it to stderr, so synchronous work on the UI thread
+(sqlite commits, ``setPlainText`` on huge documents, file writes) can be
+found and moved off it.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import List, Optional, Tuple
+
+LAG_THRESHOLD_ENV = "AI_TEXTPAD_LAG_THRESHOLD_MS"
+
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LAG_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+
+class BlockedCall:
+    """A stretch of time during which the event loop did not run."""
+
+    def __init__(self, started: float, stack: str):
+        """Initialize blocked call record.
+
+        Args:
+            started: Epoch time the loop stopped responding
+            stack: Formatted stack of the loop thread while blocked
+        """
+        self.started = started
+        self.stack = stack
+        self.duration = 0.0  # Updated when the loop recovers
+        self.resolved = False
+
+    @property
+    def location(self) -> str:
+        """Innermost application frame of the captured stack."""
+        lines = [line for line in self.stack.splitlines() if line.strip().startswith("File ")]
+        for line in reversed(lines):
+            if "ai_textpad" in line:
+                return line.strip()
+        return lines[-1].strip() if lines else ""
+
+
+class LoopWatchdog:
+    """Measures event-loop lag and captures stacks of blocking callbacks."""
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None,
+                 interval: float = 0.05, threshold: Optional[float] = None):
+        """Initialize loop watchdog.
+
+        Args:
+            loop: Event loop to watch (default: current event loop)
+            interval: Heartbeat interval in seconds
+            threshold: Blocking time in seconds before a stack is captured
+                (default: $AI_TEXTPAD_LAG_THRESHOLD_MS or 0.25)
+        """
+        if threshold is None:
+            threshold = float(os.environ.get(LAG_THRESHOLD_ENV, "250")) / 1000
+        self.loop = loop or asyncio.get_event_loop()
+        self.interval = interval
+        self.threshold = threshold
+
+        self.buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.recent_lags: deque = deque(maxlen=1200)  # About a minute of heartbeats
+        self.blocked_calls: deque = deque(maxlen=100)
+        self.max_lag = 0.0
+
+        self._loop_thread: Optional[int] = None
+        self._last_beat = time.monotonic()
+        self._beat = 0
+        self._reported_beat = -1
+        self._open_call: Optional[BlockedCall] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start the heartbeat and the monitor thread."""
+        self._task = self.loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._monitor, name="loop-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop watching."""
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+
+    async def _heartbeat(self):
+        """Sleep for interval repeatedly and record the oversleep."""
+        self._loop_thread = threading.get_ident()
+        while True:
+            self._last_beat = time.monotonic()
+            self._beat += 1
+            await asyncio.sleep(self.interval)
+            self._record(max(0.0, time.monotonic() - self._last_beat - self.interval))
+
+    def _record(self, lag: float):
+        """Add one lag measurement (runs on the loop thread)."""
+        lag_ms = lag * 1000
+        for index, bound in enumerate(LAG_BUCKETS_MS):
+            if lag_ms < bound:
+                self.buckets[index] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.recent_lags.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+
+        call = self._open_call
+        if call is not None:
+            self._open_call = None
+            call.duration = lag
+            call.resolved = True
+            print(f"Event loop unblocked after {lag * 1000:.0f} ms ({call.location})",
+                  file=sys.stderr)
+
+    def _monitor(self):
+        """Capture the loop thread's stack when the heartbeat stalls."""
+        while not self._stop.wait(self.threshold / 4):
+            beat, last_beat = self._beat, self._last_beat
+            stalled = time.monotonic() - last_beat - self.interval
+            if stalled < self.threshold or beat == self._reported_beat or self._loop_thread is None:
+                continue
+
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            self._reported_beat = beat
+            call = BlockedCall(time.time() - stalled, "".join(traceback.format_stack(frame, limit=30)))
+            call.duration = stalled  # Lower bound until the loop recovers
+            self.blocked_calls.append(call)
+            if self._beat == beat:
+                self._open_call = call
+            print(
+                f"Event loop blocked for more than {self.threshold * 1000:.0f} ms; "
+                f"loop thread stack:\n{call.stack}",
+                file=sys.stderr
+            )
+
+    def histogram(self) -> List[Tuple[str, int]]:
+        """Get lag counts per bucket.
+
+        Returns:
+            List of (bucket label, count)
+        """
+        labels = [f"< {bound} ms" for bound in LAG_BUCKETS_MS] + [f"≥ {LAG_BUCKETS_MS[-1]} ms"]
+        return list(zip(labels, self.buckets))
+
+    def percentile(self, fraction: float) -> float:
+        """Get a lag percentile over recent heartbeats, in seconds."""
+        if not self.recent_lags:
+            return 0.0
+        ordered = sorted(self.recent_lags)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def reset(self):
+        """Clear the histogram and blocked-call history."""
+        self.buckets = [0] * (len(LAG_BUCKETS_MS) + 1)
+        self.recent_lags.clear()
+        self.blocked_calls.clear()
+        self.max_lag = 0.0
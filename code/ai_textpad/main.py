@@ -2,70 +2,65 @@
 
 import sys
 import asyncio
-from pathlib import Path
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QTimer
-import qasync
+import argparse
 
-from .storage.database import ConfigDatabase
-from .ui.main_window import MainWindow
-from .transforms.loader import TransformLoader
+from .startup import StartupProfile, StartupSequencer
+from .loop_watchdog import LoopWatchdog
 
 
-def load_default_transformations(db: ConfigDatabase):
-    """Load default transformations from prompts directory if not already loaded.
+def main():
+    """Main application entry point.
 
-    Args:
-        db: Database instance
+    The window is shown before catalog seeding, HTTP warm-up and dialog
+    imports, which run afterwards via StartupSequencer.
     """
-    # Check if transformations already loaded
-    if db.get_categories():
-        return
-
-    # Find prompts directory
-    repo_root = Path(__file__).parent.parent.parent
-    prompts_dir = repo_root / "prompts"
-
-    if not prompts_dir.exists():
-        print(f"Warning: Prompts directory not found at {prompts_dir}")
-        return
-
-    # Load transformations
-    loader = TransformLoader(prompts_dir)
-    transformations = loader.load_from_directory()
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="Print per-phase and per-import startup timings")
+    args, qt_args = parser.parse_known_args()
 
-    # Add to database
-    for name, category, prompt in transformations:
-        db.add_transformation(
-            name=name,
-            category=category,
-            prompt=prompt,
-            user_created=False
-        )
+    profile = StartupProfile(enabled=args.startup_profile)
 
-    print(f"Loaded {len(transformations)} transformations from {prompts_dir}")
+    with profile.phase("import Qt"):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtCore import QTimer
+        import qasync
 
-
-def main():
-    """Main application entry point."""
     # Create QApplication
-    app = QApplication(sys.argv)
-    app.setApplicationName("AI-Textpad")
-    app.setOrganizationName("Daniel Rosehill")
+    with profile.phase("create QApplication"):
+        app = QApplication([sys.argv[0]] + qt_args)
+        app.setApplicationName("AI-Textpad")
+        app.setOrganizationName("Daniel Rosehill")
 
     # Set up async event loop
     loop = qasync.QEventLoop(app)
     asyncio.set_event_loop(loop)
 
-    # Initialize database
-    db = ConfigDatabase()
+    # Report callbacks that block the shared UI/HTTP loop
+    watchdog = LoopWatchdog(loop)
 
-    # Load default transformations on first run
-    load_default_transformations(db)
+    # Initialize database
+    with profile.phase("open database"):
+        from .storage.database import ConfigDatabase
+        db = ConfigDatabase()
 
     # Create and show main window
-    window = MainWindow(db)
-    window.show()
+    with profile.phase("create main window"):
+        from .ui.main_window import MainWindow
+        window = MainWindow(db)
+        window.loop_watchdog = watchdog
+        window.set_catalog_ready(False)
+        window.show()
+
+    # Heavy work starts once the event loop has painted the window
+    sequencer = StartupSequencer(window, db, profile)
+
+    def start_deferred():
+        profile.mark("first paint")
+        asyncio.ensure_future(sequencer.run())
+
+    QTimer.singleShot(0, start_deferred)
+    watchdog.start()
 
     # Run event loop
     with loop:
@@ -0,0 +1,321 @@
+"""Opt-in runtime profiling: operation timings, CPU sampling and memory.
+
+Enable with ``AI_TEXTPAD_PROFILE=1`` or the Settings → Performance toggle.
+While enabled, wrapped operations (transforms, dialog construction, database
+calls) are timed; heavy operations are also sampled by a background thread
+reading ``sys._current_frames()``, and tracemalloc tracks allocations. Sampled
+stacks are written as folded-stack files (flamegraph.pl / speedscope input)
+to ``~/.config/ai-textpad/profiles``.
+
+tracemalloc makes allocation-heavy code several times slower, so absolute
+timings taken while profiling overstate CPU-bound work; compare operations
+against each other rather than against unprofiled runs.
+
+Coroutines spend most of their time suspended while the event loop runs
+other work, so profiled coroutines record wall time only: their samples and
+memory deltas would describe whatever else ran meanwhile.
+"""
+
+import functools
+import inspect
+import os
+import re
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+PROFILE_ENV = "AI_TEXTPAD_PROFILE"
+
+# Recent operations kept in memory, and profile files kept on disk
+MAX_RECORDS = 500
+MAX_PROFILE_FILES = 100
+
+
+def default_profiles_dir() -> Path:
+    """Get the directory profiles are written to."""
+    from .storage.database import default_config_dir
+    return default_config_dir() / "profiles"
+
+
+def profiling_requested(db=None) -> bool:
+    """Check whether profiling is enabled by environment or settings.
+
+    Args:
+        db: Optional database holding the ``profiling_enabled`` setting
+
+    Returns:
+        True if profiling should be on
+    """
+    if os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes", "on"):
+        return True
+    return bool(db and db.get_config("profiling_enabled", False))
+
+
+class SamplingProfiler:
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id: Optional[int] = None, interval: float = 0.005):
+        """Initialize sampling profiler.
+
+        Args:
+            thread_id: Thread to sample (default: calling thread)
+            interval: Seconds between samples
+        """
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Start sampling in a daemon thread."""
+        self._thread = threading.Thread(target=self._run, name="profiler-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> Counter:
+        """Stop sampling.
+
+        Returns:
+            Counter mapping folded stacks (root;...;leaf) to sample counts
+        """
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        return self.stacks
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+
+
+class OperationRecord(NamedTuple):
+    """One profiled operation."""
+    name: str
+    started: float          # Epoch seconds
+    duration: float         # Seconds
+    samples: int            # CPU samples taken (0 if not sampled)
+    hot_frames: List[Tuple[str, int]]  # Leaf frames by sample count
+    memory_delta: int       # Traced bytes allocated minus freed
+    profile_path: Optional[str]
+    wall_time_only: bool = False  # Awaited operation: no samples or memory delta
+
+
+class Profiler:
+    """Collects operation records while profiling is enabled."""
+
+    def __init__(self):
+        """Initialize profiler (disabled)."""
+        self.enabled = False
+        self.output_dir: Optional[Path] = None
+        self.records: deque = deque(maxlen=MAX_RECORDS)
+        self._started_tracemalloc = False
+        # Profile files are written (and old ones pruned) off the UI thread
+        self._writer: Optional[ThreadPoolExecutor] = None
+
+    def configure(self, enabled: bool, output_dir: Optional[Path] = None):
+        """Turn profiling on or off.
+
+        Args:
+            enabled: Whether to profile
+            output_dir: Directory for profile files (default: default_profiles_dir())
+        """
+        self.enabled = enabled
+        if enabled:
+            self.output_dir = Path(output_dir) if output_dir else default_profiles_dir()
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(1)
+                self._started_tracemalloc = True
+        elif self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    @contextmanager
+    def operation(self, name: str, sample: bool = True, wall_time_only: bool = False):
+        """Profile a block of code.
+
+        Args:
+            name: Operation name
+            sample: Whether to sample CPU stacks (use False for cheap, frequent calls)
+            wall_time_only: Only time the block (for blocks that await, where
+                samples and memory would include other work on the loop)
+        """
+        if not self.enabled:
+            yield
+            return
+
+        sampler = SamplingProfiler() if sample and not wall_time_only else None
+        if sampler:
+            sampler.start()
+        tracing = tracemalloc.is_tracing() and not wall_time_only
+        memory_before = tracemalloc.get_traced_memory()[0] if tracing else 0
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            memory_delta = (
+                tracemalloc.get_traced_memory()[0] - memory_before
+                if tracing and tracemalloc.is_tracing() else 0
+            )
+            stacks = sampler.stop() if sampler else Counter()
+            self.records.append(OperationRecord(
+                name, started, duration, sum(stacks.values()), self._hot_frames(stacks),
+                memory_delta, self._write_profile(name, started, stacks), wall_time_only
+            ))
+
+    def profiled(self, name: Optional[str] = None, sample: bool = True):
+        """Decorator profiling each call of a function or coroutine function.
+
+        Coroutine functions are timed by wall clock only (see module docs).
+
+        Args:
+            name: Operation name (default: function qualname)
+            sample: Whether to sample CPU stacks
+        """
+        def decorator(func):
+            operation_name = name or func.__qualname__
+
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.operation(operation_name, wall_time_only=True):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.operation(operation_name, sample):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def instrument(self, obj: Any, prefix: str):
+        """Time every public method of an object instance (without sampling).
+
+        Wrapping is idempotent and cheap while profiling is disabled.
+
+        Args:
+            obj: Object to instrument (e.g. the ConfigDatabase)
+            prefix: Prefix for operation names, e.g. "db"
+        """
+        if getattr(obj, "_profiler_instrumented", False):
+            return
+        for attribute in dir(type(obj)):
+            if attribute.startswith("_"):
+                continue
+            method = getattr(obj, attribute)
+            if callable(method):
+                setattr(obj, attribute, self.profiled(f"{prefix}.{attribute}", sample=False)(method))
+        obj._profiler_instrumented = True
+
+    def slowest(self, limit: int = 25) -> List[OperationRecord]:
+        """Get the slowest recent operations."""
+        return sorted(self.records, key=lambda r: r.duration, reverse=True)[:limit]
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Aggregate recent operations by name, slowest total first.
+
+        Returns:
+            List of dicts with name, count, total, mean and max (seconds)
+        """
+        totals: Dict[str, List[float]] = {}
+        for record in self.records:
+            totals.setdefault(record.name, []).append(record.duration)
+        rows = [
+            {"name": name, "count": len(durations), "total": sum(durations),
+             "mean": sum(durations) / len(durations), "max": max(durations)}
+            for name, durations in totals.items()
+        ]
+        return sorted(rows, key=lambda r: r["total"], reverse=True)
+
+    def memory_top(self, limit: int = 20) -> List[Tuple[str, int, int]]:
+        """Get the source lines holding the most traced memory.
+
+        Returns:
+            List of (location, bytes, allocation count), largest first
+        """
+        if not tracemalloc.is_tracing():
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ])
+        return [
+            (f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}", stat.size, stat.count)
+            for stat in snapshot.statistics("lineno")[:limit]
+        ]
+
+    def save_memory_snapshot(self) -> Optional[Path]:
+        """Dump a full tracemalloc snapshot for offline analysis.
+
+        Returns:
+            Path of the snapshot file, or None if tracing is off
+        """
+        if not tracemalloc.is_tracing() or self.output_dir is None:
+            return None
+        path = self.output_dir / f"memory_{datetime.now().strftime('%Y%m%d_%H%M%S')}.snapshot"
+        tracemalloc.take_snapshot().dump(str(path))
+        return path
+
+    def clear(self):
+        """Forget recorded operations."""
+        self.records.clear()
+
+    @staticmethod
+    def _hot_frames(stacks: Counter, limit: int = 5) -> List[Tuple[str, int]]:
+        """Count samples by leaf frame."""
+        leaves: Counter = Counter()
+        for stack, count in stacks.items():
+            leaves[stack.rsplit(";", 1)[-1]] += count
+        return leaves.most_common(limit)
+
+    def _write_profile(self, name: str, started: float, stacks: Counter) -> Optional[str]:
+        """Queue sampled stacks to be written in folded format.
+
+        Returns:
+            Path the profile is written to, or None if there is nothing to write
+        """
+        if not stacks or self.output_dir is None:
+            return None
+
+        timestamp = datetime.fromtimestamp(started).strftime("%Y%m%d_%H%M%S_%f")
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+        path = self.output_dir / f"{timestamp}_{safe_name}.folded"
+        content = "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
+        if self._writer is None:
+            self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="profile-writer")
+        self._writer.submit(self._save_profile, path, content)
+        return str(path)
+
+    @staticmethod
+    def _save_profile(path: Path, content: str):
+        """Write a profile file and prune the oldest beyond MAX_PROFILE_FILES."""
+        try:
+            path.write_text(content, encoding="utf-8")
+            profiles = sorted(path.parent.glob("*.folded"))
+            for old in profiles[:-MAX_PROFILE_FILES]:
+                old.unlink()
+        except OSError as e:
+            print(f"Could not write profile {path}: {e}")
+
+
+# Shared instance used by the UI and storage instrumentation
+profiler = Profiler()
@@ -0,0 +1,316 @@
+"""Deferred startup sequencing and startup profiling.
+
+The main window is painted first; catalog seeding/sync, HTTP client
+warm-up and dialog imports run afterwards on the event loop (file parsing
+and imports in a worker thread). Pass ``--startup-profile`` to print
+per-phase timings and a ``-X importtime`` style import breakdown.
+"""
+
+import asyncio
+import importlib
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional, Tuple
+
+# Modules imported in the background after the window is shown
+DEFERRED_IMPORTS = [
+    "httpx",
+    "ai_textpad.api.openrouter",
+    "ai_textpad.transforms.pipeline",
+    "ai_textpad.ui.transform_dialog",
+    "ai_textpad.ui.settings_dialog",
+]
+
+
+class _TimedLoader:
+    """Loader proxy that times module execution for ImportTimer."""
+
+    def __init__(self, loader, fullname: str, timer: "ImportTimer"):
+        self._loader = loader
+        self._fullname = fullname
+        self._timer = timer
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._timer._enter()
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer._leave(self._fullname, time.perf_counter() - start)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class ImportTimer:
+    """Meta path hook recording self and cumulative import times."""
+
+    def __init__(self):
+        """Initialize import timer."""
+        self.records: List[Tuple[int, str, float, float]] = []
+        self._local = threading.local()
+        self._installed = False
+
+    @property
+    def _child_time(self) -> List[float]:
+        """Per-thread stack of accumulated child import times."""
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def install(self):
+        """Start recording imports."""
+        if not self._installed:
+            sys.meta_path.insert(0, self)
+            self._installed = True
+
+    def uninstall(self):
+        """Stop recording imports."""
+        if self._installed:
+            sys.meta_path.remove(self)
+            self._installed = False
+
+    def find_spec(self, fullname, path, target=None):
+        """Find the module with the remaining finders and wrap its loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, fullname, self)
+                return spec
+        return None
+
+    def _enter(self):
+        self._child_time.append(0.0)
+
+    def _leave(self, fullname: str, elapsed: float):
+        children = self._child_time.pop()
+        depth = len(self._child_time)
+        if self._child_time:
+            self._child_time[-1] += elapsed
+        self.records.append((depth, fullname, elapsed - children, elapsed))
+
+    def report(self, limit: int = 25) -> str:
+        """Format the slowest imports like ``python -X importtime``.
+
+        Args:
+            limit: Maximum number of top-level imports to show
+
+        Returns:
+            Report text
+        """
+        lines = ["import time: self [us] | cumulative | imported package"]
+        slowest = sorted(self.records, key=lambda r: r[3], reverse=True)[:limit]
+        for depth, name, self_time, cumulative in slowest:
+            lines.append(
+                f"import time: {int(self_time * 1e6):>9} | {int(cumulative * 1e6):>10} | "
+                f"{'  ' * depth}{name}"
+            )
+        return "\n".join(lines)
+
+
+class StartupProfile:
+    """Collects per-phase startup timings."""
+
+    def __init__(self, enabled: bool = False):
+        """Initialize startup profile.
+
+        Args:
+            enabled: Whether timings are reported
+        """
+        self.enabled = enabled
+        self.origin = time.perf_counter()
+        self.phases: List[Tuple[str, float, float]] = []
+        self.import_timer: Optional[ImportTimer] = ImportTimer() if enabled else None
+        if self.import_timer:
+            self.import_timer.install()
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a startup phase.
+
+        Args:
+            name: Phase name
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.origin, time.perf_counter() - start))
+
+    def mark(self, name: str):
+        """Record an instantaneous milestone (e.g. first paint).
+
+        Args:
+            name: Milestone name
+        """
+        self.phases.append((name, time.perf_counter() - self.origin, 0.0))
+
+    def report(self) -> str:
+        """Format the collected timings.
+
+        Returns:
+            Report text
+        """
+        lines = ["Startup profile (offset ms / duration ms):"]
+        for name, offset, duration in self.phases:
+            lines.append(f"  {offset * 1000:8.1f}  {duration * 1000:8.1f}  {name}")
+        if self.import_timer:
+            lines.append("")
+            lines.append(self.import_timer.report())
+        return "\n".join(lines)
+
+    def finish(self):
+        """Stop import timing and print the report if enabled."""
+        if not self.enabled:
+            return
+        if self.import_timer:
+            self.import_timer.uninstall()
+        print(self.report(), file=sys.stderr)
+
+
+class StartupSequencer:
+    """Runs deferred startup work after the main window is shown."""
+
+    def __init__(self, window, db, profile: StartupProfile):
+        """Initialize startup sequencer.
+
+        Args:
+            window: MainWindow instance
+            db: Database instance
+            profile: Startup profile collecting timings
+        """
+        self.window = window
+        self.db = db
+        self.profile = profile
+        self.done = asyncio.Event()
+
+    async def _in_thread(self, func: Callable[..., Any], *args) -> Any:
+        """Run a blocking function in the default executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    async def run(self):
+        """Run all deferred startup phases."""
+        try:
+            await self._sync_catalog()
+            await self._build_catalog_model()
+            self._start_job_runner()
+            self._prune_step_cache()
+            self._start_prompt_watcher()
+            await self._import_deferred()
+            await self._warm_up_client()
+            self._start_model_probes()
+        finally:
+            self.done.set()
+            self.profile.mark("startup complete")
+            self.profile.finish()
+
+    async def _sync_catalog(self):
+        """Seed or sync default transformations without blocking the UI."""
+        from .transforms.loader import (
+            TransformLoader, default_prompts_dir, default_transformations_outdated,
+            store_default_transformations
+        )
+
+        try:
+            with self.profile.phase("catalog sync"):
+                loader = TransformLoader(default_prompts_dir())
+                try:
+                    if default_transformations_outdated(self.db, loader):
+                        # File parsing happens off the UI thread; sqlite stays on it
+                        transformations = await self._in_thread(loader.load_from_directory)
+                        store_default_transformations(self.db, loader, transformations)
+                finally:
+                    loader.close()
+        except Exception as e:
+            print(f"Error loading transformations: {e}")
+        finally:
+            self.window.set_catalog_ready()
+
+    async def _build_catalog_model(self):
+        """Build the dialog's catalog model ahead of first use.
+
+        The search index is built in a worker thread; the Qt model on the UI thread.
+        """
+        from .transforms.search import TrigramIndex
+        from .ui.transformation_model import TransformationListModel
+
+        with self.profile.phase("catalog model"):
+            try:
+                transformations = self.db.get_transformations()
+                index = await self._in_thread(TrigramIndex.from_transformations, transformations)
+                if self.window.transformation_model is None:
+                    self.window.transformation_model = TransformationListModel(
+                        transformations, self.window, index
+                    )
+            except Exception as e:
+                print(f"Error building transformation model: {e}")
+
+    def _start_job_runner(self):
+        """Start transform workers, resuming jobs from the previous session."""
+        with self.profile.phase("job runner"):
+            try:
+                self.window.start_job_runner()
+            except Exception as e:
+                print(f"Error starting job runner: {e}")
+
+    def _prune_step_cache(self):
+        """Evict step cache entries past their age or the entry cap."""
+        from .storage.database import STEP_CACHE_MAX_AGE_DAYS, STEP_CACHE_MAX_ENTRIES
+
+        with self.profile.phase("step cache pruning"):
+            try:
+                self.db.prune_step_cache(
+                    float(self.db.get_config("step_cache_max_age_days", STEP_CACHE_MAX_AGE_DAYS)),
+                    int(self.db.get_config("step_cache_max_entries", STEP_CACHE_MAX_ENTRIES)),
+                )
+            except Exception as e:
+                print(f"Error pruning step cache: {e}")
+
+    def _start_prompt_watcher(self):
+        """Watch the prompts directory so edits show up without a restart."""
+        from .transforms.loader import TransformLoader, default_prompts_dir
+        from .transforms.watcher import PromptReloader, PromptWatcher
+
+        prompts_dir = default_prompts_dir()
+        if not prompts_dir.exists():
+            return
+
+        with self.profile.phase("prompt watcher"):
+            reloader = PromptReloader(self.db, TransformLoader(prompts_dir))
+
+            def on_change(changed):
+                updated, removed = reloader.apply(changed)
+                self.window.on_transformations_changed(updated, removed)
+
+            self.window.prompt_watcher = PromptWatcher(prompts_dir, on_change)
+            self.window.prompt_watcher.start()
+
+    async def _import_deferred(self):
+        """Import modules needed later (dialogs, HTTP stack) in the background."""
+        for module_name in DEFERRED_IMPORTS:
+            with self.profile.phase(f"import {module_name}"):
+                await self._in_thread(importlib.import_module, module_name)
+
+    async def _warm_up_client(self):
+        """Create the backend clients and open connections ahead of use."""
+        with self.profile.phase("http warm-up"):
+            try:
+                await self.window.get_backends().warm_up()
+            except Exception as e:
+                print(f"HTTP warm-up failed: {e}")
+
+    def _start_model_probes(self):
+        """Measure candidate models in the background for "auto:fastest"."""
+        backends = self.window.get_backends()
+        self.window.model_probes = asyncio.ensure_future(
+            backends.models.run_probes(backends.get)
+        )
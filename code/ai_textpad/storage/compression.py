@@ -0,0 +1,295 @@
+"""Transparent zlib compression of large text columns."""
+
+import re
+import sqlite3
+import struct
+import zlib
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+# Values shorter than this (in UTF-8 bytes) are stored as plain text
+COMPRESS_MIN_BYTES = 256
+
+# Preset dictionary size (zlib uses at most the last 32 KiB; smaller leaves
+# room in the window for the value itself)
+DICT_SIZE = 16 * 1024
+
+# Prompts sampled when training a dictionary
+TRAIN_SAMPLES = 500
+
+# Fewer prompts than this are not worth a dictionary
+MIN_TRAIN_SAMPLES = 8
+
+# Words per phrase considered for the dictionary
+PHRASE_WORDS = (3, 6)
+
+# Decompressed values kept in memory
+DECODE_CACHE_SIZE = 4096
+
+# Header of a compressed value: format version, dictionary id (0: none)
+_HEADER = struct.Struct(">BH")
+_FORMAT = 1
+
+_TOKEN = re.compile(r"\S+\s*")
+
+# Column value as stored: plain text or a compressed blob
+Stored = Union[str, bytes]
+
+
+def train_dictionary(samples: List[str], size: int = DICT_SIZE) -> bytes:
+    """Build a zlib preset dictionary from phrases shared across samples.
+
+    zlib has no trainer, so the dictionary is assembled from the word
+    phrases that occur in the most samples, weighted by length. The most
+    valuable phrases go last, where back-references to them are shortest.
+
+    Args:
+        samples: Texts similar to those that will be compressed
+        size: Maximum dictionary size in bytes
+
+    Returns:
+        Dictionary bytes
+    """
+    if len(samples) > TRAIN_SAMPLES:
+        step = len(samples) / TRAIN_SAMPLES
+        samples = [samples[int(i * step)] for i in range(TRAIN_SAMPLES)]
+
+    frequency: Counter = Counter()
+    for sample in samples:
+        tokens = _TOKEN.findall(sample)
+        phrases = set()
+        for words in PHRASE_WORDS:
+            for i in range(len(tokens) - words + 1):
+                phrases.add("".join(tokens[i:i + words]))
+        frequency.update(phrases)
+
+    ranked = sorted(
+        (phrase for phrase, count in frequency.items() if count > 1),
+        key=lambda phrase: frequency[phrase] * len(phrase), reverse=True
+    )
+    chosen: List[str] = []
+    joined = ""
+    total = 0
+    for phrase in ranked:
+        length = len(phrase.encode("utf-8"))
+        if total + length > size:
+            break
+        # Skip phrases already covered by a longer one
+        if phrase in joined:
+            continue
+        chosen.append(phrase)
+        joined += phrase + "\0"
+        total += length
+    return "".join(reversed(chosen)).encode("utf-8")
+
+
+class TextCodec:
+    """Compresses text values above COMPRESS_MIN_BYTES into BLOBs.
+
+    Compressed values are stored as BLOBs (raw deflate with a small header
+    naming the preset dictionary), so SQLite's type tells them apart from
+    plain TEXT and both can live in the same column: existing rows stay
+    readable and are compressed when next written. Dictionaries are kept in
+    the compression_dicts table and never change once written, so values
+    compressed with an older dictionary still decode after retraining.
+    decode() inflates a value immediately (recently decoded values are
+    cached); wrap rows in LazyRow to defer that until a column is read.
+    """
+
+    def __init__(self, conn: sqlite3.Connection, enabled: bool = True):
+        """Initialize codec.
+
+        Args:
+            conn: Database connection holding the dictionaries table
+            enabled: Compress new values (existing ones always decode)
+        """
+        self.conn = conn
+        self.enabled = enabled
+        self.dictionaries: Dict[int, bytes] = {}
+        self._init_table()
+        self._inflate = lru_cache(maxsize=DECODE_CACHE_SIZE)(self._inflate_uncached)
+
+    def _init_table(self):
+        """Create the dictionaries table if it doesn't exist and load it."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS compression_dicts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                data BLOB NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        self.conn.commit()
+        self._load_dictionaries()
+
+    def _load_dictionaries(self):
+        """Load the stored dictionaries (another process may have added some)."""
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT id, data FROM compression_dicts")
+        self.dictionaries = {row[0]: bytes(row[1]) for row in cursor.fetchall()}
+
+    @property
+    def dictionary_id(self) -> int:
+        """ID of the dictionary new values are compressed with (0: none)."""
+        return max(self.dictionaries, default=0)
+
+    def train(self, samples: List[str]) -> Optional[int]:
+        """Train and store a new dictionary for subsequently written values.
+
+        Args:
+            samples: Texts similar to those that will be compressed
+
+        Returns:
+            New dictionary ID, or None if there were too few samples or the
+            dictionary is unchanged
+        """
+        if not self.enabled or len(samples) < MIN_TRAIN_SAMPLES:
+            return None
+        data = train_dictionary(samples)
+        if not data or data == self.dictionaries.get(self.dictionary_id):
+            return None
+        cursor = self.conn.cursor()
+        cursor.execute("INSERT INTO compression_dicts (data) VALUES (?)", (data,))
+        self.conn.commit()
+        self.dictionaries[cursor.lastrowid] = data
+        return cursor.lastrowid
+
+    def encode(self, text: Optional[str]) -> Optional[Stored]:
+        """Prepare a text value for storage.
+
+        Args:
+            text: Text value
+
+        Returns:
+            A compressed blob if that is smaller, otherwise the text
+        """
+        if text is None or not self.enabled:
+            return text
+        raw = text.encode("utf-8")
+        if len(raw) < COMPRESS_MIN_BYTES:
+            return text
+        dictionary_id = self.dictionary_id
+        if dictionary_id:
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -15,
+                                          zdict=self.dictionaries[dictionary_id])
+        else:
+            compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+        blob = _HEADER.pack(_FORMAT, dictionary_id) + compressor.compress(raw) + compressor.flush()
+        return blob if len(blob) < len(raw) else text
+
+    def decode(self, value: Optional[Stored]) -> Optional[str]:
+        """Restore a stored value.
+
+        Args:
+            value: Column value (text, or a blob written by encode())
+
+        Returns:
+            Text value
+
+        Raises:
+            ValueError: If a blob is corrupt or its dictionary is missing
+        """
+        if value is None or isinstance(value, str):
+            return value
+        return self._inflate(bytes(value))
+
+    def clear_cache(self):
+        """Forget decoded values (the next read of each decompresses again)."""
+        self._inflate.cache_clear()
+
+    def _inflate_uncached(self, blob: bytes) -> str:
+        """Decompress a blob written by encode()."""
+        version, dictionary_id = _HEADER.unpack_from(blob)
+        if version != _FORMAT:
+            raise ValueError(f"Unknown compressed value format {version}")
+        if dictionary_id and dictionary_id not in self.dictionaries:
+            self._load_dictionaries()
+        try:
+            if dictionary_id:
+                decompressor = zlib.decompressobj(-15, zdict=self.dictionaries[dictionary_id])
+            else:
+                decompressor = zlib.decompressobj(-15)
+            raw = decompressor.decompress(blob[_HEADER.size:]) + decompressor.flush()
+        except KeyError:
+            raise ValueError(f"Missing compression dictionary {dictionary_id}") from None
+        except zlib.error as e:
+            raise ValueError(f"Corrupt compressed value: {e}") from e
+        return raw.decode("utf-8")
+
+
+class LazyRow(dict):
+    """Row dictionary whose compressed columns are decoded on first access.
+
+    Listing a table (e.g. the whole catalog for the dialog model) then
+    inflates nothing until a caller actually reads one of those columns.
+    Every way of reading values (indexing, get(), items(), values(),
+    copying, JSON encoding) sees decoded text.
+    """
+
+    def __init__(self, row: Any, codec: TextCodec, columns: Iterable[str]):
+        """Initialize row.
+
+        Args:
+            row: Database row (or mapping)
+            codec: Codec the columns were encoded with
+            columns: Columns that may hold compressed values
+        """
+        super().__init__(row)
+        self._codec = codec
+        self._encoded = {
+            column for column in columns
+            if isinstance(dict.get(self, column), (bytes, memoryview))
+        }
+
+    def _decode(self, key: Any):
+        """Decode a column in place if it is still encoded."""
+        if key in self._encoded:
+            dict.__setitem__(self, key, self._codec.decode(dict.__getitem__(self, key)))
+            self._encoded.discard(key)
+
+    def _decode_all(self):
+        """Decode every column that is still encoded."""
+        for key in list(self._encoded):
+            self._decode(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._decode(key)
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: Any, value: Any):
+        self._encoded.discard(key)
+        super().__setitem__(key, value)
+
+    # Defined so dict(row) and {**row} copy through __getitem__
+    def __iter__(self):
+        return super().__iter__()
+
+    def __eq__(self, other: Any) -> bool:
+        self._decode_all()
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        self._decode_all()
+        return super().__repr__()
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        self._decode(key)
+        return super().get(key, default)
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        self._decode(key)
+        self._encoded.discard(key)
+        return super().pop(key, *default)
+
+    def items(self):
+        self._decode_all()
+        return super().items()
+
+    def values(self):
+        self._decode_all()
+        return super().values()
+
+    def copy(self) -> Dict[Any, Any]:
+        self._decode_all()
+        return dict(self)
@@ -2,28 +2,51 @@
 
 import sqlite3
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import json
 
+from .compression import LazyRow, TextCodec
+
+# Step cache entries older than this many days are pruned on startup
+STEP_CACHE_MAX_AGE_DAYS = 30
+
+# Most step cache entries kept (the oldest beyond this are pruned)
+STEP_CACHE_MAX_ENTRIES = 20000
+
+
+def default_config_dir() -> Path:
+    """Get the configuration directory, creating it if needed.
+
+    Returns:
+        Path to ~/.config/ai-textpad
+    """
+    config_dir = Path.home() / ".config" / "ai-textpad"
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return config_dir
+
 
 class ConfigDatabase:
-    """Manages SQLite database for application configuration."""
+    """Manages SQLite database for application configuration.
+
+    Large text values (config values, prompts, cached step outputs) are
+    stored compressed through ``self.codec``; see TextCodec.
+    """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, compress: bool = True):
         """Initialize database connection.
 
         Args:
             db_path: Path to SQLite database file. Defaults to ~/.config/ai-textpad/config.db
+            compress: Compress large text values when writing them
         """
         if db_path is None:
-            config_dir = Path.home() / ".config" / "ai-textpad"
-            config_dir.mkdir(parents=True, exist_ok=True)
-            db_path = config_dir / "config.db"
+            db_path = default_config_dir() / "config.db"
 
         self.db_path = db_path
         self.conn = sqlite3.connect(str(db_path))
         self.conn.row_factory = sqlite3.Row
         self._init_tables()
+        self.codec = TextCodec(self.conn, compress)
 
     def _init_tables(self):
         """Create database tables if they don't exist."""
@@ -56,11 +79,32 @@ class ConfigDatabase:
                 prompt TEXT NOT NULL,
                 user_created INTEGER DEFAULT 0,
                 sort_order INTEGER DEFAULT 0,
+                metadata TEXT NOT NULL DEFAULT '{}',
+                source_path TEXT,
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
 
+        # Migrate transformations tables created before frontmatter support
+        cursor.execute("PRAGMA table_info(transformations)")
+        columns = {row[1] for row in cursor.fetchall()}
+        if "metadata" not in columns:
+            cursor.execute(
+                "ALTER TABLE transformations ADD COLUMN metadata TEXT NOT NULL DEFAULT '{}'"
+            )
+        if "source_path" not in columns:
+            cursor.execute("ALTER TABLE transformations ADD COLUMN source_path TEXT")
+
+        # Pipeline step cache table
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS step_cache (
+                cache_key TEXT PRIMARY KEY,
+                output TEXT NOT NULL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+
         self.conn.commit()
 
     def get_config(self, key: str, default: Any = None) -> Any:
@@ -81,10 +125,11 @@ class ConfigDatabase:
             return default
 
         # Try to parse as JSON, fallback to string
+        value = self.codec.decode(row[0])
         try:
-            return json.loads(row[0])
+            return json.loads(value)
         except (json.JSONDecodeError, TypeError):
-            return row[0]
+            return value
 
     def set_config(self, key: str, value: Any):
         """Set configuration value.
@@ -103,7 +148,7 @@ class ConfigDatabase:
             ON CONFLICT(key) DO UPDATE SET
                 value = excluded.value,
                 updated_at = CURRENT_TIMESTAMP
-        """, (key, value))
+        """, (key, self.codec.encode(value)))
         self.conn.commit()
 
     def get_user_detail(self, key: str, default: str = "") -> str:
@@ -149,7 +194,8 @@ class ConfigDatabase:
         return {row[0]: row[1] for row in cursor.fetchall()}
 
     def add_transformation(self, name: str, category: str, prompt: str,
-                          user_created: bool = True, sort_order: int = 0) -> int:
+                          user_created: bool = True, sort_order: int = 0,
+                          metadata: Optional[Dict[str, Any]] = None) -> int:
         """Add a new transformation.
 
         Args:
@@ -158,15 +204,18 @@ class ConfigDatabase:
             prompt: System prompt for the transformation
             user_created: Whether this is a user-created transformation
             sort_order: Sort order within category
+            metadata: Optional routing metadata (model, temperature, max_tokens,
+                output_format) parsed from prompt frontmatter
 
         Returns:
             ID of created transformation
         """
         cursor = self.conn.cursor()
         cursor.execute("""
-            INSERT INTO transformations (name, category, prompt, user_created, sort_order)
-            VALUES (?, ?, ?, ?, ?)
-        """, (name, category, prompt, int(user_created), sort_order))
+            INSERT INTO transformations (name, category, prompt, user_created, sort_order, metadata)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (name, category, self.codec.encode(prompt), int(user_created), sort_order,
+              json.dumps(metadata or {})))
         self.conn.commit()
         return cursor.lastrowid
 
@@ -182,19 +231,58 @@ class ConfigDatabase:
         cursor = self.conn.cursor()
         if category:
             cursor.execute("""
-                SELECT id, name, category, prompt, user_created, sort_order
+                SELECT id, name, category, prompt, user_created, sort_order, metadata, source_path
                 FROM transformations
                 WHERE category = ?
                 ORDER BY sort_order, name
             """, (category,))
         else:
             cursor.execute("""
-                SELECT id, name, category, prompt, user_created, sort_order
+                SELECT id, name, category, prompt, user_created, sort_order, metadata, source_path
                 FROM transformations
                 ORDER BY category, sort_order, name
             """)
 
-        return [dict(row) for row in cursor.fetchall()]
+        return [self._transformation_row(row) for row in cursor.fetchall()]
+
+    def get_transformations_by_source(self, source_paths: List[str]) -> list:
+        """Get the transformations loaded from the given prompt files.
+
+        Only the matching rows are read.
+
+        Args:
+            source_paths: Prompt file paths relative to the prompts directory
+
+        Returns:
+            List of transformation dictionaries
+        """
+        if not source_paths:
+            return []
+        cursor = self.conn.cursor()
+        cursor.execute(f"""
+            SELECT id, name, category, prompt, user_created, sort_order, metadata, source_path
+            FROM transformations
+            WHERE source_path IN ({", ".join("?" * len(source_paths))})
+            ORDER BY category, sort_order, name
+        """, list(source_paths))
+        return [self._transformation_row(row) for row in cursor.fetchall()]
+
+    def _transformation_row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Convert a transformations row to a dictionary.
+
+        Args:
+            row: Database row
+
+        Returns:
+            Transformation dictionary with decoded metadata; the prompt is
+            decompressed when first read
+        """
+        trans = LazyRow(row, self.codec, ("prompt",))
+        try:
+            trans['metadata'] = json.loads(trans.get('metadata') or "{}")
+        except json.JSONDecodeError:
+            trans['metadata'] = {}
+        return trans
 
     def get_categories(self) -> list:
         """Get all transformation categories.
@@ -211,10 +299,14 @@ class ConfigDatabase:
 
         Args:
             transformation_id: ID of transformation to update
-            **kwargs: Fields to update (name, category, prompt, sort_order)
+            **kwargs: Fields to update (name, category, prompt, sort_order, metadata)
         """
-        allowed_fields = {'name', 'category', 'prompt', 'sort_order'}
+        allowed_fields = {'name', 'category', 'prompt', 'sort_order', 'metadata'}
         updates = {k: v for k, v in kwargs.items() if k in allowed_fields}
+        if 'metadata' in updates:
+            updates['metadata'] = json.dumps(updates['metadata'] or {})
+        if 'prompt' in updates:
+            updates['prompt'] = self.codec.encode(updates['prompt'])
 
         if not updates:
             return
@@ -241,6 +333,173 @@ class ConfigDatabase:
         cursor.execute("DELETE FROM transformations WHERE id = ?", (transformation_id,))
         self.conn.commit()
 
+    def get_transformation(self, transformation_id: int) -> Optional[Dict[str, Any]]:
+        """Get a single transformation by ID.
+
+        Args:
+            transformation_id: Transformation ID
+
+        Returns:
+            Transformation dictionary or None if not found
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT id, name, category, prompt, user_created, sort_order, metadata, source_path
+            FROM transformations
+            WHERE id = ?
+        """, (transformation_id,))
+        row = cursor.fetchone()
+        return self._transformation_row(row) if row else None
+
+    def replace_default_transformations(self, transformations: list):
+        """Replace all seeded transformations in a single transaction.
+
+        The compression dictionary is retrained on the new prompts first.
+
+        Args:
+            transformations: List of (name, category, prompt, metadata, source_path) tuples
+        """
+        self.codec.train([entry[2] for entry in transformations])
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM transformations WHERE user_created = 0")
+        cursor.executemany("""
+            INSERT INTO transformations (name, category, prompt, user_created, metadata, source_path)
+            VALUES (?, ?, ?, 0, ?, ?)
+        """, [
+            (name, category, self.codec.encode(prompt), json.dumps(metadata or {}), source_path)
+            for name, category, prompt, metadata, source_path in transformations
+        ])
+        self.conn.commit()
+
+    def upsert_default_transformation(self, source_path: str, name: str, category: str,
+                                      prompt: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """Insert or update the seeded transformation loaded from a prompt file.
+
+        Args:
+            source_path: Prompt file path relative to the prompts directory
+            name: Transformation name
+            category: Category name
+            prompt: System prompt for the transformation
+            metadata: Optional frontmatter metadata
+
+        Returns:
+            ID of the inserted or updated transformation
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT id FROM transformations WHERE source_path = ? AND user_created = 0",
+            (source_path,)
+        )
+        row = cursor.fetchone()
+        if row:
+            self.update_transformation(
+                row[0], name=name, category=category, prompt=prompt, metadata=metadata
+            )
+            return row[0]
+
+        cursor.execute("""
+            INSERT INTO transformations (name, category, prompt, user_created, metadata, source_path)
+            VALUES (?, ?, ?, 0, ?, ?)
+        """, (name, category, self.codec.encode(prompt), json.dumps(metadata or {}),
+              source_path))
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def delete_transformation_by_source(self, source_path: str) -> Optional[int]:
+        """Delete the seeded transformation loaded from a prompt file.
+
+        Args:
+            source_path: Prompt file path relative to the prompts directory
+
+        Returns:
+            ID of the deleted transformation, or None if there was none
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT id FROM transformations WHERE source_path = ? AND user_created = 0",
+            (source_path,)
+        )
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        self.delete_transformation(row[0])
+        return row[0]
+
+    def get_cached_step(self, cache_key: str) -> Optional[str]:
+        """Get cached output of a pipeline step.
+
+        Args:
+            cache_key: Step cache key (see TransformPipeline.step_key)
+
+        Returns:
+            Cached output text or None if not cached
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT output FROM step_cache WHERE cache_key = ?", (cache_key,))
+        row = cursor.fetchone()
+        return self.codec.decode(row[0]) if row else None
+
+    def set_cached_step(self, cache_key: str, output: str):
+        """Store output of a pipeline step.
+
+        Args:
+            cache_key: Step cache key
+            output: Step output text
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO step_cache (cache_key, output)
+            VALUES (?, ?)
+            ON CONFLICT(cache_key) DO UPDATE SET
+                output = excluded.output,
+                created_at = CURRENT_TIMESTAMP
+        """, (cache_key, self.codec.encode(output)))
+        self.conn.commit()
+
+    def clear_step_cache(self):
+        """Remove all cached pipeline step outputs."""
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM step_cache")
+        self.conn.commit()
+
+    def count_cached_steps(self) -> int:
+        """Get the number of step cache entries.
+
+        Returns:
+            Number of cached step outputs
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT COUNT(*) FROM step_cache")
+        return cursor.fetchone()[0]
+
+    def prune_step_cache(self, max_age_days: float = STEP_CACHE_MAX_AGE_DAYS,
+                         max_entries: int = STEP_CACHE_MAX_ENTRIES) -> int:
+        """Evict old step cache entries.
+
+        Args:
+            max_age_days: Remove entries written longer ago than this
+            max_entries: Then keep at most this many, newest first
+
+        Returns:
+            Number of entries removed
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "DELETE FROM step_cache WHERE created_at < datetime('now', ?)",
+            (f"-{max_age_days} days",)
+        )
+        removed = cursor.rowcount
+        cursor.execute("""
+            DELETE FROM step_cache WHERE cache_key IN (
+                SELECT cache_key FROM step_cache
+                ORDER BY created_at DESC, rowid DESC
+                LIMIT -1 OFFSET ?
+            )
+        """, (max_entries,))
+        removed += cursor.rowcount
+        self.conn.commit()
+        return removed
+
     def close(self):
         """Close database connection."""
         self.conn.close()
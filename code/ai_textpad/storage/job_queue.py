@@ -0,0 +1,328 @@
+"""Persistent priority queue of transform jobs, stored next to the config tables."""
+
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+from .database import ConfigDatabase
+
+# Lower values run first
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BATCH = 10
+PRIORITY_CHUNK = 20
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+UNFINISHED_STATES = (QUEUED, RUNNING)
+
+# Default attempts before a failing job is given up on
+DEFAULT_MAX_ATTEMPTS = 3
+
+# Finished jobs older than this are purged on recovery
+RETENTION_SECONDS = 7 * 24 * 3600
+
+
+class JobQueue:
+    """SQLite-backed job queue with priorities, progress and retry state.
+
+    Jobs are claimed lowest priority value first, then oldest first. A job's
+    payload and result are JSON (compressed when large). Rows are kept
+    after they finish so a result produced while nobody was waiting can be
+    picked up later; consumers delete them once delivered.
+    """
+
+    def __init__(self, db: ConfigDatabase):
+        """Initialize job queue.
+
+        Args:
+            db: Database instance whose connection holds the jobs table
+        """
+        self.db = db
+        self.conn = db.conn
+        self._init_table()
+
+    def _init_table(self):
+        """Create the jobs table if it doesn't exist."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'queued',
+                payload TEXT NOT NULL DEFAULT '{}',
+                result TEXT,
+                error TEXT,
+                progress REAL NOT NULL DEFAULT 0,
+                message TEXT NOT NULL DEFAULT '',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                max_attempts INTEGER NOT NULL DEFAULT 3,
+                not_before REAL NOT NULL DEFAULT 0,
+                created_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS jobs_claim
+            ON jobs (status, priority, id)
+        """)
+        self.conn.commit()
+
+    def _job_row(self, row) -> Dict[str, Any]:
+        """Convert a jobs row to a dictionary with decoded payload and result.
+
+        Args:
+            row: Database row
+
+        Returns:
+            Job dictionary
+        """
+        job = dict(row)
+        job['payload'] = json.loads(self.db.codec.decode(job['payload']) or "{}")
+        if job['result'] is not None:
+            job['result'] = json.loads(self.db.codec.decode(job['result']))
+        return job
+
+    def enqueue(self, kind: str, payload: Dict[str, Any],
+                priority: int = PRIORITY_INTERACTIVE,
+                max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """Add a job to the queue.
+
+        Args:
+            kind: Job kind (selects the handler that runs it)
+            payload: JSON-serializable job input
+            priority: Scheduling priority (PRIORITY_*; lower runs first)
+            max_attempts: Attempts before the job is marked failed
+
+        Returns:
+            ID of the created job
+        """
+        now = time.time()
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO jobs (kind, priority, payload, max_attempts, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (kind, priority, self.db.codec.encode(json.dumps(payload)), max_attempts, now, now))
+        self.conn.commit()
+        return cursor.lastrowid
+
+    def claim(self, kinds: Iterable[str],
+              max_priority: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """Mark the next runnable job as running and return it.
+
+        Args:
+            kinds: Job kinds the caller can run
+            max_priority: Only claim jobs with at most this priority value
+
+        Returns:
+            Claimed job dictionary, or None if nothing is runnable
+        """
+        kinds = list(kinds)
+        if not kinds:
+            return None
+
+        now = time.time()
+        query = f"""
+            SELECT * FROM jobs
+            WHERE status = ? AND not_before <= ?
+              AND kind IN ({", ".join("?" * len(kinds))})
+        """
+        params: List[Any] = [QUEUED, now, *kinds]
+        if max_priority is not None:
+            query += " AND priority <= ?"
+            params.append(max_priority)
+        query += " ORDER BY priority, id LIMIT 1"
+
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+        if row is None:
+            return None
+
+        cursor.execute("""
+            UPDATE jobs SET status = ?, attempts = attempts + 1, error = NULL,
+                            updated_at = ?
+            WHERE id = ?
+        """, (RUNNING, now, row['id']))
+        self.conn.commit()
+        return self.get(row['id'])
+
+    def next_retry_in(self, kinds: Iterable[str],
+                      max_priority: Optional[int] = None) -> Optional[float]:
+        """Get seconds until the earliest backed-off job becomes runnable.
+
+        Args:
+            kinds: Job kinds the caller can run
+            max_priority: Only consider jobs with at most this priority value
+
+        Returns:
+            Seconds to wait, or None if no queued job is backing off
+        """
+        kinds = list(kinds)
+        if not kinds:
+            return None
+        query = f"""
+            SELECT MIN(not_before) FROM jobs
+            WHERE status = ? AND kind IN ({", ".join("?" * len(kinds))})
+        """
+        params: List[Any] = [QUEUED, *kinds]
+        if max_priority is not None:
+            query += " AND priority <= ?"
+            params.append(max_priority)
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        not_before = cursor.fetchone()[0]
+        if not_before is None:
+            return None
+        return max(0.0, not_before - time.time())
+
+    def _update(self, job_id: int, **fields):
+        """Update job columns and the modification time."""
+        fields['updated_at'] = time.time()
+        set_clause = ", ".join(f"{k} = ?" for k in fields)
+        cursor = self.conn.cursor()
+        cursor.execute(
+            f"UPDATE jobs SET {set_clause} WHERE id = ?", [*fields.values(), job_id]
+        )
+        self.conn.commit()
+
+    def set_progress(self, job_id: int, progress: float, message: str = ""):
+        """Record progress of a running job.
+
+        Args:
+            job_id: Job ID
+            progress: Fraction complete (0.0-1.0)
+            message: Optional status text
+        """
+        self._update(job_id, progress=max(0.0, min(1.0, progress)), message=message)
+
+    def complete(self, job_id: int, result: Any):
+        """Mark a job done and store its result.
+
+        Args:
+            job_id: Job ID
+            result: JSON-serializable result
+        """
+        self._update(job_id, status=DONE, result=self.db.codec.encode(json.dumps(result)),
+                     progress=1.0, error=None)
+
+    def fail(self, job_id: int, error: str, retry_delay: Optional[float] = None) -> bool:
+        """Record a failed attempt, requeueing the job if attempts remain.
+
+        Args:
+            job_id: Job ID
+            error: Error description
+            retry_delay: Seconds to wait before retrying (None = don't retry)
+
+        Returns:
+            True if the job was requeued, False if it is now failed
+        """
+        job = self.get(job_id)
+        if job is None:
+            return False
+        if retry_delay is not None and job['attempts'] < job['max_attempts']:
+            self._update(job_id, status=QUEUED, error=error,
+                         not_before=time.time() + retry_delay)
+            return True
+        self._update(job_id, status=FAILED, error=error)
+        return False
+
+    def cancel(self, job_id: int):
+        """Mark an unfinished job as cancelled.
+
+        Args:
+            job_id: Job ID
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "UPDATE jobs SET status = ?, updated_at = ? WHERE id = ? AND status IN (?, ?)",
+            (CANCELLED, time.time(), job_id, *UNFINISHED_STATES)
+        )
+        self.conn.commit()
+
+    def requeue(self, job_id: int):
+        """Put a running job back in the queue without counting the attempt.
+
+        Args:
+            job_id: Job ID
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), updated_at = ?
+            WHERE id = ? AND status = ?
+        """, (QUEUED, time.time(), job_id, RUNNING))
+        self.conn.commit()
+
+    def recover(self) -> int:
+        """Requeue jobs left running by a previous process and purge old ones.
+
+        Returns:
+            Number of jobs requeued
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            UPDATE jobs SET status = ?, attempts = MAX(attempts - 1, 0), updated_at = ?
+            WHERE status = ?
+        """, (QUEUED, time.time(), RUNNING))
+        requeued = cursor.rowcount
+        cursor.execute(
+            "DELETE FROM jobs WHERE status NOT IN (?, ?) AND updated_at < ?",
+            (*UNFINISHED_STATES, time.time() - RETENTION_SECONDS)
+        )
+        self.conn.commit()
+        return requeued
+
+    def get(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job dictionary or None if not found
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM jobs WHERE id = ?", (job_id,))
+        row = cursor.fetchone()
+        return self._job_row(row) if row else None
+
+    def jobs(self, kind: Optional[str] = None,
+             statuses: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """List jobs in claim order.
+
+        Args:
+            kind: Only jobs of this kind (None for all)
+            statuses: Only jobs in these states (None for all)
+
+        Returns:
+            List of job dictionaries
+        """
+        query = "SELECT * FROM jobs WHERE 1 = 1"
+        params: List[Any] = []
+        if kind is not None:
+            query += " AND kind = ?"
+            params.append(kind)
+        if statuses is not None:
+            statuses = list(statuses)
+            query += f" AND status IN ({', '.join('?' * len(statuses))})"
+            params.extend(statuses)
+        query += " ORDER BY priority, id"
+
+        cursor = self.conn.cursor()
+        cursor.execute(query, params)
+        return [self._job_row(row) for row in cursor.fetchall()]
+
+    def delete(self, job_id: int):
+        """Delete a job (e.g. once its result has been delivered).
+
+        Args:
+            job_id: Job ID
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+        self.conn.commit()
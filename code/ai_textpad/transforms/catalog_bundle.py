@@ -0,0 +1,272 @@
+"""Prebuilt, memory-mappable bundle of the prompt catalog.
+
+A bundle compiles the prompts directory into a single file so startup does
+not have to open and parse hundreds of prompt files:
+
+    header   struct "<8sIII": magic, format version, index length, reserved
+    index    UTF-8 JSON: catalog schema, bodies checksum and one entry per
+             prompt file (path, mtime_ns, size, name, category, metadata,
+             offset, length, sha256)
+    bodies   prompt bodies, UTF-8, stored contiguously
+
+Build it with:
+
+    python -m ai_textpad.transforms.catalog_bundle build [prompts_dir]
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+BUNDLE_MAGIC = b"AITPCAT\x00"
+BUNDLE_FORMAT = 1
+BUNDLE_FILENAME = ".catalog.bundle"
+HEADER = struct.Struct("<8sIII")
+
+
+def scan_prompt_files(prompts_dir: Path) -> Dict[str, Tuple[int, int]]:
+    """Stat every prompt file without opening it.
+
+    Args:
+        prompts_dir: Prompts directory
+
+    Returns:
+        Dictionary mapping relative path -> (mtime_ns, size)
+    """
+    files = {}
+    for root, dirs, names in os.walk(prompts_dir):
+        dirs[:] = [d for d in dirs if not d.startswith(".")]
+        for name in names:
+            if not name.endswith(".md"):
+                continue
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            files[os.path.relpath(path, prompts_dir)] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+class CatalogBundle:
+    """Read access to a memory-mapped catalog bundle."""
+
+    def __init__(self, bundle_path: Path):
+        """Open and map a bundle file.
+
+        Args:
+            bundle_path: Path to bundle file
+
+        Raises:
+            ValueError: If the file is not a valid bundle
+        """
+        self.bundle_path = Path(bundle_path)
+        with open(self.bundle_path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < HEADER.size:
+            self.close()
+            raise ValueError(f"Truncated catalog bundle: {bundle_path}")
+
+        magic, version, index_length, _ = HEADER.unpack_from(self._mmap, 0)
+        if magic != BUNDLE_MAGIC or version != BUNDLE_FORMAT:
+            self.close()
+            raise ValueError(f"Unsupported catalog bundle: {bundle_path}")
+
+        index_end = HEADER.size + index_length
+        self.index: Dict[str, Any] = json.loads(self._mmap[HEADER.size:index_end])
+        self._bodies_offset = index_end
+
+    @property
+    def entries(self) -> List[Dict[str, Any]]:
+        """Index entries (name, category, metadata, path...) without bodies."""
+        return self.index["files"]
+
+    @property
+    def checksum(self) -> str:
+        """SHA-256 of all bodies, identifying this catalog revision."""
+        return self.index["checksum"]
+
+    @property
+    def schema(self) -> int:
+        """Catalog schema the bundle was built with."""
+        return self.index.get("schema", 0)
+
+    def body(self, entry: Dict[str, Any]) -> str:
+        """Read the prompt body of an index entry.
+
+        Args:
+            entry: Index entry
+
+        Returns:
+            Prompt body text
+        """
+        start = self._bodies_offset + entry["offset"]
+        return self._mmap[start:start + entry["length"]].decode("utf-8")
+
+    def iter_transformations(self) -> Iterator[Tuple[str, str, str, Dict[str, Any], str]]:
+        """Iterate over transformations in loader tuple format.
+
+        Yields:
+            Tuples of (name, category, prompt_content, metadata, source_path)
+        """
+        for entry in self.entries:
+            yield (entry["name"], entry["category"], self.body(entry),
+                   entry["metadata"], entry["path"])
+
+    def is_stale(self, prompts_dir: Path, schema: int) -> bool:
+        """Check whether the bundle no longer matches the prompts directory.
+
+        Only file metadata is compared (path, mtime, size), no files are read.
+
+        Args:
+            prompts_dir: Prompts directory
+            schema: Current catalog schema
+
+        Returns:
+            True if the bundle must not be used
+        """
+        if self.schema != schema:
+            return True
+        bundled = {e["path"]: (e["mtime_ns"], e["size"]) for e in self.entries}
+        bundled.update({path: tuple(stat) for path, stat in self.index.get("skipped", {}).items()})
+        return bundled != scan_prompt_files(prompts_dir)
+
+    def verify(self) -> bool:
+        """Verify body checksums.
+
+        Returns:
+            True if every body matches its recorded hash
+        """
+        total = hashlib.sha256()
+        for entry in self.entries:
+            body = self.body(entry).encode("utf-8")
+            if hashlib.sha256(body).hexdigest() != entry["sha256"]:
+                return False
+            total.update(body)
+        return total.hexdigest() == self.checksum
+
+    def close(self):
+        """Unmap the bundle."""
+        self._mmap.close()
+
+    @classmethod
+    def open_if_fresh(cls, bundle_path: Path, prompts_dir: Path,
+                      schema: int) -> Optional["CatalogBundle"]:
+        """Open a bundle only if it exists and matches the prompts directory.
+
+        Args:
+            bundle_path: Path to bundle file
+            prompts_dir: Prompts directory the bundle was built from
+            schema: Current catalog schema
+
+        Returns:
+            Open bundle, or None if missing, invalid or stale
+        """
+        if not Path(bundle_path).exists():
+            return None
+        try:
+            bundle = cls(bundle_path)
+        except (OSError, ValueError) as e:
+            print(f"Ignoring catalog bundle {bundle_path}: {e}")
+            return None
+        if bundle.is_stale(prompts_dir, schema):
+            bundle.close()
+            return None
+        return bundle
+
+    @staticmethod
+    def build(loader, bundle_path: Optional[Path] = None) -> Path:
+        """Compile a prompts directory into a bundle file.
+
+        Args:
+            loader: TransformLoader for the prompts directory
+            bundle_path: Output path (default: prompts_dir/.catalog.bundle)
+
+        Returns:
+            Path of the written bundle
+        """
+        from .loader import CATALOG_SCHEMA
+
+        prompts_dir = loader.prompts_dir
+        bundle_path = Path(bundle_path or prompts_dir / BUNDLE_FILENAME)
+
+        files = []
+        skipped = {}
+        bodies = bytearray()
+        total = hashlib.sha256()
+
+        for rel_path, (mtime_ns, size) in sorted(scan_prompt_files(prompts_dir).items()):
+            name, category, content, metadata = loader._parse_prompt_file(prompts_dir / rel_path)
+            if not content:
+                # Remember unusable files so they don't make the bundle look stale
+                skipped[rel_path] = [mtime_ns, size]
+                continue
+
+            body = content.encode("utf-8")
+            files.append({
+                "path": rel_path,
+                "mtime_ns": mtime_ns,
+                "size": size,
+                "name": name,
+                "category": category,
+                "metadata": metadata,
+                "offset": len(bodies),
+                "length": len(body),
+                "sha256": hashlib.sha256(body).hexdigest(),
+            })
+            bodies.extend(body)
+            total.update(body)
+
+        index = json.dumps({
+            "schema": CATALOG_SCHEMA,
+            "checksum": total.hexdigest(),
+            "files": files,
+            "skipped": skipped,
+        }).encode("utf-8")
+
+        # Write atomically so readers never map a half-written bundle
+        tmp_path = bundle_path.with_name(bundle_path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(HEADER.pack(BUNDLE_MAGIC, BUNDLE_FORMAT, len(index), 0))
+            f.write(index)
+            f.write(bodies)
+        os.replace(tmp_path, bundle_path)
+
+        return bundle_path
+
+
+def main():
+    """Command-line entry point for building and checking bundles."""
+    from .loader import TransformLoader, default_prompts_dir, CATALOG_SCHEMA
+
+    parser = argparse.ArgumentParser(description="Build or check the prompt catalog bundle")
+    parser.add_argument("command", choices=["build", "check"])
+    parser.add_argument("prompts_dir", nargs="?", type=Path, default=None,
+                        help="Prompts directory (default: bundled prompts)")
+    parser.add_argument("-o", "--output", type=Path, default=None,
+                        help="Bundle path (default: <prompts_dir>/.catalog.bundle)")
+    args = parser.parse_args()
+
+    prompts_dir = args.prompts_dir or default_prompts_dir()
+    bundle_path = args.output or prompts_dir / BUNDLE_FILENAME
+
+    if args.command == "build":
+        path = CatalogBundle.build(TransformLoader(prompts_dir), bundle_path)
+        bundle = CatalogBundle(path)
+        print(f"Wrote {len(bundle.entries)} prompts to {path} (checksum {bundle.checksum[:12]})")
+        bundle.close()
+    else:
+        bundle = CatalogBundle(bundle_path)
+        stale = bundle.is_stale(prompts_dir, CATALOG_SCHEMA)
+        valid = bundle.verify()
+        print(f"{bundle_path}: {len(bundle.entries)} prompts, "
+              f"{'stale' if stale else 'fresh'}, checksum {'ok' if valid else 'MISMATCH'}")
+        bundle.close()
+        raise SystemExit(0 if valid and not stale else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Edit-script output mode: the model returns find/replace edits, applied locally."""
+
+import json
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from ..api.backend import ChatBackend
+
+# Frontmatter value selecting this mode (``output_mode: edits``)
+EDITS_OUTPUT_MODE = "edits"
+
+# Appended to the system prompt in edit-script mode
+EDIT_SCRIPT_INSTRUCTIONS = """\
+Do not rewrite the text. Instead, respond with only a JSON object listing the \
+changes needed:
+{"edits": [{"find": "exact original text", "replace": "corrected text"}]}
+Rules:
+- "find" must be copied verbatim from the text and occur exactly once in it; \
+include a few surrounding words if needed to make it unique.
+- Edits must not overlap. Keep each edit as short as possible.
+- If nothing needs changing, respond with {"edits": []}."""
+
+_CODE_FENCE = re.compile(r"^```(?:json)?\s*(.*?)\s*```$", re.DOTALL)
+
+Edit = Tuple[str, str]
+
+
+def parse_edit_script(output: str) -> List[Edit]:
+    """Parse a model's edit script.
+
+    Args:
+        output: Model response (JSON, optionally in a code fence)
+
+    Returns:
+        List of (find, replace) pairs
+
+    Raises:
+        ValueError: If the response is not a well-formed edit script
+    """
+    output = output.strip()
+    fenced = _CODE_FENCE.match(output)
+    if fenced:
+        output = fenced.group(1)
+
+    try:
+        data = json.loads(output)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Edit script is not JSON: {e}")
+
+    edits = data.get("edits") if isinstance(data, dict) else None
+    if not isinstance(edits, list):
+        raise ValueError("Edit script has no \"edits\" list")
+
+    parsed = []
+    for edit in edits:
+        if not isinstance(edit, dict):
+            raise ValueError(f"Invalid edit: {edit!r}")
+        find, replace = edit.get("find"), edit.get("replace")
+        if not isinstance(find, str) or not find or not isinstance(replace, str):
+            raise ValueError(f"Invalid edit: {edit!r}")
+        parsed.append((find, replace))
+    return parsed
+
+
+def apply_edits(text: str, edits: List[Edit]) -> str:
+    """Apply find/replace edits anchored in the original text.
+
+    Each find must occur exactly once, or exactly as many times as an
+    identical edit is listed (e.g. the same typo fixed in two places).
+
+    Args:
+        text: Original text
+        edits: (find, replace) pairs
+
+    Returns:
+        Edited text
+
+    Raises:
+        ValueError: If an edit is missing, ambiguous or overlaps another
+    """
+    counts = Counter(edits)
+    spans = []
+    for (find, replace), count in counts.items():
+        starts = [match.start() for match in re.finditer(re.escape(find), text)]
+        if not starts:
+            raise ValueError(f"Edit not found in text: {find!r}")
+        if len(starts) != count:
+            raise ValueError(f"Edit is ambiguous: {find!r}")
+        spans.extend((start, start + len(find), replace) for start in starts)
+
+    spans.sort()
+    parts = []
+    position = 0
+    for start, end, replace in spans:
+        if start < position:
+            raise ValueError("Edits overlap")
+        parts.append(text[position:start])
+        parts.append(replace)
+        position = end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+class EditScriptTransform:
+    """Requests an edit script instead of a rewrite, falling back if it fails.
+
+    Light-touch transformations (``output_mode: edits`` in frontmatter)
+    change a few words of a long text, so generating only the edits needs a
+    fraction of the output tokens. If the script is malformed or does not
+    apply cleanly, the text is rewritten in full with a normal request.
+    """
+
+    def __init__(self, client: ChatBackend):
+        """Initialize edit-script transform.
+
+        Args:
+            client: API client
+        """
+        self.client = client
+        self.edits_applied = 0
+        self.fallbacks = 0
+
+    async def transform_text(
+        self,
+        text: str,
+        prompts: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        **options
+    ) -> str:
+        """Transform text by requesting and applying an edit script.
+
+        Args:
+            text: Text to transform
+            prompts: Transformation prompts
+            user_details: Optional user details to inject
+            **options: Further transform_text options (model, temperature,
+                max_tokens, context)
+
+        Returns:
+            Transformed text
+        """
+        output = await self.client.transform_text(
+            text, prompts, user_details,
+            output_instructions=EDIT_SCRIPT_INSTRUCTIONS,
+            json_mode=True,
+            **options
+        )
+        try:
+            edits = parse_edit_script(output)
+            result = apply_edits(text, edits)
+        except ValueError as e:
+            print(f"Edit script rejected ({e}), rewriting in full")
+            self.fallbacks += 1
+            return await self.client.transform_text(text, prompts, user_details, **options)
+
+        self.edits_applied += len(edits)
+        return result
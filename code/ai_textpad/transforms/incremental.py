@@ -0,0 +1,186 @@
+"""Incremental re-transforms that only resend changed paragraphs."""
+
+import asyncio
+import re
+from typing import Any, Dict, List, Optional
+
+from ..api.backend import ChatBackend
+from ..storage.database import ConfigDatabase
+from .edit_script import EditScriptTransform
+from .pipeline import TransformPipeline
+
+# Blank lines separate paragraphs; the separators are kept for stitching
+PARAGRAPH_BREAK = re.compile(r"(\n[ \t]*\n\s*)")
+
+# Rewrite the whole document in one request when more than this fraction
+# of it (by characters) is not memoized, e.g. on the first run
+FULL_REWRITE_RATIO = 0.5
+
+# Characters of the preceding paragraph sent as context with a changed one
+CONTEXT_CHARS = 600
+
+# Changed paragraphs sent at once
+MAX_PARALLEL = 4
+
+
+def split_paragraphs(text: str) -> List[str]:
+    """Split text into alternating paragraphs and separators.
+
+    Even indices are paragraphs (possibly empty at the ends), odd indices
+    the blank-line separators between them, so ``"".join(parts) == text``.
+
+    Args:
+        text: Document text
+
+    Returns:
+        List of paragraph and separator strings
+    """
+    return PARAGRAPH_BREAK.split(text)
+
+
+def _rewrap(source: str, output: str) -> str:
+    """Give a paragraph output the leading/trailing whitespace of its source."""
+    stripped = source.strip()
+    start = source.index(stripped)
+    return source[:start] + output.strip() + source[start + len(stripped):]
+
+
+class IncrementalTransform:
+    """Transforms a document paragraph by paragraph, memoizing each one.
+
+    Only suitable for paragraph-local, idempotent transformations (spelling
+    and punctuation fixes, regional spelling), marked ``incremental: true``
+    in frontmatter. Outputs are memoized in the step cache by (backend,
+    model, transformation set, user details, options, paragraph hash), and
+    each output is also memoized as mapping to itself, so editing either
+    the original or the transformed text and rerunning only sends the
+    paragraphs that changed, each with the preceding paragraph as context.
+    """
+
+    def __init__(self, client: ChatBackend, db: ConfigDatabase, edit_script: bool = False):
+        """Initialize incremental transform.
+
+        Args:
+            client: API client used for changed paragraphs
+            db: Database instance holding the step cache
+            edit_script: Request edit scripts instead of rewrites
+        """
+        self.client = client
+        self.db = db
+        self.editor = EditScriptTransform(client) if edit_script else None
+        self.paragraphs_sent = 0
+        self.paragraphs_reused = 0
+        self.full_rewrite = False
+
+    def paragraph_key(self, paragraph: str, prompts: List[str],
+                      user_details: Optional[Dict[str, str]],
+                      model: str, options: Dict[str, Any]) -> str:
+        """Build the memo key of one paragraph.
+
+        Args:
+            paragraph: Paragraph text
+            prompts: Transformation prompts, in order
+            user_details: Optional user details injected into the prompt
+            model: Model identifier
+            options: Generation options (temperature, max_tokens)
+
+        Returns:
+            Hex digest identifying the paragraph transform
+        """
+        scope = {**options, "backend": self.client.name, "scope": "paragraph"}
+        return TransformPipeline.step_key(
+            model, "\x00".join(prompts), paragraph, user_details, scope
+        )
+
+    def _remember(self, source: str, output: str, key_args: tuple):
+        """Memoize a paragraph output for its source and for itself."""
+        self.db.set_cached_step(self.paragraph_key(source, *key_args), output)
+        if output != source:
+            self.db.set_cached_step(self.paragraph_key(output, *key_args), output)
+
+    async def _transform(self, text: str, *args, **kwargs) -> str:
+        """Send text to the client (or the edit-script wrapper)."""
+        return await (self.editor or self.client).transform_text(text, *args, **kwargs)
+
+    async def run(
+        self,
+        text: str,
+        prompts: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        model: Optional[str] = None,
+        **options
+    ) -> str:
+        """Transform text, resending only paragraphs without a memoized output.
+
+        Args:
+            text: Text to transform
+            prompts: Transformation prompts
+            user_details: Optional user details to inject
+            model: Model override (default: client model)
+            **options: Generation options passed to transform_text
+
+        Returns:
+            Transformed text
+        """
+        model = model or self.client.model
+        key_args = (prompts, user_details, model, options)
+        parts = split_paragraphs(text)
+
+        outputs: Dict[int, str] = {}
+        missing: List[int] = []
+        for index in range(0, len(parts), 2):
+            if not parts[index].strip():
+                continue
+            cached = self.db.get_cached_step(self.paragraph_key(parts[index], *key_args))
+            if cached is None:
+                missing.append(index)
+            else:
+                outputs[index] = cached
+        self.paragraphs_reused = len(outputs)
+
+        missing_chars = sum(len(parts[index]) for index in missing)
+        if missing and missing_chars > FULL_REWRITE_RATIO * len(text):
+            return await self._full_rewrite(text, parts, prompts, user_details, model, options)
+
+        semaphore = asyncio.Semaphore(MAX_PARALLEL)
+
+        async def transform_paragraph(index: int):
+            context = parts[index - 2][-CONTEXT_CHARS:] if index >= 2 else None
+            async with semaphore:
+                output = await self._transform(
+                    parts[index], prompts, user_details,
+                    model=model, context=context, **options
+                )
+            outputs[index] = output.strip()
+            self._remember(parts[index], outputs[index], key_args)
+
+        await asyncio.gather(*(transform_paragraph(index) for index in missing))
+        self.paragraphs_sent = len(missing)
+
+        return "".join(
+            _rewrap(part, outputs[index]) if index in outputs else part
+            for index, part in enumerate(parts)
+        )
+
+    async def _full_rewrite(self, text: str, parts: List[str], prompts: List[str],
+                            user_details: Optional[Dict[str, str]], model: str,
+                            options: Dict[str, Any]) -> str:
+        """Transform the whole document in one request and memoize its paragraphs.
+
+        Paragraphs are memoized only if the output has as many paragraphs as
+        the input, so they can be paired up.
+        """
+        self.full_rewrite = True
+        self.paragraphs_reused = 0
+        output = await self._transform(
+            text, prompts, user_details, model=model, **options
+        )
+
+        sources = [part for part in parts[0::2] if part.strip()]
+        self.paragraphs_sent = len(sources)
+        results = [part for part in split_paragraphs(output.strip())[0::2] if part.strip()]
+        if len(results) == len(sources):
+            key_args = (prompts, user_details, model, options)
+            for source, result in zip(sources, results):
+                self._remember(source, result, key_args)
+        return output
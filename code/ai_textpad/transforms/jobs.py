@@ -0,0 +1,392 @@
+"""Async workers running jobs from the persistent JobQueue."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from ..storage.database import ConfigDatabase
+from ..storage.job_queue import (
+    CANCELLED, DEFAULT_MAX_ATTEMPTS, DONE, FAILED, PRIORITY_INTERACTIVE, JobQueue
+)
+
+# Job kind of a (possibly pipelined) transform of one document
+TRANSFORM_JOB = "transform"
+
+# Retry backoff: RETRY_BASE * 2 ** (attempt - 1) seconds, capped at RETRY_MAX
+RETRY_BASE = 2.0
+RETRY_MAX = 60.0
+
+# Handler signature: (job, report_progress(fraction, message)) -> JSON result;
+# report_progress also takes partial=..., a preview of the result passed to
+# watch_partial() callbacks (not persisted)
+ProgressCallback = Callable[[float, str], None]
+PartialCallback = Callable[[Any], None]
+JobHandler = Callable[[Dict[str, Any], ProgressCallback], Awaitable[Any]]
+
+
+def retry_delay(error: Exception, attempts: int) -> Optional[float]:
+    """Get how long to wait before retrying after an error.
+
+    Network errors, 429 and 5xx responses are retried with exponential
+    backoff (or the server's Retry-After); anything else is permanent.
+
+    Args:
+        error: Exception raised by the handler
+        attempts: Attempts made so far
+
+    Returns:
+        Delay in seconds, or None if the error should not be retried
+    """
+    import httpx
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status != 429 and status < 500:
+            return None
+        retry_after = error.response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), RETRY_MAX)
+    elif not isinstance(error, httpx.TransportError):
+        return None
+    return min(RETRY_BASE * 2 ** max(attempts - 1, 0), RETRY_MAX)
+
+
+class JobRunner:
+    """Runs queued jobs on a bounded set of asyncio workers.
+
+    Workers claim jobs in priority order, so interactive transforms start
+    before queued batch or chunk jobs. With more than one worker, background
+    jobs (priority above PRIORITY_INTERACTIVE) may only occupy
+    max_workers - 1 of them, keeping a worker free for interactive work.
+    Jobs left unfinished by a previous process are resumed on start().
+    """
+
+    def __init__(self, queue: JobQueue, max_workers: int = 3):
+        """Initialize job runner.
+
+        Args:
+            queue: Persistent job queue
+            max_workers: Maximum jobs running at once
+        """
+        self.queue = queue
+        self.max_workers = max(1, max_workers)
+        self.handlers: Dict[str, JobHandler] = {}
+        self._workers: List[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+        self._running: Dict[int, asyncio.Task] = {}
+        self._background_running = 0
+        self._cancelling: Set[int] = set()
+        self._waiters: Dict[int, List[asyncio.Future]] = {}
+        self._watchers: Dict[int, List[ProgressCallback]] = {}
+        self._partial_watchers: Dict[int, List[PartialCallback]] = {}
+
+    def register(self, kind: str, handler: JobHandler):
+        """Register the coroutine function that runs jobs of a kind.
+
+        Args:
+            kind: Job kind
+            handler: Async handler(job, report_progress) returning a JSON result
+        """
+        self.handlers[kind] = handler
+        self._wakeup.set()
+
+    @property
+    def running(self) -> bool:
+        """Whether the workers have been started."""
+        return bool(self._workers)
+
+    def start(self) -> int:
+        """Start the workers, resuming jobs left by a previous process.
+
+        Returns:
+            Number of interrupted jobs requeued
+        """
+        if self._workers:
+            return 0
+        requeued = self.queue.recover()
+        self._workers = [
+            asyncio.ensure_future(self._worker()) for _ in range(self.max_workers)
+        ]
+        return requeued
+
+    async def stop(self):
+        """Stop the workers; running jobs go back to the queue."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    def submit(self, kind: str, payload: Dict[str, Any],
+               priority: int = PRIORITY_INTERACTIVE,
+               max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> int:
+        """Queue a job and wake a worker.
+
+        Args:
+            kind: Job kind
+            payload: JSON-serializable job input
+            priority: Scheduling priority (lower runs first)
+            max_attempts: Attempts before the job is marked failed
+
+        Returns:
+            Job ID
+        """
+        job_id = self.queue.enqueue(kind, payload, priority, max_attempts)
+        self._wakeup.set()
+        return job_id
+
+    def wait(self, job_id: int) -> "asyncio.Future":
+        """Get a future resolved with the job's result.
+
+        The future raises the handler's last error if the job fails and is
+        cancelled if the job is.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Future of the job result
+        """
+        future = asyncio.get_event_loop().create_future()
+        job = self.queue.get(job_id)
+        if job is None or job['status'] == CANCELLED:
+            future.cancel()
+        elif job['status'] == DONE:
+            future.set_result(job['result'])
+        elif job['status'] == FAILED:
+            future.set_exception(RuntimeError(job['error'] or "Job failed"))
+        else:
+            self._waiters.setdefault(job_id, []).append(future)
+        return future
+
+    def watch(self, job_id: int, callback: ProgressCallback):
+        """Call back with (fraction, message) whenever a job reports progress.
+
+        Args:
+            job_id: Job ID
+            callback: Progress callback
+        """
+        self._watchers.setdefault(job_id, []).append(callback)
+
+    def watch_partial(self, job_id: int, callback: PartialCallback):
+        """Call back with each partial result a job reports while it runs.
+
+        Args:
+            job_id: Job ID
+            callback: Partial result callback
+        """
+        self._partial_watchers.setdefault(job_id, []).append(callback)
+
+    def cancel(self, job_id: int):
+        """Cancel a queued or running job.
+
+        Args:
+            job_id: Job ID
+        """
+        self.queue.cancel(job_id)
+        task = self._running.get(job_id)
+        if task is not None:
+            self._cancelling.add(job_id)
+            task.cancel()
+        else:
+            self._finish(job_id, cancelled=True)
+
+    def _finish(self, job_id: int, result: Any = None,
+                error: Optional[Exception] = None, cancelled: bool = False):
+        """Resolve a job's waiters and drop its watchers."""
+        self._watchers.pop(job_id, None)
+        self._partial_watchers.pop(job_id, None)
+        for future in self._waiters.pop(job_id, []):
+            if future.done():
+                continue
+            if cancelled:
+                future.cancel()
+            elif error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _report(self, job_id: int, progress: float, message: str = "",
+                partial: Any = None):
+        """Store a job's progress and notify its watchers."""
+        self.queue.set_progress(job_id, progress, message)
+        for callback in list(self._watchers.get(job_id, [])):
+            try:
+                callback(progress, message)
+            except Exception as e:
+                print(f"Job progress callback failed: {e}")
+        if partial is not None:
+            for callback in list(self._partial_watchers.get(job_id, [])):
+                try:
+                    callback(partial)
+                except Exception as e:
+                    print(f"Job partial result callback failed: {e}")
+
+    def _max_priority(self) -> Optional[int]:
+        """Get the lowest-urgency priority a free worker may claim now."""
+        if self.max_workers > 1 and self._background_running >= self.max_workers - 1:
+            return PRIORITY_INTERACTIVE
+        return None
+
+    def _claim(self) -> Optional[Dict[str, Any]]:
+        """Claim the next job this worker may run."""
+        return self.queue.claim(self.handlers, self._max_priority())
+
+    async def _worker(self):
+        """Claim and run jobs until stopped."""
+        while True:
+            job = self._claim()
+            if job is None:
+                # Sleep until a job is submitted, a background slot frees up
+                # or a backed-off job is due
+                timeout = self.queue.next_retry_in(self.handlers, self._max_priority())
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run(job)
+
+    async def _run(self, job: Dict[str, Any]):
+        """Run one claimed job and record its outcome."""
+        job_id = job['id']
+        background = job['priority'] > PRIORITY_INTERACTIVE
+        handler = self.handlers[job['kind']]
+
+        task = asyncio.ensure_future(
+            handler(job, lambda progress, message="", partial=None:
+                    self._report(job_id, progress, message, partial))
+        )
+        self._running[job_id] = task
+        if background:
+            self._background_running += 1
+        try:
+            result = await task
+        except asyncio.CancelledError:
+            if job_id in self._cancelling:
+                self._finish(job_id, cancelled=True)
+                return
+            # The worker itself is stopping: leave the job for the next start
+            task.cancel()
+            self.queue.requeue(job_id)
+            raise
+        except Exception as e:
+            delay = retry_delay(e, job['attempts'])
+            if self.queue.fail(job_id, str(e), delay):
+                print(f"Job {job_id} failed ({e}), retrying in {delay:.0f}s")
+                self._report(job_id, 0.0, f"Retrying in {delay:.0f}s...")
+            else:
+                self._finish(job_id, error=e)
+            return
+        finally:
+            self._running.pop(job_id, None)
+            self._cancelling.discard(job_id)
+            if background:
+                self._background_running -= 1
+                # Workers held back by the background cap may claim again
+                self._wakeup.set()
+
+        self.queue.complete(job_id, result)
+        self._finish(job_id, result=result)
+
+
+def transform_job_handler(db: ConfigDatabase, get_backends: Callable[[], Any]) -> JobHandler:
+    """Build the handler for TRANSFORM_JOB jobs.
+
+    The payload holds the source ``text``, the ``prompts`` and their
+    frontmatter ``metadata`` in order, and ``pipeline`` (run one step at a
+    time with step caching). The result holds every ``outputs`` step (the
+    last is final), step counts and token usage. Structured (JSON)
+    transforms report the validated part of their output as partial results.
+
+    Args:
+        db: Database instance (user details, step cache)
+        get_backends: Returns the shared BackendRegistry
+
+    Returns:
+        Async job handler
+    """
+    from ..api.backend import metered_usage
+    from .edit_script import EDITS_OUTPUT_MODE, EditScriptTransform
+    from .incremental import IncrementalTransform
+    from .pipeline import TransformPipeline
+    from .structured import STRUCTURED_OUTPUT_FORMAT, StructuredTransform
+    from .templates import referenced_details
+
+    async def run(job: Dict[str, Any], report_progress: ProgressCallback) -> Dict[str, Any]:
+        # Token usage of this job's own requests only
+        with metered_usage() as usage:
+            result = await transform(job, report_progress)
+        result['prompt_tokens'] = usage.prompt_tokens
+        result['cached_tokens'] = usage.cached_tokens
+        return result
+
+    async def transform(job: Dict[str, Any], report_progress: ProgressCallback) -> Dict[str, Any]:
+        report_progress(0.0, "Transforming...")
+        payload = job['payload']
+        prompts = payload['prompts']
+        metadata = payload.get('metadata') or [{} for _ in prompts]
+
+        backends = get_backends()
+        # Only details the prompts refer to, so others don't affect cache keys
+        user_details = referenced_details(prompts, db.get_all_user_details()) or None
+        started = time.perf_counter()
+
+        result: Dict[str, Any] = {"steps_computed": 0, "steps_reused": 0}
+        if payload.get('pipeline') and len(prompts) > 1:
+            def on_step(index: int, output: str, from_cache: bool):
+                source = "cached" if from_cache else "done"
+                report_progress((index + 1) / len(prompts),
+                                f"Step {index + 1}/{len(prompts)} {source}...")
+
+            pipeline = TransformPipeline(backends.get(), db, backends)
+            result['outputs'] = await pipeline.run(
+                payload['text'],
+                prompts,
+                user_details,
+                on_step=on_step,
+                step_options=backends.step_options(metadata)
+            )
+            result['steps_computed'] = pipeline.steps_computed
+            result['steps_reused'] = pipeline.steps_reused
+        else:
+            # Route to the backend/model/limits requested by the transformations
+            client, options = backends.route(metadata)
+            edit_script = bool(metadata) and all(
+                m.get('output_mode') == EDITS_OUTPUT_MODE for m in metadata
+            )
+            editor = None
+            if metadata and all(
+                m.get('output_format') == STRUCTURED_OUTPUT_FORMAT for m in metadata
+            ):
+                # Streamed JSON, validated as it arrives and retried early
+                structured = StructuredTransform(client)
+                output = await structured.transform_text(
+                    payload['text'], prompts, user_details,
+                    on_preview=lambda preview: report_progress(
+                        0.5, "Receiving JSON...", partial=preview
+                    ),
+                    **options
+                )
+                result['json_retries'] = structured.retries
+            elif metadata and all(m.get('incremental') for m in metadata):
+                # Paragraph-local transformations: resend only changed paragraphs
+                incremental = IncrementalTransform(client, db, edit_script)
+                output = await incremental.run(payload['text'], prompts, user_details, **options)
+                result['paragraphs_sent'] = incremental.paragraphs_sent
+                result['paragraphs_reused'] = incremental.paragraphs_reused
+                editor = incremental.editor
+            elif edit_script:
+                editor = EditScriptTransform(client)
+                output = await editor.transform_text(payload['text'], prompts, user_details, **options)
+            else:
+                output = await client.transform_text(payload['text'], prompts, user_details, **options)
+            result['outputs'] = [output]
+            if editor is not None:
+                result['edits_applied'] = editor.edits_applied
+                result['edit_fallbacks'] = editor.fallbacks
+
+        result['seconds'] = round(time.perf_counter() - started, 3)
+        return result
+
+    return run
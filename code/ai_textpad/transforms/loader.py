@@ -1,51 +1,229 @@
 """Loader for transformation prompts from files."""
 
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import Any, List, Dict, Optional, Tuple
 import re
 
+from ..storage.database import ConfigDatabase
+from .catalog_bundle import BUNDLE_FILENAME, CatalogBundle, scan_prompt_files
+from .templates import compile_template
+
+# Bump when the way prompt files are parsed changes, so that previously
+# seeded default transformations are re-imported on the next start.
+CATALOG_SCHEMA = 7
+
+# (name, category, prompt_content, metadata, source_path relative to prompts_dir)
+PromptEntry = Tuple[str, str, str, Dict[str, Any], str]
+
+# Frontmatter keys understood by the request router, with their value types
+FRONTMATTER_KEYS = {
+    "model": str,
+    "temperature": float,
+    "max_tokens": int,
+    "output_format": str,
+    "backend": str,
+}
+
+
+def default_prompts_dir() -> Path:
+    """Get the bundled prompts directory (repo_root/prompts).
+
+    Returns:
+        Path to prompts directory
+    """
+    return Path(__file__).parent.parent.parent.parent / "prompts"
+
+
+def default_transformations_outdated(db: ConfigDatabase, loader: "TransformLoader") -> bool:
+    """Check whether the seeded default transformations need (re)loading.
+
+    Defaults are (re)loaded on first run, when they were seeded by an older
+    catalog schema, or when a fresh catalog bundle reports a different
+    checksum than the one last imported.
+
+    Args:
+        db: Database instance
+        loader: Loader for the prompts directory
+
+    Returns:
+        True if defaults should be loaded
+    """
+    if not db.get_categories():
+        return True
+    if db.get_config("catalog_schema", 1) < CATALOG_SCHEMA:
+        return True
+    checksum = loader.bundle_checksum()
+    return checksum is not None and checksum != db.get_config("catalog_checksum")
+
+
+def store_default_transformations(db: ConfigDatabase, loader: "TransformLoader",
+                                  transformations: List[PromptEntry]):
+    """Replace seeded defaults with freshly loaded transformations.
+
+    Args:
+        db: Database instance
+        loader: Loader the transformations came from
+        transformations: Result of loader.load_from_directory()
+    """
+    if not transformations:
+        return
+
+    # Replace previously seeded defaults in one transaction
+    db.replace_default_transformations(transformations)
+    db.set_config("catalog_schema", CATALOG_SCHEMA)
+    if loader.catalog_checksum:
+        db.set_config("catalog_checksum", loader.catalog_checksum)
+
+    print(f"Loaded {len(transformations)} transformations from {loader.prompts_dir}")
+
+
+def load_default_transformations(db: ConfigDatabase):
+    """Load default transformations from prompts directory if not already loaded.
+
+    Args:
+        db: Database instance
+    """
+    # Find prompts directory
+    prompts_dir = default_prompts_dir()
+    loader = TransformLoader(prompts_dir)
+
+    try:
+        # Check if transformations already loaded
+        if not default_transformations_outdated(db, loader):
+            return
+
+        if not prompts_dir.exists():
+            print(f"Warning: Prompts directory not found at {prompts_dir}")
+            return
+
+        store_default_transformations(db, loader, loader.load_from_directory())
+    finally:
+        loader.close()
+
 
 class TransformLoader:
-    """Loads transformation prompts from filesystem."""
+    """Loads transformation prompts from filesystem.
 
-    def __init__(self, prompts_dir: Path):
+    The catalog bundle is looked up (mapped and checked against the
+    prompts directory) at most once per loader, so checking whether the
+    defaults are outdated and loading them share one lookup. Call close()
+    when done.
+    """
+
+    def __init__(self, prompts_dir: Path, bundle_path: Optional[Path] = None):
         """Initialize transformation loader.
 
         Args:
             prompts_dir: Directory containing transformation prompt files
+            bundle_path: Prebuilt catalog bundle (default: prompts_dir/.catalog.bundle)
         """
         self.prompts_dir = Path(prompts_dir)
+        self.bundle_path = Path(bundle_path) if bundle_path else self.prompts_dir / BUNDLE_FILENAME
+        self.catalog_checksum: Optional[str] = None
+        self._bundle: Optional[CatalogBundle] = None
+        self._bundle_checked = False
+
+    def _open_bundle(self) -> Optional[CatalogBundle]:
+        """Open the catalog bundle if it is up to date with the prompts directory.
+
+        Later calls return the bundle opened by the first one.
+        """
+        if not self._bundle_checked:
+            self._bundle_checked = True
+            if self.prompts_dir.exists():
+                self._bundle = CatalogBundle.open_if_fresh(
+                    self.bundle_path, self.prompts_dir, CATALOG_SCHEMA
+                )
+        return self._bundle
 
-    def load_from_directory(self) -> List[Tuple[str, str, str]]:
+    def close(self):
+        """Release the catalog bundle (the next load looks it up again)."""
+        if self._bundle is not None:
+            self._bundle.close()
+        self._bundle = None
+        self._bundle_checked = False
+
+    def bundle_checksum(self) -> Optional[str]:
+        """Get the checksum of a fresh catalog bundle.
+
+        Returns:
+            Bundle checksum, or None if there is no usable bundle
+        """
+        bundle = self._open_bundle()
+        return bundle.checksum if bundle is not None else None
+
+    def load_from_directory(self) -> List[PromptEntry]:
         """Load all transformations from prompts directory.
 
+        Uses the prebuilt catalog bundle when it is fresh, otherwise scans
+        the directory.
+
         Returns:
-            List of tuples: (name, category, prompt_content)
+            List of tuples: (name, category, prompt_content, metadata, source_path)
         """
         transformations = []
 
         if not self.prompts_dir.exists():
             return transformations
 
-        # Recursively find all markdown files
-        for prompt_file in self.prompts_dir.rglob("*.md"):
-            name, category, content = self._parse_prompt_file(prompt_file)
-            if content:
-                transformations.append((name, category, content))
+        bundle = self._open_bundle()
+        if bundle is not None:
+            self.catalog_checksum = bundle.checksum
+            transformations = list(bundle.iter_transformations())
+            # Templates are cached by prompt text, so requests reuse these
+            for entry in transformations:
+                compile_template(entry[2])
+            return transformations
+
+        # Same files the bundle is built from (hidden directories skipped)
+        for rel_path in sorted(scan_prompt_files(self.prompts_dir)):
+            entry = self.parse_file(self.prompts_dir / rel_path)
+            if entry:
+                transformations.append(entry)
 
         return transformations
 
-    def _parse_prompt_file(self, file_path: Path) -> Tuple[str, str, str]:
+    def parse_file(self, file_path: Path) -> Optional[PromptEntry]:
+        """Parse a single prompt file inside the prompts directory.
+
+        Args:
+            file_path: Path to prompt file
+
+        Returns:
+            Prompt entry tuple, or None if the file is missing or has no content
+        """
+        file_path = Path(file_path)
+        if not file_path.is_file():
+            return None
+        name, category, content, metadata = self._parse_prompt_file(file_path)
+        if not content:
+            return None
+        compile_template(content)
+        return name, category, content, metadata, self.source_path(file_path)
+
+    def source_path(self, file_path: Path) -> str:
+        """Get the path of a prompt file relative to the prompts directory.
+
+        Args:
+            file_path: Path to prompt file
+
+        Returns:
+            Relative path string used to identify the file in the database
+        """
+        return str(Path(file_path).relative_to(self.prompts_dir))
+
+    def _parse_prompt_file(self, file_path: Path) -> Tuple[str, str, str, Dict[str, Any]]:
         """Parse a prompt file and extract metadata.
 
         Args:
             file_path: Path to prompt file
 
         Returns:
-            Tuple of (name, category, content)
+            Tuple of (name, category, content, metadata)
         """
         try:
             content = file_path.read_text(encoding="utf-8")
+            metadata, content = self._parse_frontmatter(content)
 
             # Extract category from directory structure
             relative_path = file_path.relative_to(self.prompts_dir)
@@ -62,24 +240,65 @@ class TransformLoader:
             if title_match:
                 name = title_match.group(1).strip()
 
-            return name, category, content.strip()
+            return name, category, content.strip(), metadata
 
         except Exception as e:
             print(f"Error parsing {file_path}: {e}")
-            return "", "", ""
+            return "", "", "", {}
+
+    @staticmethod
+    def _parse_frontmatter(content: str) -> Tuple[Dict[str, Any], str]:
+        """Split optional YAML frontmatter from a prompt file.
+
+        Only flat ``key: value`` pairs are supported, which covers the
+        routing options (model, temperature, max_tokens, output_format, backend).
+
+        Args:
+            content: Raw file content
+
+        Returns:
+            Tuple of (metadata, content without frontmatter)
+        """
+        match = re.match(r'^---[ \t]*\r?\n(.*?)\r?\n---[ \t]*(?:\r?\n|$)', content, re.DOTALL)
+        if not match:
+            return {}, content
+
+        metadata: Dict[str, Any] = {}
+        for line in match.group(1).splitlines():
+            line = line.strip()
+            if not line or line.startswith("#") or ":" not in line:
+                continue
+            key, value = line.split(":", 1)
+            key = key.strip().lower().replace("-", "_")
+            value = value.split(" #", 1)[0].strip().strip("\"'")
+            if not value:
+                continue
+
+            value_type = FRONTMATTER_KEYS.get(key)
+            try:
+                if value_type is not None:
+                    metadata[key] = value_type(value)
+                elif value.lower() in ("true", "false"):
+                    metadata[key] = value.lower() == "true"
+                else:
+                    metadata[key] = value
+            except ValueError:
+                print(f"Ignoring invalid frontmatter value {key}: {value}")
+
+        return metadata, content[match.end():]
 
-    def categorize_transformations(self, transformations: List[Tuple[str, str, str]]) -> Dict[str, List[Tuple[str, str]]]:
+    def categorize_transformations(self, transformations: List[PromptEntry]) -> Dict[str, List[Tuple[str, str]]]:
         """Organize transformations by category.
 
         Args:
-            transformations: List of (name, category, prompt) tuples
+            transformations: List of prompt entry tuples
 
         Returns:
             Dictionary mapping category -> list of (name, prompt) tuples
         """
         categorized = {}
 
-        for name, category, prompt in transformations:
+        for name, category, prompt, *_ in transformations:
             if category not in categorized:
                 categorized[category] = []
             categorized[category].append((name, prompt))
@@ -0,0 +1,118 @@
+"""Sequential pipeline execution of transformations with per-step caching."""
+
+import hashlib
+import json
+from typing import Any, Callable, Dict, List, Optional
+
+from ..api.backend import ChatBackend
+from ..api.backends import BackendRegistry
+from ..storage.database import ConfigDatabase
+from .templates import referenced_details
+
+
+class TransformPipeline:
+    """Runs transformations one at a time, caching each intermediate result.
+
+    Each step is cached by (model, step prompt, user details, input hash).
+    Because a step's input is the previous step's output, editing or
+    appending a later step reuses every cached step before it and only the
+    changed tail is sent to the API.
+    """
+
+    def __init__(self, client: ChatBackend, db: ConfigDatabase,
+                 backends: Optional[BackendRegistry] = None):
+        """Initialize pipeline.
+
+        Args:
+            client: API client used for uncached steps
+            db: Database instance holding the step cache
+            backends: Registry resolving per-step ``backend`` options
+                (default: every step uses client)
+        """
+        self.client = client
+        self.db = db
+        self.backends = backends
+        self.steps_computed = 0
+        self.steps_reused = 0
+
+    @staticmethod
+    def step_key(
+        model: str,
+        prompt: str,
+        text: str,
+        user_details: Optional[Dict[str, str]] = None,
+        options: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the cache key for a single pipeline step.
+
+        Args:
+            model: Model identifier
+            prompt: Step transformation prompt
+            text: Step input text
+            user_details: Optional user details injected into the prompt
+            options: Optional generation options (temperature, max_tokens)
+
+        Returns:
+            Hex digest identifying the step
+        """
+        input_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        details = json.dumps(user_details or {}, sort_keys=True)
+        extra = json.dumps(options or {}, sort_keys=True)
+        key_source = "\x00".join([model, prompt, details, extra, input_hash])
+        return hashlib.sha256(key_source.encode("utf-8")).hexdigest()
+
+    async def run(
+        self,
+        text: str,
+        prompts: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        on_step: Optional[Callable[[int, str, bool], None]] = None,
+        model: Optional[str] = None,
+        step_options: Optional[List[Dict[str, Any]]] = None
+    ) -> List[str]:
+        """Apply prompts in order, feeding each output into the next step.
+
+        Args:
+            text: Input text for the first step
+            prompts: Transformation prompts, in execution order
+            user_details: Optional user details to inject
+            on_step: Optional callback(step_index, output, from_cache)
+            model: Model override (default: client model)
+            step_options: Optional per-step routing (model, temperature,
+                max_tokens, backend), see BackendRegistry.step_options
+
+        Returns:
+            List of intermediate outputs, one per step (last is final result)
+        """
+        model = model or self.client.model
+        outputs = []
+        current = text
+
+        for index, prompt in enumerate(prompts):
+            options = dict(step_options[index]) if step_options else {}
+            step_model = options.pop("model", None) or model
+            key = self.step_key(
+                step_model, prompt, current, referenced_details([prompt], user_details), options
+            )
+            backend = options.pop("backend", None)
+            output = self.db.get_cached_step(key)
+            from_cache = output is not None
+
+            if from_cache:
+                self.steps_reused += 1
+            else:
+                client = self.client
+                if backend and self.backends is not None:
+                    client = self.backends.get(backend)
+                output = await client.transform_text(
+                    current, [prompt], user_details, model=step_model, **options
+                )
+                self.db.set_cached_step(key, output)
+                self.steps_computed += 1
+
+            outputs.append(output)
+            if on_step:
+                on_step(index, output, from_cache)
+            current = output
+
+        return outputs
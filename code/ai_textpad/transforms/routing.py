@@ -0,0 +1,67 @@
+"""Per-transformation request routing from prompt frontmatter."""
+
+from typing import Any, Dict, List, Optional
+
+# Backend used when frontmatter doesn't name one
+DEFAULT_BACKEND = "openrouter"
+
+
+def resolve_backend(
+    metadata_list: List[Dict[str, Any]],
+    default_backend: str = DEFAULT_BACKEND
+) -> str:
+    """Resolve which backend serves a set of transformations.
+
+    The preferred backend is used only if every transformation names the
+    same one (like model), otherwise the default backend.
+
+    Args:
+        metadata_list: Frontmatter metadata of each selected transformation
+        default_backend: Backend used when none (or several) are named
+
+    Returns:
+        Backend name
+    """
+    backends = {m.get("backend") for m in metadata_list}
+    backend = backends.pop() if len(backends) == 1 else None
+    return backend or default_backend
+
+
+def resolve_request_options(
+    metadata_list: List[Dict[str, Any]],
+    default_model: str,
+    default_temperature: float = 0.0
+) -> Dict[str, Any]:
+    """Resolve model and generation limits for a set of transformations.
+
+    When several transformations are merged into one request:
+
+    - model: the preferred model if every transformation names the same
+      one, otherwise the default model
+    - temperature: the first temperature given, otherwise the default
+    - max_tokens: the largest limit, but only if every transformation sets
+      one (a single unbounded transformation makes the request unbounded)
+
+    Args:
+        metadata_list: Frontmatter metadata of each selected transformation
+        default_model: Model selected in settings
+        default_temperature: Temperature used when none is given
+
+    Returns:
+        Dictionary with model, temperature and max_tokens keys
+    """
+    models = {m.get("model") for m in metadata_list}
+    model = models.pop() if len(models) == 1 else None
+    model = model or default_model
+
+    temperature = next(
+        (m["temperature"] for m in metadata_list if m.get("temperature") is not None),
+        default_temperature
+    )
+
+    max_tokens: Optional[int] = None
+    limits = [m.get("max_tokens") for m in metadata_list]
+    if limits and all(limits):
+        max_tokens = max(limits)
+
+    return {"model": model, "temperature": temperature, "max_tokens": max_tokens}
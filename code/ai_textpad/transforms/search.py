@@ -0,0 +1,208 @@
+"""Fuzzy, ranked search over transformations using a trigram index."""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Field weights in integer units: a full trigram match on the name (5) outranks
+# category (3) and prompt keywords (2)
+FIELD_WEIGHTS = {"name": 5, "category": 3, "keywords": 2}
+WEIGHT_SCALE = FIELD_WEIGHTS["name"]
+
+# Bonus when the normalized query appears verbatim in the name
+SUBSTRING_BONUS = 0.5
+
+# Results scoring below this are dropped
+MIN_SCORE = 0.35
+
+# Prompt words indexed per transformation
+MAX_KEYWORDS = 10
+
+# Abbreviations users type, matched as an alternative spelling of the word
+QUERY_ALIASES = {"uk": "british", "us": "american", "gb": "british"}
+
+STOPWORDS = frozenset("""
+    a about above after all also an and any are as at be because been before being
+    below between both but by can could did do does doing down during each few for
+    from further had has have having here how if in into is it its itself just more
+    most must no nor not now of off on once only or other out over own same should
+    so some such than that the their them then there these they this those through
+    to too under until up very was were what when where which while who whom why
+    will with would you your yours text user users output input provide provided
+    following ensure make sure please return response format write rewrite
+""".split())
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text: str) -> List[str]:
+    """Lowercase text and split it into alphanumeric words."""
+    return _WORD.findall(text.lower())
+
+
+def trigrams(words: Iterable[str]) -> Set[str]:
+    """Get padded character trigrams of words.
+
+    Words are padded with one space on each side, so " sh" marks a word start
+    and "re " a word end; two-letter words yield their single padded trigram.
+
+    Args:
+        words: Normalized words
+
+    Returns:
+        Set of trigrams
+    """
+    grams = set()
+    for word in words:
+        padded = f" {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def prompt_keywords(prompt: str, limit: int = MAX_KEYWORDS) -> List[str]:
+    """Pick the most frequent distinctive words of a prompt.
+
+    Args:
+        prompt: Prompt text
+        limit: Maximum number of keywords
+
+    Returns:
+        Keywords, most frequent first
+    """
+    counts = Counter(
+        word for word in normalize(prompt)
+        if len(word) > 3 and word not in STOPWORDS and not word.isdigit()
+    )
+    return [word for word, _ in counts.most_common(limit)]
+
+
+class TrigramIndex:
+    """Inverted trigram index over transformation names, categories and prompts."""
+
+    def __init__(self):
+        """Initialize empty index."""
+        # (field, trigram) -> IDs of transformations containing it
+        self.postings: Dict[Tuple[str, str], Set[int]] = {}
+        # trigram -> IDs repeated once per weight unit of each field containing
+        # it, so scoring is a single C-level Counter.update per trigram
+        self._weighted: Dict[str, Tuple[int, ...]] = {}
+        self._doc_grams: Dict[int, List[Tuple[str, str]]] = {}
+        self._names: Dict[int, str] = {}
+
+    @classmethod
+    def from_transformations(cls, transformations: Iterable[dict]) -> "TrigramIndex":
+        """Build an index over transformations.
+
+        Args:
+            transformations: Transformation dictionaries
+
+        Returns:
+            Populated index
+        """
+        index = cls()
+        for trans in transformations:
+            index.add(trans)
+        return index
+
+    def __len__(self) -> int:
+        """Number of indexed transformations."""
+        return len(self._doc_grams)
+
+    def add(self, trans: dict):
+        """Index (or re-index) a transformation.
+
+        Args:
+            trans: Transformation dictionary with id, name, category and prompt
+        """
+        transformation_id = trans['id']
+        self.remove(transformation_id)
+
+        fields = {
+            "name": normalize(trans['name']),
+            "category": normalize(trans['category']),
+            "keywords": prompt_keywords(trans.get('prompt') or ""),
+        }
+        keys = [(field, gram) for field, words in fields.items() for gram in trigrams(words)]
+        for key in keys:
+            self.postings.setdefault(key, set()).add(transformation_id)
+            self._weighted.pop(key[1], None)
+        self._doc_grams[transformation_id] = keys
+        self._names[transformation_id] = " ".join(fields["name"])
+
+    def remove(self, transformation_id: int):
+        """Drop a transformation from the index if present.
+
+        Args:
+            transformation_id: Transformation ID
+        """
+        for key in self._doc_grams.pop(transformation_id, []):
+            ids = self.postings.get(key)
+            if ids is not None:
+                ids.discard(transformation_id)
+                if not ids:
+                    del self.postings[key]
+            self._weighted.pop(key[1], None)
+        self._names.pop(transformation_id, None)
+
+    def _weighted_postings(self, gram: str) -> Tuple[int, ...]:
+        """Get (and cache) the weight-repeated posting list of a trigram."""
+        postings = self._weighted.get(gram)
+        if postings is None:
+            postings = tuple(
+                transformation_id
+                for field, weight in FIELD_WEIGHTS.items()
+                for transformation_id in self.postings.get((field, gram), ())
+                for _ in range(weight)
+            )
+            self._weighted[gram] = postings
+        return postings
+
+    def _score(self, words: List[str]) -> Dict[int, float]:
+        """Score transformations against already-normalized query words."""
+        grams = trigrams(words)
+        if not grams:
+            return {}
+
+        units: Counter = Counter()
+        for gram in grams:
+            units.update(self._weighted_postings(gram))
+
+        full = WEIGHT_SCALE * len(grams)
+        needed = MIN_SCORE * full
+        return {
+            transformation_id: count / full
+            for transformation_id, count in units.items() if count >= needed
+        }
+
+    def search(self, query: str, limit: int = 0) -> List[Tuple[int, float]]:
+        """Rank transformations against a query.
+
+        A transformation scores the fraction of query trigrams found in each
+        field, weighted by FIELD_WEIGHTS relative to the name; a verbatim name
+        match adds SUBSTRING_BONUS. Abbreviations in QUERY_ALIASES are also
+        tried spelled out, keeping the better score.
+
+        Args:
+            query: Search text (typos and abbreviations tolerated)
+            limit: Maximum results (0 = all above MIN_SCORE)
+
+        Returns:
+            List of (transformation ID, score), best first
+        """
+        words = normalize(query)
+        if not words:
+            return []
+
+        scores = self._score(words)
+        expanded = [QUERY_ALIASES.get(word, word) for word in words]
+        if expanded != words:
+            for transformation_id, score in self._score(expanded).items():
+                scores[transformation_id] = max(score, scores.get(transformation_id, 0.0))
+
+        phrase = " ".join(words)
+        for transformation_id in scores:
+            if phrase in self._names[transformation_id]:
+                scores[transformation_id] += SUBSTRING_BONUS
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self._names[item[0]]))
+        return ranked[:limit] if limit else ranked
@@ -0,0 +1,180 @@
+"""Speculative background transforms of pinned transformations on paste."""
+
+import asyncio
+from datetime import date
+from typing import Any, Dict, Hashable, List, Optional
+
+from ..storage.database import ConfigDatabase
+from ..storage.job_queue import PRIORITY_BATCH, JobQueue
+from .jobs import JobRunner
+
+# Job kind of speculative transforms (never resumed after a restart)
+SPECULATIVE_JOB = "speculative_transform"
+
+# Quiet period after a paste before speculating
+DEBOUNCE_SECONDS = 0.8
+
+# Shorter pastes are not worth a speculative request
+MIN_CHARS = 200
+
+# Default daily cap on speculative spend, in estimated tokens (0 disables)
+DEFAULT_DAILY_TOKENS = 100_000
+
+# Rough token estimate for budgeting
+CHARS_PER_TOKEN = 4
+
+# Maximum pinned transformations
+MAX_PINS = 3
+
+
+def estimate_tokens(text: str, prompt: str) -> int:
+    """Estimate the tokens a transform spends (prompt and a same-size output).
+
+    Args:
+        text: Text to transform
+        prompt: Transformation prompt
+
+    Returns:
+        Estimated total tokens
+    """
+    return (2 * len(text) + len(prompt)) // CHARS_PER_TOKEN
+
+
+class Speculation:
+    """Speculative transforms of one text, keyed by pinned prompt file."""
+
+    def __init__(self, text: str):
+        """Initialize speculation.
+
+        Args:
+            text: Text the transformations apply to
+        """
+        self.text = text
+        self.task: Optional[asyncio.Task] = None
+        self.results: Dict[str, "asyncio.Future"] = {}
+
+
+class SpeculativeTransforms:
+    """Runs pinned transformations ahead of the click that asks for them.
+
+    After a paste (and DEBOUNCE_SECONDS without another), each pinned
+    transformation of the pasted text is queued as a background job. A
+    click on the pinned action then takes the ready (or in-flight) result
+    instead of starting a request. Speculations are discarded, and their
+    jobs cancelled, as soon as the text changes. Spend is capped per day by
+    the "speculative_daily_tokens" setting.
+    """
+
+    def __init__(self, db: ConfigDatabase, runner: JobRunner, queue: JobQueue):
+        """Initialize speculative transforms.
+
+        Args:
+            db: Database instance holding settings and the spend counter
+            runner: Job runner executing speculative jobs
+            queue: Job queue (finished speculative rows are deleted)
+        """
+        self.db = db
+        self.runner = runner
+        self.queue = queue
+        self.speculations: Dict[Hashable, Speculation] = {}
+        self.hits = 0
+
+    def daily_cap(self) -> int:
+        """Get the daily speculative budget in estimated tokens (0: disabled)."""
+        return int(self.db.get_config("speculative_daily_tokens", DEFAULT_DAILY_TOKENS))
+
+    def spent_today(self) -> int:
+        """Get the estimated tokens spent speculatively today."""
+        spend = self.db.get_config("speculative_spend") or {}
+        return spend.get("tokens", 0) if spend.get("date") == date.today().isoformat() else 0
+
+    def _reserve(self, tokens: int) -> bool:
+        """Charge tokens to today's budget if they fit."""
+        spent = self.spent_today()
+        if spent + tokens > self.daily_cap():
+            return False
+        self.db.set_config(
+            "speculative_spend", {"date": date.today().isoformat(), "tokens": spent + tokens}
+        )
+        return True
+
+    def schedule(self, owner: Hashable, text: str, pins: List[Dict[str, Any]]):
+        """Speculate on freshly pasted text, replacing any earlier speculation.
+
+        Args:
+            owner: Document the text belongs to
+            text: Text the pinned transformations would apply to
+            pins: Pinned transformation dictionaries (source_path, prompt, metadata)
+        """
+        self.discard(owner)
+        if not pins or len(text) < MIN_CHARS or self.daily_cap() <= 0:
+            return
+        speculation = Speculation(text)
+        speculation.task = asyncio.ensure_future(self._start(speculation, pins))
+        self.speculations[owner] = speculation
+
+    async def _start(self, speculation: Speculation, pins: List[Dict[str, Any]]):
+        """Queue one background job per pinned transformation after the debounce."""
+        await asyncio.sleep(DEBOUNCE_SECONDS)
+        for pin in pins:
+            if not self._reserve(estimate_tokens(speculation.text, pin['prompt'])):
+                print("Speculative transform budget reached for today")
+                return
+            job_id = self.runner.submit(SPECULATIVE_JOB, {
+                "text": speculation.text,
+                "prompts": [pin['prompt']],
+                "metadata": [pin.get('metadata') or {}],
+                "pipeline": False,
+            }, PRIORITY_BATCH, max_attempts=1)
+            result = self.runner.wait(job_id)
+            result.add_done_callback(lambda result, job_id=job_id: self._settle(job_id, result))
+            speculation.results[pin['source_path']] = result
+
+    def _settle(self, job_id: int, result: "asyncio.Future"):
+        """Drop a finished speculative job, cancelling it if its result was abandoned."""
+        if result.cancelled():
+            self.runner.cancel(job_id)
+        self.queue.delete(job_id)
+
+    def take(self, owner: Hashable, text: str, source_path: str) -> Optional["asyncio.Future"]:
+        """Take the speculative result of a pinned transformation, if it matches.
+
+        The document's remaining speculation is discarded. Cancelling the
+        returned future cancels the job.
+
+        Args:
+            owner: Document the click came from
+            text: Text the transformation is applied to now
+            source_path: Prompt file of the pinned transformation
+
+        Returns:
+            Future of the job result (possibly already done), or None
+        """
+        speculation = self.speculations.get(owner)
+        result = None
+        if speculation is not None and speculation.text == text:
+            result = speculation.results.pop(source_path, None)
+        self.discard(owner)
+        if result is not None:
+            self.hits += 1
+        return result
+
+    def discard(self, owner: Hashable, text: Optional[str] = None):
+        """Cancel a document's speculation.
+
+        Args:
+            owner: Document
+            text: If given, only discard a speculation on different text
+        """
+        speculation = self.speculations.get(owner)
+        if speculation is None or speculation.text == text:
+            return
+        del self.speculations[owner]
+        speculation.task.cancel()
+        for result in speculation.results.values():
+            result.cancel()
+
+    def purge(self):
+        """Delete speculative jobs left by a previous process."""
+        for job in self.queue.jobs(SPECULATIVE_JOB):
+            self.queue.delete(job['id'])
@@ -0,0 +1,295 @@
+"""JSON output mode: streamed, validated as it arrives, rendered progressively."""
+
+import json
+import re
+from contextlib import aclosing
+from typing import Callable, Dict, List, Optional
+
+from ..api.backend import ChatBackend
+
+# Frontmatter value marking a structured transformation (``output_format: json``)
+STRUCTURED_OUTPUT_FORMAT = "json"
+
+# Appended to the system prompt of structured transformations
+JSON_INSTRUCTIONS = (
+    "Respond with only the JSON value: no code fences, comments or text "
+    "before or after it."
+)
+
+# Requests made before giving up on valid JSON
+MAX_ATTEMPTS = 3
+
+# Minimum temperature of retries, so they don't repeat the same mistake
+RETRY_TEMPERATURE = 0.3
+
+_NUMBER = re.compile(r"-?(?:0|[1-9]\d*)(?:\.\d+)?(?:[eE][+-]?\d+)?")
+_LITERALS = ("true", "false", "null")
+_ESCAPES = '"\\/bfnrtu'
+_HEX = "0123456789abcdefABCDEF"
+_CLOSERS = {"{": "}", "[": "]"}
+
+# What the validator expects next
+_VALUE, _VALUE_OR_CLOSE, _KEY, _KEY_OR_CLOSE, _COLON, _COMMA_OR_CLOSE, _END = range(7)
+
+
+class StreamingJSONValidator:
+    """Validates a JSON document one fragment at a time.
+
+    ``feed()`` raises ValueError at the first character that cannot be part
+    of a valid document, so a response can be abandoned as soon as it goes
+    wrong. It also tracks where the last complete top-level member or
+    element ends, so everything received so far that is complete can be
+    rendered with ``preview()``. A surrounding Markdown code fence is
+    tolerated.
+    """
+
+    def __init__(self):
+        """Initialize validator."""
+        self.buffer: List[str] = []
+        self.position = 0
+        self.start: Optional[int] = None
+        self.stack: List[str] = []
+        self.expect = _VALUE
+        self.token = ""
+        self.in_string = False
+        self.string_is_key = False
+        self.escape: Optional[int] = None
+        self.fence: Optional[str] = None
+        self.complete_end = 0
+        self.complete_closer = ""
+        self.done = False
+
+    def feed(self, fragment: str):
+        """Validate the next fragment of output.
+
+        Args:
+            fragment: Output text, continuing the previous fragments
+
+        Raises:
+            ValueError: If the output can no longer be valid JSON
+        """
+        self.buffer.append(fragment)
+        for char in fragment:
+            self._feed_char(char)
+            self.position += 1
+
+    def _error(self, reason: str):
+        raise ValueError(f"{reason} at character {self.position}")
+
+    def _feed_char(self, char: str):
+        """Advance the state machine by one character."""
+        if self.fence is not None:
+            # Skip a leading "```json" line, or check a trailing "```"
+            if self.start is None:
+                if char == "\n":
+                    self.fence = None
+                return
+            self.fence += char
+            if not "```".startswith(self.fence.strip()) and self.fence.strip():
+                self._error("Unexpected text after JSON")
+            return
+
+        if self.in_string:
+            self._string_char(char)
+            return
+
+        if self.token:
+            literal = self.token[0] in "tfn"
+            if char.isalpha() if literal else char in "0123456789+-.eE":
+                self.token += char
+                if literal and not any(name.startswith(self.token) for name in _LITERALS):
+                    self._error(f"Invalid literal {self.token!r}")
+                return
+            self._end_token()
+
+        if char in " \t\r\n":
+            return
+
+        expect = self.expect
+        if expect == _END:
+            if char == "`":
+                self.fence = char
+                return
+            self._error("Unexpected text after JSON")
+        if self.start is None:
+            if char == "`":
+                self.fence = char
+                return
+            self.start = self.position
+
+        if expect in (_VALUE, _VALUE_OR_CLOSE):
+            if char in "{[":
+                self.stack.append(char)
+                self.expect = _KEY_OR_CLOSE if char == "{" else _VALUE_OR_CLOSE
+            elif char == '"':
+                self.in_string, self.string_is_key = True, False
+            elif char in "-0123456789tfn":
+                self.token = char
+            elif char == "]" and expect == _VALUE_OR_CLOSE:
+                self._close(char)
+            else:
+                self._error(f"Expected a value, got {char!r}")
+        elif expect in (_KEY, _KEY_OR_CLOSE):
+            if char == '"':
+                self.in_string, self.string_is_key = True, True
+            elif char == "}" and expect == _KEY_OR_CLOSE:
+                self._close(char)
+            else:
+                self._error(f"Expected a key, got {char!r}")
+        elif expect == _COLON:
+            if char != ":":
+                self._error(f"Expected ':', got {char!r}")
+            self.expect = _VALUE
+        elif expect == _COMMA_OR_CLOSE:
+            if char == ",":
+                self.expect = _KEY if self.stack[-1] == "{" else _VALUE
+            elif char in "}]":
+                self._close(char)
+            else:
+                self._error(f"Expected ',' or a closing bracket, got {char!r}")
+
+    def _string_char(self, char: str):
+        """Advance inside a string."""
+        if self.escape == 0:
+            if char not in _ESCAPES:
+                self._error(f"Invalid escape \\{char}")
+            self.escape = 4 if char == "u" else None
+        elif self.escape:
+            if char not in _HEX:
+                self._error("Invalid unicode escape")
+            self.escape = self.escape - 1 or None
+        elif char == "\\":
+            self.escape = 0
+        elif char == '"':
+            self.in_string = False
+            if self.string_is_key:
+                self.expect = _COLON
+            else:
+                self._value_done(self.position + 1)
+        elif ord(char) < 0x20:
+            self._error("Control character in string")
+
+    def _end_token(self):
+        """Check a finished number or literal."""
+        token, self.token = self.token, ""
+        if token[0] in "tfn":
+            if token not in _LITERALS:
+                self._error(f"Invalid literal {token!r}")
+        elif not _NUMBER.fullmatch(token):
+            self._error(f"Invalid number {token!r}")
+        self._value_done(self.position)
+
+    def _close(self, char: str):
+        """Close the innermost object or array."""
+        if not self.stack or _CLOSERS[self.stack[-1]] != char:
+            self._error(f"Unexpected {char!r}")
+        self.stack.pop()
+        self._value_done(self.position + 1)
+
+    def _value_done(self, end: int):
+        """Record a complete value ending before ``end``."""
+        if not self.stack:
+            self.expect = _END
+            self.done = True
+            self.complete_end, self.complete_closer = end, ""
+            return
+        self.expect = _COMMA_OR_CLOSE
+        if len(self.stack) == 1:
+            self.complete_end, self.complete_closer = end, _CLOSERS[self.stack[0]]
+
+    def finish(self) -> str:
+        """Check the output is complete.
+
+        Returns:
+            The JSON text, without any surrounding code fence
+
+        Raises:
+            ValueError: If the output is incomplete
+        """
+        if self.token:
+            self._end_token()
+        if not self.done or (self.fence or "```").strip() != "```":
+            self._error("JSON output ended early")
+        return "".join(self.buffer)[self.start:self.complete_end]
+
+    def preview(self) -> Optional[str]:
+        """Render the complete part of the output received so far.
+
+        Returns:
+            Indented JSON of every complete top-level member or element,
+            or None if there is none yet
+        """
+        if self.start is None or self.complete_end <= self.start:
+            return None
+        text = "".join(self.buffer)[self.start:self.complete_end] + self.complete_closer
+        return json.dumps(json.loads(text), indent=2, ensure_ascii=False)
+
+
+class StructuredTransform:
+    """Requests JSON output and validates it while it streams.
+
+    Transformations with ``output_format: json`` in frontmatter use the
+    backend's JSON mode (where supported) and a streamed response. Invalid
+    output aborts the request at the first bad character and is retried,
+    up to MAX_ATTEMPTS requests in all.
+    """
+
+    def __init__(self, client: ChatBackend):
+        """Initialize structured transform.
+
+        Args:
+            client: API client
+        """
+        self.client = client
+        self.retries = 0
+
+    async def transform_text(
+        self,
+        text: str,
+        prompts: List[str],
+        user_details: Optional[Dict[str, str]] = None,
+        on_preview: Optional[Callable[[str], None]] = None,
+        **options
+    ) -> str:
+        """Transform text into validated JSON.
+
+        Args:
+            text: Text to transform
+            prompts: Transformation prompts
+            user_details: Optional user details to inject
+            on_preview: Called with indented JSON of the complete part of the
+                output whenever another top-level member or element completes
+            **options: Further stream_text options (model, temperature,
+                max_tokens)
+
+        Returns:
+            JSON output text
+
+        Raises:
+            ValueError: If no attempt produced valid JSON
+        """
+        error = None
+        for attempt in range(MAX_ATTEMPTS):
+            if attempt:
+                self.retries += 1
+                options["temperature"] = max(options.get("temperature") or 0.0, RETRY_TEMPERATURE)
+                print(f"Invalid JSON output ({error}), retrying")
+
+            validator = StreamingJSONValidator()
+            stream = self.client.stream_text(
+                text, prompts, user_details,
+                output_instructions=JSON_INSTRUCTIONS, json_mode=True, **options
+            )
+            try:
+                # Leaving the loop early closes the stream and its connection
+                async with aclosing(stream):
+                    async for delta in stream:
+                        complete_end = validator.complete_end
+                        validator.feed(delta)
+                        if on_preview and validator.complete_end != complete_end:
+                            on_preview(validator.preview())
+                return validator.finish()
+            except ValueError as e:
+                error = e
+
+        raise ValueError(f"No valid JSON after {MAX_ATTEMPTS} attempts: {error}")
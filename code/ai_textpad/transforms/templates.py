@@ -0,0 +1,126 @@
+"""User-detail placeholders in prompts, compiled into reusable templates.
+
+A prompt refers to a user detail with ``{{name}}``, optionally with a
+fallback for when the detail is not set (``{{name|Daniel}}``);
+``{{user_details}}`` expands to every detail as ``key: value`` lines.
+Only the details a prompt refers to are sent with it. Braces around any
+other name are left as they are, since prompts may use them as literal
+example placeholders.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple, Union
+
+PLACEHOLDER = re.compile(r"\{\{\s*([A-Za-z_]\w*)\s*(?:\|([^{}]*))?\}\}")
+
+# Placeholder expanding to all user details
+ALL_DETAILS = "user_details"
+
+# Details edited in Settings
+USER_DETAIL_KEYS = ("name", "email", "additional_info")
+
+# Names substituted in prompts
+PLACEHOLDER_NAMES = frozenset((ALL_DETAILS, *USER_DETAIL_KEYS))
+
+# (detail name, fallback) of one placeholder
+Placeholder = Tuple[str, Optional[str]]
+
+
+class PromptTemplate:
+    """A prompt split into literal text and user-detail placeholders."""
+
+    def __init__(self, source: str):
+        """Compile a prompt.
+
+        Args:
+            source: Prompt text
+        """
+        self.source = source
+        self.parts: List[Union[str, Placeholder]] = []
+        position = 0
+        for match in PLACEHOLDER.finditer(source):
+            if match.group(1) not in PLACEHOLDER_NAMES:
+                continue
+            self.parts.append(source[position:match.start()])
+            fallback = match.group(2)
+            self.parts.append((match.group(1), fallback.strip() if fallback is not None else None))
+            position = match.end()
+        self.parts.append(source[position:])
+        self.variables: FrozenSet[str] = frozenset(
+            part[0] for part in self.parts if isinstance(part, tuple)
+        )
+
+    def referenced(self, user_details: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Select the user details this prompt refers to.
+
+        Args:
+            user_details: All user details
+
+        Returns:
+            The referenced details that are set
+        """
+        if not user_details or not self.variables:
+            return {}
+        if ALL_DETAILS in self.variables:
+            return dict(user_details)
+        return {k: v for k, v in user_details.items() if k in self.variables}
+
+    def render(self, user_details: Optional[Dict[str, str]]) -> str:
+        """Fill in the placeholders.
+
+        Unset details use the placeholder's fallback, or a bracketed label
+        (``[name]``) the model can recognize as missing.
+
+        Args:
+            user_details: User details
+
+        Returns:
+            Prompt text
+        """
+        if not self.variables:
+            return self.source
+        user_details = user_details or {}
+        rendered = []
+        for part in self.parts:
+            if isinstance(part, str):
+                rendered.append(part)
+                continue
+            name, fallback = part
+            if name == ALL_DETAILS:
+                rendered.append("\n".join(f"{k}: {v}" for k, v in sorted(user_details.items())))
+            elif user_details.get(name):
+                rendered.append(user_details[name])
+            else:
+                rendered.append(fallback if fallback is not None else f"[{name}]")
+        return "".join(rendered)
+
+
+@lru_cache(maxsize=1024)
+def compile_template(prompt: str) -> PromptTemplate:
+    """Compile a prompt into a template, once per distinct prompt text.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Compiled template
+    """
+    return PromptTemplate(prompt)
+
+
+def referenced_details(prompts: List[str],
+                       user_details: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """Select the user details any of the prompts refer to.
+
+    Args:
+        prompts: Transformation prompts
+        user_details: All user details
+
+    Returns:
+        The referenced details that are set
+    """
+    referenced: Dict[str, str] = {}
+    for prompt in prompts:
+        referenced.update(compile_template(prompt).referenced(user_details))
+    return referenced
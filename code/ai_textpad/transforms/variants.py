@@ -0,0 +1,94 @@
+"""Variants mode: several alternative transforms of the same text, run at once."""
+
+import asyncio
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Cap on concurrent requests fanned out for one comparison
+MAX_VARIANTS = 8
+
+
+class Variant(NamedTuple):
+    """One alternative transform in a comparison."""
+
+    label: str
+    prompts: List[str]
+    metadata: List[Dict[str, Any]]
+    # Model override (None: routed from frontmatter)
+    model: Optional[str] = None
+
+
+def build_variants(transformations: List[Tuple[str, str]],
+                   metadata_list: List[Dict[str, Any]],
+                   models: Optional[List[str]] = None) -> List[Variant]:
+    """Build the variants to compare.
+
+    With several transformations selected, each one becomes a variant of
+    its own. With one transformation and several models, the
+    transformation is run once per model. Selecting both compares every
+    transformation on every model, up to MAX_VARIANTS.
+
+    Args:
+        transformations: Selected (name, prompt) tuples
+        metadata_list: Frontmatter metadata of each transformation
+        models: Model identifiers to compare (default: routed model only)
+
+    Returns:
+        Variants, in selection order
+    """
+    models = [model for model in (models or []) if model] or [None]
+    variants = []
+    for (name, prompt), metadata in zip(transformations, metadata_list):
+        for model in models:
+            label = f"{name} ({model})" if model and len(models) > 1 else name
+            variants.append(Variant(label, [prompt], [metadata], model))
+    return variants[:MAX_VARIANTS]
+
+
+async def stream_variant(backends, variant: Variant, text: str,
+                         user_details: Optional[Dict[str, str]],
+                         on_delta: Callable[[str], None]) -> str:
+    """Stream one variant's output.
+
+    Args:
+        backends: BackendRegistry used to route the request
+        variant: Variant to run
+        text: Text to transform
+        user_details: Optional user details to inject
+        on_delta: Called with each output fragment as it arrives
+
+    Returns:
+        Complete output text
+    """
+    client, options = backends.route(variant.metadata, variant.model)
+    parts = []
+    async for delta in client.stream_text(text, variant.prompts, user_details, **options):
+        parts.append(delta)
+        on_delta(delta)
+    return "".join(parts)
+
+
+def start_variants(backends, variants: List[Variant], text: str,
+                   user_details: Optional[Dict[str, str]],
+                   on_delta: Callable[[int, str], None]) -> List["asyncio.Task"]:
+    """Start every variant concurrently.
+
+    All requests are in flight at once, so the comparison completes in the
+    time of the slowest variant rather than the sum.
+
+    Args:
+        backends: BackendRegistry used to route the requests
+        variants: Variants to run
+        text: Text to transform
+        user_details: Optional user details to inject
+        on_delta: Called with (variant index, fragment) as output arrives
+
+    Returns:
+        One task per variant, in order, each resolving to its output
+    """
+    return [
+        asyncio.ensure_future(stream_variant(
+            backends, variant, text, user_details,
+            lambda delta, index=index: on_delta(index, delta)
+        ))
+        for index, variant in enumerate(variants)
+    ]
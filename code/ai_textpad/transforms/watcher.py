@@ -0,0 +1,242 @@
+"""Live watching of the prompts directory with incremental reload."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from ..storage.database import ConfigDatabase
+from .catalog_bundle import scan_prompt_files
+from .loader import TransformLoader
+
+# inotify(7) constants
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO |
+              IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal ctypes binding to Linux inotify."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.watches: Dict[int, Path] = {}
+
+    def add_watch(self, path: Path):
+        """Watch a directory."""
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(str(path)), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+        self.watches[wd] = path
+
+    def read_events(self) -> List[Tuple[Path, int]]:
+        """Read pending events.
+
+        Returns:
+            List of (path, mask) tuples
+        """
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+
+        events = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            directory = self.watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name) if name else directory
+            events.append((path, mask))
+        return events
+
+    def close(self):
+        """Close the inotify descriptor."""
+        os.close(self.fd)
+
+
+class PromptWatcher:
+    """Watches the prompts directory and reports debounced file changes.
+
+    Uses inotify where available and falls back to polling file metadata.
+    Changes are delivered in batches on the asyncio event loop.
+    """
+
+    def __init__(
+        self,
+        prompts_dir: Path,
+        on_change: Callable[[Set[str]], None],
+        debounce: float = 0.3,
+        poll_interval: float = 2.0
+    ):
+        """Initialize prompt watcher.
+
+        Args:
+            prompts_dir: Directory to watch
+            on_change: Callback receiving the set of changed relative paths
+            debounce: Seconds of quiet before a batch is delivered
+            poll_interval: Seconds between scans in polling mode
+        """
+        self.prompts_dir = Path(prompts_dir)
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.mode: Optional[str] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._inotify: Optional[_Inotify] = None
+        self._poll_task: Optional[asyncio.Task] = None
+        self._pending: Set[str] = set()
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+
+    def start(self):
+        """Start watching on the running event loop."""
+        self._loop = asyncio.get_event_loop()
+        try:
+            self._start_inotify()
+            self.mode = "inotify"
+        except OSError as e:
+            print(f"inotify unavailable ({e}), polling {self.prompts_dir} instead")
+            self._poll_task = self._loop.create_task(self._poll())
+            self.mode = "polling"
+
+    def stop(self):
+        """Stop watching."""
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        if self._inotify:
+            self._loop.remove_reader(self._inotify.fd)
+            self._inotify.close()
+            self._inotify = None
+        if self._poll_task:
+            self._poll_task.cancel()
+            self._poll_task = None
+
+    def _start_inotify(self):
+        """Set up inotify watches on every (non-hidden) directory."""
+        self._inotify = _Inotify()
+        try:
+            for root, dirs, _ in os.walk(self.prompts_dir):
+                dirs[:] = [d for d in dirs if not d.startswith(".")]
+                self._inotify.add_watch(Path(root))
+            self._loop.add_reader(self._inotify.fd, self._on_inotify_readable)
+        except Exception:
+            self._inotify.close()
+            self._inotify = None
+            raise
+
+    def _on_inotify_readable(self):
+        """Translate inotify events into pending changes."""
+        for path, mask in self._inotify.read_events():
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO) and not path.name.startswith("."):
+                    # New directory: watch it and pick up files moved in with it
+                    self._inotify.add_watch(path)
+                    for prompt_file in path.rglob("*.md"):
+                        self._queue(prompt_file)
+                continue
+            if path.suffix == ".md":
+                self._queue(path)
+
+    async def _poll(self):
+        """Polling fallback comparing file metadata between scans."""
+        previous = scan_prompt_files(self.prompts_dir)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = scan_prompt_files(self.prompts_dir)
+            for rel_path in set(previous) | set(current):
+                if previous.get(rel_path) != current.get(rel_path):
+                    self._queue(self.prompts_dir / rel_path)
+            previous = current
+
+    def _queue(self, path: Path):
+        """Add a changed file and (re)start the debounce timer."""
+        try:
+            rel_path = str(path.relative_to(self.prompts_dir))
+        except ValueError:
+            return
+        self._pending.add(rel_path)
+
+        if self._flush_handle:
+            self._flush_handle.cancel()
+        self._flush_handle = self._loop.call_later(self.debounce, self._flush)
+
+    def _flush(self):
+        """Deliver the pending batch of changes."""
+        self._flush_handle = None
+        changed, self._pending = self._pending, set()
+        if changed:
+            try:
+                self.on_change(changed)
+            except Exception as e:
+                print(f"Error reloading prompts: {e}")
+
+
+class PromptReloader:
+    """Applies prompt file changes to the database one file at a time."""
+
+    def __init__(self, db: ConfigDatabase, loader: TransformLoader):
+        """Initialize prompt reloader.
+
+        Args:
+            db: Database instance
+            loader: Loader for the watched prompts directory
+        """
+        self.db = db
+        self.loader = loader
+
+    def apply(self, changed: Set[str]) -> Tuple[List[dict], List[int]]:
+        """Re-parse changed files and upsert or delete their transformations.
+
+        Args:
+            changed: Changed file paths, relative to the prompts directory
+
+        Returns:
+            Tuple of (updated transformation dicts, removed transformation IDs)
+        """
+        updated = []
+        removed = []
+
+        for rel_path in sorted(changed):
+            entry = self.loader.parse_file(self.loader.prompts_dir / rel_path)
+            if entry is None:
+                transformation_id = self.db.delete_transformation_by_source(rel_path)
+                if transformation_id is not None:
+                    removed.append(transformation_id)
+                continue
+
+            name, category, prompt, metadata, source_path = entry
+            transformation_id = self.db.upsert_default_transformation(
+                source_path, name, category, prompt, metadata
+            )
+            updated.append(self.db.get_transformation(transformation_id))
+
+        return updated, removed
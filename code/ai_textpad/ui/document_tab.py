@@ -0,0 +1,260 @@
+"""A single document tab: editor panes, version history and transform state."""
+
+import asyncio
+from typing import List, Optional
+
+from PyQt6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QTextEdit, QSplitter, QLabel
+)
+from PyQt6.QtCore import Qt, pyqtSignal
+
+from ..transforms.version_manager import VersionManager
+
+
+class PasteAwareTextEdit(QTextEdit):
+    """Text edit that signals when text is pasted or dropped into it."""
+
+    pasted = pyqtSignal()
+
+    def insertFromMimeData(self, source):
+        """Insert pasted content, then emit pasted."""
+        super().insertFromMimeData(source)
+        self.pasted.emit()
+
+
+class DocumentTab(QWidget):
+    """Split-pane document with its own version history and transform task."""
+
+    # Emitted with the new status text whenever the tab's status changes
+    status_changed = pyqtSignal(str)
+
+    # Emitted after text is pasted into the original pane
+    text_pasted = pyqtSignal()
+
+    # Emitted when the text the next transform applies to may have changed
+    source_changed = pyqtSignal()
+
+    def __init__(self, title: str, parent=None):
+        """Initialize document tab.
+
+        Args:
+            title: Tab title
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.title = title
+        self.version_manager = VersionManager()
+        self.selected_transformations: List[tuple] = []  # List of (name, prompt) tuples
+        self.selected_metadata: List[dict] = []
+        self.pipeline_mode = False
+        self.task: Optional[asyncio.Task] = None
+        self.job_id: Optional[int] = None
+        self.status = "Ready"
+        # Transformed pane text hidden while a partial result is shown
+        self.partial_backup: Optional[str] = None
+
+        self._setup_ui()
+        self._connect_signals()
+
+    def _setup_ui(self):
+        """Set up the user interface."""
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(0, 0, 0, 0)
+
+        # Splitter for two panes
+        self.splitter = QSplitter(Qt.Orientation.Horizontal)
+
+        # Left pane: Original text
+        left_widget = QWidget()
+        left_layout = QVBoxLayout(left_widget)
+        left_layout.setContentsMargins(5, 5, 5, 5)
+
+        left_label = QLabel("Original Text")
+        left_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
+        self.original_text_edit = PasteAwareTextEdit()
+        self.original_text_edit.setPlaceholderText("Paste your text here to begin...")
+
+        left_layout.addWidget(left_label)
+        left_layout.addWidget(self.original_text_edit)
+
+        # Right pane: Transformed text
+        right_widget = QWidget()
+        right_layout = QVBoxLayout(right_widget)
+        right_layout.setContentsMargins(5, 5, 5, 5)
+
+        right_label = QLabel("Transformed Text")
+        right_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
+        self.transformed_text_edit = QTextEdit()
+        self.transformed_text_edit.setPlaceholderText("Transformed text will appear here...")
+
+        right_layout.addWidget(right_label)
+        right_layout.addWidget(self.transformed_text_edit)
+
+        # Add panes to splitter
+        self.splitter.addWidget(left_widget)
+        self.splitter.addWidget(right_widget)
+        self.splitter.setStretchFactor(0, 1)
+        self.splitter.setStretchFactor(1, 1)
+
+        main_layout.addWidget(self.splitter)
+
+        # Version navigation bar
+        nav_widget = QWidget()
+        nav_layout = QHBoxLayout(nav_widget)
+        nav_layout.setContentsMargins(10, 5, 10, 5)
+
+        self.back_button = QPushButton("◄ Previous")
+        self.back_button.setEnabled(False)
+
+        self.version_label = QLabel("Version: 1/1")
+        self.version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+
+        self.forward_button = QPushButton("Next ►")
+        self.forward_button.setEnabled(False)
+
+        self.restore_button = QPushButton("↺ Restore Original")
+        self.restore_button.setEnabled(False)
+
+        nav_layout.addWidget(self.back_button)
+        nav_layout.addWidget(self.version_label)
+        nav_layout.addWidget(self.forward_button)
+        nav_layout.addStretch()
+        nav_layout.addWidget(self.restore_button)
+
+        main_layout.addWidget(nav_widget)
+
+    def _connect_signals(self):
+        """Connect signals and slots."""
+        self.back_button.clicked.connect(self.go_back)
+        self.forward_button.clicked.connect(self.go_forward)
+        self.restore_button.clicked.connect(self.restore_original)
+
+        # Update version manager when original text changes
+        self.original_text_edit.textChanged.connect(self.on_original_text_changed)
+
+        self.original_text_edit.pasted.connect(self.text_pasted)
+        self.original_text_edit.textChanged.connect(self.source_changed)
+        self.transformed_text_edit.textChanged.connect(self.source_changed)
+
+    @property
+    def is_busy(self) -> bool:
+        """Whether a transform is queued or running for this tab."""
+        return self.task is not None and not self.task.done()
+
+    def has_text(self) -> bool:
+        """Whether either pane has content."""
+        return bool(self.original_text_edit.toPlainText() or self.transformed_text_edit.toPlainText())
+
+    def source_text(self) -> str:
+        """Text the next transform applies to (transformed pane if it has content)."""
+        return self.transformed_text_edit.toPlainText() or self.original_text_edit.toPlainText()
+
+    def set_status(self, status: str):
+        """Update the tab's status text.
+
+        Args:
+            status: Status text
+        """
+        self.status = status
+        self.status_changed.emit(status)
+
+    def on_original_text_changed(self):
+        """Handle changes to original text."""
+        text = self.original_text_edit.toPlainText()
+        if not self.version_manager.versions:
+            self.version_manager.reset(text)
+            self._update_navigation_buttons()
+
+    def clear(self):
+        """Reset the document."""
+        self.original_text_edit.clear()
+        self.transformed_text_edit.clear()
+        self.version_manager.reset()
+        self.selected_transformations = []
+        self.selected_metadata = []
+        self._update_navigation_buttons()
+        self.set_status("Ready")
+
+    def cancel(self):
+        """Cancel the tab's queued or running transform, if any."""
+        if self.is_busy:
+            self.task.cancel()
+
+    def show_partial(self, text: str):
+        """Show the validated part of a result that is still arriving.
+
+        Args:
+            text: Partial result
+        """
+        if self.partial_backup is None:
+            self.partial_backup = self.transformed_text_edit.toPlainText()
+        self.transformed_text_edit.setPlainText(text)
+
+    def discard_partial(self):
+        """Restore the transformed pane after a partial result was abandoned."""
+        if self.partial_backup is not None:
+            self.transformed_text_edit.setPlainText(self.partial_backup)
+            self.partial_backup = None
+
+    def add_versions(self, intermediate: List[str], transformed: str):
+        """Record a finished transform and show it.
+
+        Args:
+            intermediate: Intermediate pipeline outputs (each becomes a version)
+            transformed: Final output
+        """
+        self.partial_backup = None
+        for output in intermediate:
+            self.version_manager.add_version(output)
+        self.version_manager.add_version(transformed)
+        self.transformed_text_edit.setPlainText(transformed)
+
+        # Update original pane to show previous version
+        if self.version_manager.current_index > 0:
+            prev_version = self.version_manager.versions[self.version_manager.current_index - 1]
+            self.original_text_edit.setPlainText(prev_version)
+
+        self._update_navigation_buttons()
+
+    def go_back(self):
+        """Navigate to previous version."""
+        prev_text = self.version_manager.go_back()
+        if prev_text is not None:
+            self.transformed_text_edit.setPlainText(prev_text)
+            # Update original pane
+            if self.version_manager.current_index > 0:
+                self.original_text_edit.setPlainText(
+                    self.version_manager.versions[self.version_manager.current_index - 1]
+                )
+            else:
+                self.original_text_edit.setPlainText(self.version_manager.original_text)
+            self._update_navigation_buttons()
+
+    def go_forward(self):
+        """Navigate to next version."""
+        next_text = self.version_manager.go_forward()
+        if next_text is not None:
+            self.transformed_text_edit.setPlainText(next_text)
+            # Update original pane
+            self.original_text_edit.setPlainText(
+                self.version_manager.versions[self.version_manager.current_index - 1]
+            )
+            self._update_navigation_buttons()
+
+    def restore_original(self):
+        """Restore original text."""
+        original = self.version_manager.restore_original()
+        self.original_text_edit.setPlainText(original)
+        self.transformed_text_edit.setPlainText(original)
+        self._update_navigation_buttons()
+
+    def _update_navigation_buttons(self):
+        """Update state of navigation buttons."""
+        self.back_button.setEnabled(self.version_manager.can_go_back())
+        self.forward_button.setEnabled(self.version_manager.can_go_forward())
+        self.restore_button.setEnabled(self.version_manager.current_index > 0)
+
+        # Update version label
+        count = self.version_manager.get_version_count()
+        current = self.version_manager.get_current_index() + 1
+        self.version_label.setText(f"Version: {current}/{count}")
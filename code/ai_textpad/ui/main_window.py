@@ -1,25 +1,31 @@
 """Main window for AI-Textpad application."""
 
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QTextEdit, QSplitter, QToolBar, QLabel, QMessageBox
+    QMainWindow, QWidget, QToolBar, QLabel, QMessageBox, QTabWidget
 )
-from PyQt6.QtCore import Qt, QSize
-from PyQt6.QtGui import QAction, QIcon
+from PyQt6.QtCore import QSize
+from PyQt6.QtGui import QAction, QCloseEvent, QIcon
 from datetime import datetime
 from pathlib import Path
 import asyncio
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from ..storage.database import ConfigDatabase
-from ..api.openrouter import OpenRouterClient
-from ..transforms.version_manager import VersionManager
-from .transform_dialog import TransformDialog
-from .settings_dialog import SettingsDialog
+from ..storage.job_queue import DONE, FAILED, UNFINISHED_STATES, JobQueue
+from ..transforms.jobs import TRANSFORM_JOB, JobRunner
+from ..transforms.speculative import MAX_PINS, SPECULATIVE_JOB, SpeculativeTransforms
+from ..profiling import profiler, profiling_requested
+from .document_tab import DocumentTab
+
+# The API client (httpx), pipeline and dialogs are imported lazily so the
+# window can be painted before they load; see ai_textpad.startup.
 
 
 class MainWindow(QMainWindow):
-    """Main application window with split-pane editor."""
+    """Main application window with tabbed split-pane documents."""
+
+    # Default cap on transforms running at once across all tabs
+    DEFAULT_MAX_IN_FLIGHT = 3
 
     def __init__(self, db: ConfigDatabase):
         """Initialize main window.
@@ -29,85 +35,51 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
         self.db = db
-        self.version_manager = VersionManager()
-        self.selected_transformations: List[tuple] = []  # List of (name, prompt) tuples
+        self.backends = None
+        self.model_probes = None
+        self.catalog_ready = True
+        self.prompt_watcher = None
+        self.transform_dialog = None
+        self.transformation_model = None
+        self.performance_panel = None
+        self.loop_watchdog = None
+        self.document_count = 0
+        self.shutdown_task: Optional[asyncio.Task] = None
+        self.shut_down = False
+
+        # Transforms run as persistent jobs on a bounded worker pool; further
+        # tabs wait their turn and unfinished jobs resume after a restart
+        max_in_flight = int(self.db.get_config("max_concurrent_transforms",
+                                               self.DEFAULT_MAX_IN_FLIGHT))
+        self.job_queue = JobQueue(db)
+        self.job_runner = JobRunner(self.job_queue, max_in_flight)
+
+        # Pinned transformations start in the background when text is pasted
+        self.speculative = SpeculativeTransforms(db, self.job_runner, self.job_queue)
+        self.pinned_actions: List[QAction] = []
 
         self.setWindowTitle("AI-Textpad")
         self.setMinimumSize(QSize(1200, 700))
 
         self._setup_ui()
         self._setup_toolbar()
-        self._connect_signals()
+        self.apply_profiling_setting()
+        self.new_tab()
 
     def _setup_ui(self):
         """Set up the user interface."""
-        # Central widget with main layout
-        central_widget = QWidget()
-        self.setCentralWidget(central_widget)
-        main_layout = QVBoxLayout(central_widget)
-        main_layout.setContentsMargins(0, 0, 0, 0)
-
-        # Splitter for two panes
-        self.splitter = QSplitter(Qt.Orientation.Horizontal)
-
-        # Left pane: Original text
-        left_widget = QWidget()
-        left_layout = QVBoxLayout(left_widget)
-        left_layout.setContentsMargins(5, 5, 5, 5)
-
-        left_label = QLabel("Original Text")
-        left_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
-        self.original_text_edit = QTextEdit()
-        self.original_text_edit.setPlaceholderText("Paste your text here to begin...")
-
-        left_layout.addWidget(left_label)
-        left_layout.addWidget(self.original_text_edit)
-
-        # Right pane: Transformed text
-        right_widget = QWidget()
-        right_layout = QVBoxLayout(right_widget)
-        right_layout.setContentsMargins(5, 5, 5, 5)
-
-        right_label = QLabel("Transformed Text")
-        right_label.setStyleSheet("font-weight: bold; font-size: 12pt;")
-        self.transformed_text_edit = QTextEdit()
-        self.transformed_text_edit.setPlaceholderText("Transformed text will appear here...")
-
-        right_layout.addWidget(right_label)
-        right_layout.addWidget(self.transformed_text_edit)
-
-        # Add panes to splitter
-        self.splitter.addWidget(left_widget)
-        self.splitter.addWidget(right_widget)
-        self.splitter.setStretchFactor(0, 1)
-        self.splitter.setStretchFactor(1, 1)
-
-        main_layout.addWidget(self.splitter)
-
-        # Version navigation bar
-        nav_widget = QWidget()
-        nav_layout = QHBoxLayout(nav_widget)
-        nav_layout.setContentsMargins(10, 5, 10, 5)
-
-        self.back_button = QPushButton("◄ Previous")
-        self.back_button.setEnabled(False)
-
-        self.version_label = QLabel("Version: 1/1")
-        self.version_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        self.forward_button = QPushButton("Next ►")
-        self.forward_button.setEnabled(False)
-
-        self.restore_button = QPushButton("↺ Restore Original")
-        self.restore_button.setEnabled(False)
-
-        nav_layout.addWidget(self.back_button)
-        nav_layout.addWidget(self.version_label)
-        nav_layout.addWidget(self.forward_button)
-        nav_layout.addStretch()
-        nav_layout.addWidget(self.restore_button)
-
-        main_layout.addWidget(nav_widget)
+        self.tabs = QTabWidget()
+        self.tabs.setDocumentMode(True)
+        self.tabs.setTabsClosable(True)
+        self.tabs.setMovable(True)
+        self.tabs.tabCloseRequested.connect(self.close_tab)
+        self.tabs.currentChanged.connect(self._on_current_tab_changed)
+        self.setCentralWidget(self.tabs)
+
+    @property
+    def current_tab(self) -> DocumentTab:
+        """The document tab being shown."""
+        return self.tabs.currentWidget()
 
     def _setup_toolbar(self):
         """Set up the toolbar."""
@@ -118,9 +90,21 @@ class MainWindow(QMainWindow):
 
         # New button
         new_action = QAction("New", self)
+        new_action.setShortcut("Ctrl+N")
         new_action.triggered.connect(self.new_document)
         toolbar.addAction(new_action)
 
+        # New tab button
+        new_tab_action = QAction("New Tab", self)
+        new_tab_action.setShortcut("Ctrl+T")
+        new_tab_action.triggered.connect(self.new_tab)
+        toolbar.addAction(new_tab_action)
+
+        close_tab_action = QAction("Close Tab", self)
+        close_tab_action.setShortcut("Ctrl+W")
+        close_tab_action.triggered.connect(lambda: self.close_tab(self.tabs.currentIndex()))
+        self.addAction(close_tab_action)
+
         toolbar.addSeparator()
 
         # Transform button
@@ -128,7 +112,10 @@ class MainWindow(QMainWindow):
         self.transform_action.triggered.connect(self.show_transform_dialog)
         toolbar.addAction(self.transform_action)
 
-        toolbar.addSeparator()
+        # Pinned transformation actions are inserted before this separator
+        self.toolbar = toolbar
+        self.pinned_separator = toolbar.addSeparator()
+        self.refresh_pinned_actions()
 
         # Copy button
         copy_action = QAction("Copy to Clipboard", self)
@@ -147,6 +134,12 @@ class MainWindow(QMainWindow):
         settings_action.triggered.connect(self.show_settings)
         toolbar.addAction(settings_action)
 
+        # Performance panel (profiling results and event-loop lag)
+        self.performance_action = QAction("Performance", self)
+        self.performance_action.setShortcut("Ctrl+Shift+P")
+        self.performance_action.triggered.connect(self.show_performance_panel)
+        toolbar.addAction(self.performance_action)
+
         # Add stretch to push next items to the right
         spacer = QWidget()
         spacer.setSizePolicy(
@@ -159,25 +152,273 @@ class MainWindow(QMainWindow):
         self.status_label = QLabel("Ready")
         toolbar.addWidget(self.status_label)
 
-    def _connect_signals(self):
-        """Connect signals and slots."""
-        self.back_button.clicked.connect(self.go_back)
-        self.forward_button.clicked.connect(self.go_forward)
-        self.restore_button.clicked.connect(self.restore_original)
+    def new_tab(self) -> DocumentTab:
+        """Open a new empty document tab.
+
+        Returns:
+            The new tab
+        """
+        self.document_count += 1
+        tab = DocumentTab(f"Document {self.document_count}", self)
+        tab.status_changed.connect(lambda status, tab=tab: self._on_tab_status(tab, status))
+        tab.text_pasted.connect(lambda tab=tab: self.speculate(tab))
+        tab.source_changed.connect(lambda tab=tab: self._on_source_changed(tab))
+        index = self.tabs.addTab(tab, tab.title)
+        self.tabs.setCurrentIndex(index)
+        tab.original_text_edit.setFocus()
+        return tab
+
+    def close_tab(self, index: int):
+        """Close a document tab, cancelling its transform.
+
+        Args:
+            index: Tab index
+        """
+        tab = self.tabs.widget(index)
+        if tab is None:
+            return
+        if tab.has_text() or tab.is_busy:
+            reply = QMessageBox.question(
+                self,
+                "Close Document",
+                f"Close \"{tab.title}\"? Its text and history will be lost.",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+            if reply == QMessageBox.StandardButton.No:
+                return
+
+        tab.cancel()
+        self.speculative.discard(tab)
+        self.tabs.removeTab(index)
+        tab.deleteLater()
+        if self.tabs.count() == 0:
+            self.new_tab()
+
+    def closeEvent(self, event: QCloseEvent):
+        """Release background work and connections before the window closes.
+
+        The first close request is deferred until shutdown() has finished,
+        then the window closes for real.
+
+        Args:
+            event: Close event
+        """
+        if self.shut_down:
+            event.accept()
+            return
+        event.ignore()
+        if self.shutdown_task is None:
+            self.shutdown_task = asyncio.ensure_future(self._shutdown_and_close())
+
+    async def _shutdown_and_close(self):
+        """Shut down, then close the window."""
+        try:
+            await self.shutdown()
+        finally:
+            self.shut_down = True
+            self.close()
+
+    async def shutdown(self):
+        """Stop background work, close the API clients and the database.
+
+        Running transform jobs go back to the queue and resume on the next
+        start; speculative ones are cancelled.
+        """
+        if self.model_probes is not None:
+            self.model_probes.cancel()
+            await asyncio.gather(self.model_probes, return_exceptions=True)
+        if self.prompt_watcher is not None:
+            self.prompt_watcher.stop()
+        if self.loop_watchdog is not None:
+            self.loop_watchdog.stop()
+        for owner in list(self.speculative.speculations):
+            self.speculative.discard(owner)
+        await self.job_runner.stop()
+        if self.backends is not None:
+            try:
+                await self.backends.close()
+            except Exception as e:
+                print(f"Error closing API clients: {e}")
+        self.db.close()
+
+    def pinned_transformations(self) -> List[dict]:
+        """Get the pinned transformations, in pinned order.
+
+        Returns:
+            Transformation dictionaries (pins whose prompt file is gone are skipped)
+        """
+        pinned = (self.db.get_config("pinned_transformations") or [])[:MAX_PINS]
+        by_path = {t['source_path']: t for t in self.db.get_transformations_by_source(pinned)}
+        return [by_path[path] for path in pinned if path in by_path]
+
+    def refresh_pinned_actions(self):
+        """Show one toolbar action per pinned transformation."""
+        for action in self.pinned_actions:
+            self.toolbar.removeAction(action)
+        self.pinned_actions = []
+
+        for number, trans in enumerate(self.pinned_transformations(), 1):
+            action = QAction(f"★ {trans['name']}", self)
+            action.setShortcut(f"Ctrl+{number}")
+            action.setToolTip(
+                f"Apply {trans['name']} ({trans['source_path'].strip()}, Ctrl+{number}); "
+                "starts in the background on paste"
+            )
+            action.triggered.connect(
+                lambda _, path=trans['source_path']: self.apply_pinned(path)
+            )
+            self.toolbar.insertAction(self.pinned_separator, action)
+            self.pinned_actions.append(action)
+
+    def speculate(self, tab: DocumentTab):
+        """Start the pinned transformations of freshly pasted text.
+
+        Args:
+            tab: Document tab text was pasted into
+        """
+        configured = self.db.get_config("openrouter_api_key") or self.db.get_config("local_backend_url")
+        if not configured or tab.is_busy or not self.job_runner.running:
+            return
+        self.speculative.schedule(tab, tab.source_text(), self.pinned_transformations())
+
+    def _on_source_changed(self, tab: DocumentTab):
+        """Drop a tab's speculation once its text no longer matches."""
+        if tab in self.speculative.speculations:
+            self.speculative.discard(tab, tab.source_text())
+
+    def apply_pinned(self, source_path: str):
+        """Apply a pinned transformation, using its speculative result if ready.
+
+        Args:
+            source_path: Prompt file of the pinned transformation
+        """
+        tab = self.current_tab
+        if tab.is_busy or not tab.source_text().strip():
+            return
+        trans = next(
+            (t for t in self.pinned_transformations() if t['source_path'] == source_path), None
+        )
+        if trans is None:
+            self.status_label.setText(f"Pinned prompt \"{source_path.strip()}\" not found")
+            return
+
+        tab.selected_transformations = [(trans['name'], trans['prompt'])]
+        tab.selected_metadata = [trans.get('metadata') or {}]
+        tab.pipeline_mode = False
 
-        # Update version manager when original text changes
-        self.original_text_edit.textChanged.connect(self.on_original_text_changed)
+        speculative = self.speculative.take(tab, tab.source_text(), source_path)
+        if speculative is not None:
+            tab.task = asyncio.ensure_future(self._deliver_speculative(tab, speculative))
+            tab.set_status("Finishing background transform...")
+        else:
+            tab.task = asyncio.create_task(self.apply_transformations(tab))
+            tab.set_status("Queued...")
+
+    async def _deliver_speculative(self, tab: DocumentTab, speculative: "asyncio.Future"):
+        """Show a speculative result, or transform normally if it failed.
+
+        Args:
+            tab: Document tab
+            speculative: Future of the speculative job result
+        """
+        try:
+            result = await speculative
+        except asyncio.CancelledError:
+            tab.task = None
+            raise
+        except Exception as e:
+            print(f"Background transform failed ({e}), transforming again")
+            await self.apply_transformations(tab)
+            return
+        tab.task = None
+        self._show_result(tab, result)
+        tab.set_status(f"{tab.status} (started on paste)")
+
+    def _on_current_tab_changed(self, index: int):
+        """Show the status of the newly selected tab."""
+        tab = self.current_tab
+        if tab is None:
+            return
+        self.transform_action.setEnabled(not tab.is_busy)
+        if self.catalog_ready:
+            self.status_label.setText(tab.status)
+
+    def _on_tab_status(self, tab: DocumentTab, status: str):
+        """Reflect a tab's status in its title and, if current, the toolbar.
+
+        Args:
+            tab: Document tab
+            status: New status text
+        """
+        index = self.tabs.indexOf(tab)
+        if index < 0:
+            return
+        self.tabs.setTabText(index, f"⏳ {tab.title}" if tab.is_busy else tab.title)
+        self.tabs.setTabToolTip(index, status)
+        if tab is self.current_tab:
+            self.status_label.setText(status)
+            self.transform_action.setEnabled(not tab.is_busy)
+
+    def set_catalog_ready(self, ready: bool = True):
+        """Mark whether the transformation catalog has finished loading.
+
+        Args:
+            ready: Whether the catalog is ready
+        """
+        self.catalog_ready = ready
+        # The catalog may have been reseeded; rebuild the model on next use
+        self.transformation_model = None
+        if not ready:
+            self.status_label.setText("Loading transformations...")
+        elif self.status_label.text() == "Loading transformations...":
+            self.status_label.setText("Ready")
+
+    def get_backends(self):
+        """Get the shared backend registry, creating it on first use.
+
+        Backend clients are reused across transforms so their connection
+        pools stay warm; credentials, models and URLs are refreshed from
+        settings on each lookup.
+
+        Returns:
+            BackendRegistry instance
+        """
+        from ..api.backends import BackendRegistry
+
+        if self.backends is None:
+            self.backends = BackendRegistry(self.db)
+        return self.backends
+
+    def get_client(self):
+        """Get the default (OpenRouter) backend client.
+
+        Returns:
+            OpenRouterClient instance
+        """
+        return self.get_backends().get()
+
+    def get_transformation_model(self):
+        """Get the catalog model (with its search index), building it on first use.
 
-    def on_original_text_changed(self):
-        """Handle changes to original text."""
-        text = self.original_text_edit.toPlainText()
-        if not self.version_manager.versions:
-            self.version_manager.reset(text)
-            self._update_navigation_buttons()
+        The model is shared by every transform dialog and rebuilt only after
+        the catalog is reloaded.
+
+        Returns:
+            TransformationListModel instance
+        """
+        from .transformation_model import TransformationListModel
+
+        if self.transformation_model is None:
+            self.transformation_model = TransformationListModel.from_database(self.db, self)
+        return self.transformation_model
 
     def new_document(self):
-        """Start a new document."""
-        if self.original_text_edit.toPlainText() or self.transformed_text_edit.toPlainText():
+        """Clear the current document."""
+        tab = self.current_tab
+        if tab.is_busy:
+            self.status_label.setText("Wait for the transform to finish or close the tab")
+            return
+        if tab.has_text():
             reply = QMessageBox.question(
                 self,
                 "New Document",
@@ -187,18 +428,13 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.No:
                 return
 
-        self.original_text_edit.clear()
-        self.transformed_text_edit.clear()
-        self.version_manager.reset()
-        self.selected_transformations = []
-        self._update_navigation_buttons()
-        self.status_label.setText("Ready")
+        tab.clear()
 
     def show_transform_dialog(self):
         """Show transformation selection dialog."""
-        # Check if API key is configured
+        # Check if an API key or a local backend is configured
         api_key = self.db.get_config("openrouter_api_key")
-        if not api_key:
+        if not api_key and not self.db.get_config("local_backend_url"):
             QMessageBox.warning(
                 self,
                 "API Key Required",
@@ -208,8 +444,10 @@ class MainWindow(QMainWindow):
             return
 
         # Check if there's text to transform
-        text = self.transformed_text_edit.toPlainText() or self.original_text_edit.toPlainText()
-        if not text.strip():
+        tab = self.current_tab
+        if tab.is_busy:
+            return
+        if not tab.source_text().strip():
             QMessageBox.warning(
                 self,
                 "No Text",
@@ -217,113 +455,250 @@ class MainWindow(QMainWindow):
             )
             return
 
-        dialog = TransformDialog(self.db, self)
-        if dialog.exec():
-            self.selected_transformations = dialog.get_selected_transformations()
-            if self.selected_transformations:
-                asyncio.create_task(self.apply_transformations())
-
-    def show_settings(self):
-        """Show settings dialog."""
-        dialog = SettingsDialog(self.db, self)
-        dialog.exec()
+        if not self.catalog_ready:
+            self.status_label.setText("Still loading transformations, try again in a moment")
+            return
 
-    async def apply_transformations(self):
-        """Apply selected transformations to text."""
-        self.status_label.setText("Transforming...")
-        self.transform_action.setEnabled(False)
+        from .transform_dialog import TransformDialog
 
+        with profiler.operation("TransformDialog()"):
+            dialog = TransformDialog(self.db, self, self.get_transformation_model())
+        self.transform_dialog = dialog
         try:
-            # Get source text (transformed pane if it has content, otherwise original)
-            source_text = self.transformed_text_edit.toPlainText() or self.original_text_edit.toPlainText()
+            accepted = dialog.exec()
+        finally:
+            self.transform_dialog = None
+            self.refresh_pinned_actions()
+
+        if accepted and dialog.get_variants_mode():
+            self.db.set_config("variant_models", ", ".join(dialog.get_variant_models()))
+            if dialog.get_selected_transformations():
+                self.compare_variants(
+                    tab, dialog.get_selected_transformations(),
+                    dialog.get_selected_metadata(), dialog.get_variant_models()
+                )
+        elif accepted:
+            tab.selected_transformations = dialog.get_selected_transformations()
+            tab.selected_metadata = dialog.get_selected_metadata()
+            tab.pipeline_mode = dialog.get_pipeline_mode()
+            self.db.set_config("pipeline_mode", tab.pipeline_mode)
+            if tab.selected_transformations and not tab.is_busy:
+                tab.task = asyncio.create_task(self.apply_transformations(tab))
+                tab.set_status("Queued...")
+
+    def compare_variants(self, tab: DocumentTab, transformations: List[Tuple[str, str]],
+                         metadata: List[dict], models: List[str]):
+        """Run each transformation (or model) separately and compare the results.
+
+        Every variant is requested at once and streams into its own column;
+        the one the user keeps becomes the tab's next version.
 
-            # Get API configuration
-            api_key = self.db.get_config("openrouter_api_key")
-            model = self.db.get_config("model", "openai/gpt-4o-mini")
+        Args:
+            tab: Document tab to transform
+            transformations: Selected (name, prompt) tuples
+            metadata: Frontmatter metadata of each transformation
+            models: Models to compare (empty for the routed model only)
+        """
+        from ..transforms.variants import build_variants
+        from .variants_dialog import VariantsDialog
 
-            # Get user details
-            user_details = self.db.get_all_user_details()
+        dialog = VariantsDialog(build_variants(transformations, metadata, models), self)
+        dialog.finished.connect(lambda result: self._on_variant_chosen(tab, dialog))
+        dialog.start(
+            self.get_backends(), tab.source_text(), self.db.get_all_user_details() or None
+        )
+        dialog.open()
+        tab.set_status("Comparing variants...")
 
-            # Extract just the prompts
-            prompts = [prompt for _, prompt in self.selected_transformations]
+    def _on_variant_chosen(self, tab: DocumentTab, dialog):
+        """Record the variant kept from a comparison.
 
-            # Call API
-            async with OpenRouterClient(api_key, model) as client:
-                transformed = await client.transform_text(
-                    source_text,
-                    prompts,
-                    user_details if user_details else None
-                )
+        Args:
+            tab: Document tab the variants were made from
+            dialog: Closed VariantsDialog
+        """
+        chosen = dialog.chosen_variant()
+        if chosen is None:
+            tab.set_status("Variants discarded")
+            return
+        label, output = chosen
+        tab.add_versions([], output)
+        tab.set_status(f"Kept variant: {label}")
+
+    def on_transformations_changed(self, updated: List[dict], removed: List[int]):
+        """Handle prompt files changing on disk.
+
+        Args:
+            updated: Inserted or updated transformation dictionaries
+            removed: IDs of deleted transformations
+        """
+        if self.transform_dialog is not None:
+            for trans in updated:
+                self.transform_dialog.upsert_transformation(trans)
+            for transformation_id in removed:
+                self.transform_dialog.remove_transformation(transformation_id)
+        elif self.transformation_model is not None:
+            for trans in updated:
+                self.transformation_model.upsert(trans)
+            for transformation_id in removed:
+                self.transformation_model.remove(transformation_id)
+
+        count = len(updated) + len(removed)
+        self.status_label.setText(f"Reloaded {count} prompt file{'s' if count != 1 else ''}")
+
+    def show_settings(self):
+        """Show settings dialog."""
+        from .settings_dialog import SettingsDialog
 
-            # Update UI
-            self.version_manager.add_version(transformed)
-            self.transformed_text_edit.setPlainText(transformed)
+        with profiler.operation("SettingsDialog()"):
+            dialog = SettingsDialog(self.db, self, self.get_backends().models)
+        if dialog.exec():
+            self.apply_profiling_setting()
+
+    def apply_profiling_setting(self):
+        """Turn profiling on or off from the environment/settings."""
+        enabled = profiling_requested(self.db)
+        profiler.configure(enabled)
+        if enabled:
+            profiler.instrument(self.db, "db")
+
+    def show_performance_panel(self):
+        """Show the performance panel."""
+        from .performance_panel import PerformancePanel
+
+        if self.performance_panel is None:
+            self.performance_panel = PerformancePanel(self, self.loop_watchdog)
+        self.performance_panel.refresh()
+        self.performance_panel.show()
+        self.performance_panel.raise_()
+
+    def start_job_runner(self):
+        """Start the transform workers and reopen jobs from the last session.
+
+        Each transform job left queued, running or undelivered by a previous
+        process gets a tab of its own that fills in when the job finishes.
+        """
+        from ..transforms.jobs import transform_job_handler
+
+        handler = transform_job_handler(self.db, self.get_backends)
+        self.job_runner.register(TRANSFORM_JOB, handler)
+        self.job_runner.register(SPECULATIVE_JOB, handler)
+        self.speculative.purge()
+        self.job_runner.start()
+
+        for job in self.job_queue.jobs(TRANSFORM_JOB, (*UNFINISHED_STATES, DONE, FAILED)):
+            payload = job['payload']
+            tab = self.current_tab
+            if tab.is_busy or tab.has_text():
+                tab = self.new_tab()
+            tab.title = payload.get('title') or tab.title
+            tab.original_text_edit.setPlainText(payload.get('text', ""))
+            tab.task = asyncio.ensure_future(self._deliver_job(tab, job['id']))
+            tab.set_status("Resuming transform...")
+
+    @profiler.profiled("apply_transformations")
+    async def apply_transformations(self, tab: DocumentTab):
+        """Apply a tab's selected transformations to its text.
+
+        The transform is queued as an interactive job; tabs transform
+        concurrently over the shared client, at most max_concurrent_transforms
+        at a time.
 
-            # Update original pane to show previous version
-            if self.version_manager.current_index > 0:
-                prev_version = self.version_manager.versions[self.version_manager.current_index - 1]
-                self.original_text_edit.setPlainText(prev_version)
+        Args:
+            tab: Document tab to transform
+        """
+        job_id = self.job_runner.submit(TRANSFORM_JOB, {
+            "title": tab.title,
+            # Transformed pane if it has content, otherwise original
+            "text": tab.source_text(),
+            "prompts": [prompt for _, prompt in tab.selected_transformations],
+            "metadata": tab.selected_metadata,
+            "pipeline": tab.pipeline_mode,
+        })
+        await self._deliver_job(tab, job_id)
+
+    async def _deliver_job(self, tab: DocumentTab, job_id: int):
+        """Wait for a transform job and show its result in a tab.
+
+        The job row is deleted once its result has been delivered, it has
+        failed or the tab cancelled it. A delivery abandoned any other way
+        (the app quitting) leaves the job to resume on the next start.
 
-            self._update_navigation_buttons()
-            self.status_label.setText("Transform complete")
+        Args:
+            tab: Document tab receiving the result
+            job_id: Transform job ID
+        """
+        tab.job_id = job_id
+        self.job_runner.watch(job_id, lambda progress, message: tab.set_status(message))
+        self.job_runner.watch_partial(job_id, tab.show_partial)
+        try:
+            result = await self.job_runner.wait(job_id)
+            tab.task = None
+            self._show_result(tab, result)
+            self.job_queue.delete(job_id)
+
+        except asyncio.CancelledError:
+            # Closing the tab cancels its job too
+            self.job_runner.cancel(job_id)
+            self.job_queue.delete(job_id)
+            tab.discard_partial()
+            tab.task = None
+            raise
 
         except Exception as e:
+            self.job_queue.delete(job_id)
+            tab.discard_partial()
+            tab.task = None
+            tab.set_status("Transform failed")
             QMessageBox.critical(
                 self,
                 "Transform Error",
-                f"Error applying transformations: {str(e)}"
+                f"Error applying transformations to {tab.title}: {str(e)}"
             )
-            self.status_label.setText("Transform failed")
 
         finally:
-            self.transform_action.setEnabled(True)
-
-    def go_back(self):
-        """Navigate to previous version."""
-        prev_text = self.version_manager.go_back()
-        if prev_text is not None:
-            self.transformed_text_edit.setPlainText(prev_text)
-            # Update original pane
-            if self.version_manager.current_index > 0:
-                self.original_text_edit.setPlainText(
-                    self.version_manager.versions[self.version_manager.current_index - 1]
-                )
-            else:
-                self.original_text_edit.setPlainText(self.version_manager.original_text)
-            self._update_navigation_buttons()
-
-    def go_forward(self):
-        """Navigate to next version."""
-        next_text = self.version_manager.go_forward()
-        if next_text is not None:
-            self.transformed_text_edit.setPlainText(next_text)
-            # Update original pane
-            self.original_text_edit.setPlainText(
-                self.version_manager.versions[self.version_manager.current_index - 1]
+            tab.job_id = None
+
+    def _show_result(self, tab: DocumentTab, result: dict):
+        """Show a finished transform job's output and statistics in a tab.
+
+        Args:
+            tab: Document tab
+            result: Transform job result
+        """
+        # Intermediate pipeline results become versions of their own
+        outputs = result['outputs']
+        tab.add_versions(outputs[:-1], outputs[-1])
+
+        status = "Transform complete"
+        if result['steps_computed'] or result['steps_reused']:
+            status += (
+                f" ({result['steps_computed']} steps run, "
+                f"{result['steps_reused']} cached)"
+            )
+        if result.get('paragraphs_reused'):
+            status += (
+                f" ({result['paragraphs_sent']} paragraphs sent, "
+                f"{result['paragraphs_reused']} reused)"
+            )
+        if 'edits_applied' in result:
+            status += f" ({result['edits_applied']} edits applied"
+            if result['edit_fallbacks']:
+                status += f", {result['edit_fallbacks']} rewritten in full"
+            status += ")"
+        if 'json_retries' in result:
+            retries = result['json_retries']
+            status += " (valid JSON" + (f" after {retries} retries)" if retries else ")")
+        if result['cached_tokens']:
+            status += (
+                f" [{result['cached_tokens']}/{result['prompt_tokens']} "
+                f"prompt tokens cached]"
             )
-            self._update_navigation_buttons()
-
-    def restore_original(self):
-        """Restore original text."""
-        original = self.version_manager.restore_original()
-        self.original_text_edit.setPlainText(original)
-        self.transformed_text_edit.setPlainText(original)
-        self._update_navigation_buttons()
-
-    def _update_navigation_buttons(self):
-        """Update state of navigation buttons."""
-        self.back_button.setEnabled(self.version_manager.can_go_back())
-        self.forward_button.setEnabled(self.version_manager.can_go_forward())
-        self.restore_button.setEnabled(self.version_manager.current_index > 0)
-
-        # Update version label
-        count = self.version_manager.get_version_count()
-        current = self.version_manager.get_current_index() + 1
-        self.version_label.setText(f"Version: {current}/{count}")
+        tab.set_status(status)
 
     def copy_to_clipboard(self):
         """Copy transformed text to clipboard."""
-        text = self.transformed_text_edit.toPlainText()
+        text = self.current_tab.transformed_text_edit.toPlainText()
         if text:
             from PyQt6.QtWidgets import QApplication
             QApplication.clipboard().setText(text)
@@ -337,7 +712,7 @@ class MainWindow(QMainWindow):
 
     def download_text(self):
         """Download transformed text as markdown file."""
-        text = self.transformed_text_edit.toPlainText()
+        text = self.current_tab.transformed_text_edit.toPlainText()
         if not text:
             QMessageBox.information(
                 self,
@@ -0,0 +1,253 @@
+"""Performance panel: profiled operations, memory usage and event-loop lag."""
+
+from datetime import datetime
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QTabWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QSplitter, QPlainTextEdit, QWidget
+)
+from PyQt6.QtCore import Qt, QTimer, QUrl
+from PyQt6.QtGui import QDesktopServices
+
+from ..profiling import profiler
+
+
+def _format_bytes(size: int) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB"):
+        if abs(size) < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+class PerformancePanel(QDialog):
+    """Non-modal dialog showing slow operations, memory holders and loop lag."""
+
+    def __init__(self, parent=None, watchdog=None):
+        """Initialize performance panel.
+
+        Args:
+            parent: Parent widget
+            watchdog: Optional LoopWatchdog whose lag data is shown live
+        """
+        super().__init__(parent)
+        self.watchdog = watchdog
+        self.blocked_calls = []
+
+        self.setWindowTitle("Performance")
+        self.setMinimumSize(900, 500)
+
+        self._setup_ui()
+        self.refresh()
+
+        # The event loop tab updates live while the panel is open
+        self.live_timer = QTimer(self)
+        self.live_timer.setInterval(1000)
+        self.live_timer.timeout.connect(self._refresh_event_loop)
+
+    def _setup_ui(self):
+        """Set up the user interface."""
+        layout = QVBoxLayout(self)
+
+        self.tab_widget = QTabWidget()
+
+        self.slowest_table = self._make_table(
+            ["Operation", "Duration (ms)", "Started", "Samples", "Hot frame", "Memory Δ"]
+        )
+        self.tab_widget.addTab(self.slowest_table, "Slowest Operations")
+
+        self.summary_table = self._make_table(
+            ["Operation", "Calls", "Total (ms)", "Mean (ms)", "Max (ms)"]
+        )
+        self.tab_widget.addTab(self.summary_table, "By Operation")
+
+        self.memory_table = self._make_table(["Location", "Size", "Allocations"])
+        self.tab_widget.addTab(self.memory_table, "Memory")
+
+        # Event loop tab: lag histogram, blocked calls and the selected call's stack
+        loop_tab = QWidget()
+        loop_layout = QVBoxLayout(loop_tab)
+        loop_layout.setContentsMargins(0, 0, 0, 0)
+
+        self.lag_label = QLabel()
+        loop_layout.addWidget(self.lag_label)
+
+        loop_splitter = QSplitter(Qt.Orientation.Vertical)
+        self.lag_table = self._make_table(["Lag", "Heartbeats", ""])
+        self.blocked_table = self._make_table(["Blocked call", "Duration (ms)", "Started"])
+        self.blocked_table.currentCellChanged.connect(self._show_blocked_stack)
+        self.stack_view = QPlainTextEdit()
+        self.stack_view.setReadOnly(True)
+        self.stack_view.setPlaceholderText("Select a blocked call to see the loop thread's stack")
+        loop_splitter.addWidget(self.lag_table)
+        loop_splitter.addWidget(self.blocked_table)
+        loop_splitter.addWidget(self.stack_view)
+        loop_layout.addWidget(loop_splitter)
+
+        self.tab_widget.addTab(loop_tab, "Event Loop")
+
+        layout.addWidget(self.tab_widget)
+
+        self.info_label = QLabel()
+        self.info_label.setStyleSheet("color: gray; font-size: 10pt;")
+        self.info_label.setWordWrap(True)
+        layout.addWidget(self.info_label)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+
+        open_button = QPushButton("Open Profiles Folder")
+        open_button.clicked.connect(self._open_profiles_folder)
+
+        snapshot_button = QPushButton("Save Memory Snapshot")
+        snapshot_button.clicked.connect(self._save_snapshot)
+
+        clear_button = QPushButton("Clear")
+        clear_button.clicked.connect(self._clear)
+
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+
+        close_button = QPushButton("Close")
+        close_button.clicked.connect(self.close)
+
+        button_layout.addWidget(open_button)
+        button_layout.addWidget(snapshot_button)
+        button_layout.addStretch()
+        button_layout.addWidget(clear_button)
+        button_layout.addWidget(refresh_button)
+        button_layout.addWidget(close_button)
+
+        layout.addLayout(button_layout)
+
+    def _make_table(self, headers) -> QTableWidget:
+        """Create a read-only table with the given column headers."""
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        return table
+
+    def _fill_table(self, table: QTableWidget, rows):
+        """Replace the contents of a table."""
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem(str(value))
+                if column > 0 and isinstance(value, (int, float)):
+                    item.setTextAlignment(
+                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+                    )
+                table.setItem(row, column, item)
+
+    def refresh(self):
+        """Reload data from the profiler."""
+        self._fill_table(self.slowest_table, [
+            (
+                record.name + (" (wall time)" if record.wall_time_only else ""),
+                round(record.duration * 1000, 1),
+                datetime.fromtimestamp(record.started).strftime("%H:%M:%S"),
+                "-" if record.wall_time_only else record.samples,
+                record.hot_frames[0][0] if record.hot_frames else "",
+                "-" if record.wall_time_only else _format_bytes(record.memory_delta),
+            )
+            for record in profiler.slowest()
+        ])
+
+        self._fill_table(self.summary_table, [
+            (
+                row["name"],
+                row["count"],
+                round(row["total"] * 1000, 1),
+                round(row["mean"] * 1000, 2),
+                round(row["max"] * 1000, 1),
+            )
+            for row in profiler.summary()
+        ])
+
+        self._fill_table(self.memory_table, [
+            (location, _format_bytes(size), count)
+            for location, size, count in profiler.memory_top()
+        ])
+
+        self._refresh_event_loop()
+
+        if profiler.enabled:
+            self.info_label.setText(
+                f"{len(profiler.records)} operations recorded. "
+                f"CPU profiles (folded stacks) are written to {profiler.output_dir}"
+            )
+        else:
+            self.info_label.setText(
+                "Profiling is off. Enable it in Settings → Performance "
+                "or start with AI_TEXTPAD_PROFILE=1."
+            )
+
+    def _refresh_event_loop(self):
+        """Reload the lag histogram and blocked calls from the watchdog."""
+        if self.watchdog is None:
+            self.lag_label.setText("Event loop watchdog is not running.")
+            return
+
+        self.lag_label.setText(
+            f"Loop lag p50 {self.watchdog.percentile(0.5) * 1000:.1f} ms, "
+            f"p99 {self.watchdog.percentile(0.99) * 1000:.1f} ms, "
+            f"max {self.watchdog.max_lag * 1000:.0f} ms. Calls blocking longer than "
+            f"{self.watchdog.threshold * 1000:.0f} ms are listed with their stack."
+        )
+
+        histogram = self.watchdog.histogram()
+        largest = max((count for _, count in histogram), default=0) or 1
+        self._fill_table(self.lag_table, [
+            (label, count, "█" * round(40 * count / largest))
+            for label, count in histogram
+        ])
+
+        self.blocked_calls = list(reversed(self.watchdog.blocked_calls))
+        current_row = self.blocked_table.currentRow()
+        self._fill_table(self.blocked_table, [
+            (
+                call.location,
+                round(call.duration * 1000) if call.resolved else f"> {call.duration * 1000:.0f}",
+                datetime.fromtimestamp(call.started).strftime("%H:%M:%S"),
+            )
+            for call in self.blocked_calls
+        ])
+        if 0 <= current_row < len(self.blocked_calls):
+            self.blocked_table.setCurrentCell(current_row, 0)
+
+    def _show_blocked_stack(self, row: int, *args):
+        """Show the captured stack of the selected blocked call."""
+        if 0 <= row < len(self.blocked_calls):
+            self.stack_view.setPlainText(self.blocked_calls[row].stack)
+
+    def showEvent(self, event):
+        """Start live updates when shown."""
+        super().showEvent(event)
+        self.live_timer.start()
+
+    def hideEvent(self, event):
+        """Stop live updates when hidden."""
+        super().hideEvent(event)
+        self.live_timer.stop()
+
+    def _open_profiles_folder(self):
+        """Open the profiles directory in the file manager."""
+        if profiler.output_dir:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(profiler.output_dir)))
+
+    def _save_snapshot(self):
+        """Dump a tracemalloc snapshot to the profiles directory."""
+        path = profiler.save_memory_snapshot()
+        if path:
+            self.info_label.setText(f"Memory snapshot saved to {path}")
+
+    def _clear(self):
+        """Clear recorded operations."""
+        profiler.clear()
+        if self.watchdog:
+            self.watchdog.reset()
+        self.refresh()
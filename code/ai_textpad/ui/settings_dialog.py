@@ -3,11 +3,14 @@
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit,
     QPushButton, QLabel, QComboBox, QTabWidget, QWidget, QTextEdit,
-    QMessageBox
+    QMessageBox, QCheckBox
 )
 from PyQt6.QtCore import Qt
+from typing import Optional
 
+from ..api.model_registry import AUTO_MODEL, DEFAULT_CANDIDATES, ModelRegistry
 from ..storage.database import ConfigDatabase
+from ..profiling import PROFILE_ENV, default_profiles_dir
 
 
 class SettingsDialog(QDialog):
@@ -15,6 +18,7 @@ class SettingsDialog(QDialog):
 
     DEFAULT_MODELS = [
         "openai/gpt-4o-mini",
+        AUTO_MODEL,
         "openai/gpt-4o-nano",
         "x-ai/grok-4-fast",
         "google/gemini-2.5-flash-lite",
@@ -23,15 +27,18 @@ class SettingsDialog(QDialog):
         "cognitivecomputations/dolphin-mistral-24b-venice-edition:free",
     ]
 
-    def __init__(self, db: ConfigDatabase, parent=None):
+    def __init__(self, db: ConfigDatabase, parent=None,
+                 models: Optional[ModelRegistry] = None):
         """Initialize settings dialog.
 
         Args:
             db: Database instance
             parent: Parent widget
+            models: Model registry with measured speeds (default: catalog only)
         """
         super().__init__(parent)
         self.db = db
+        self.models = models or ModelRegistry(db)
 
         self.setWindowTitle("Settings")
         self.setMinimumSize(600, 400)
@@ -60,18 +67,41 @@ class SettingsDialog(QDialog):
         api_layout.addRow("", show_key_btn)
 
         self.model_combo = QComboBox()
-        self.model_combo.addItems(self.DEFAULT_MODELS)
+        self._populate_models()
         self.model_combo.setEditable(True)
         api_layout.addRow("Model:", self.model_combo)
 
+        self.auto_candidates_input = QLineEdit()
+        self.auto_candidates_input.setPlaceholderText(", ".join(DEFAULT_CANDIDATES))
+        api_layout.addRow("Auto Candidates:", self.auto_candidates_input)
+
         api_info = QLabel(
             "Get your API key from: https://openrouter.ai/keys\n"
-            "Default model: openai/gpt-4o-mini"
+            "Default model: openai/gpt-4o-mini\n"
+            f"\"{AUTO_MODEL}\" picks whichever candidate model is currently "
+            "responding fastest, measured by small background probes."
         )
         api_info.setWordWrap(True)
         api_info.setStyleSheet("color: gray; font-size: 10pt;")
         api_layout.addRow("", api_info)
 
+        # Local OpenAI-compatible backend
+        self.local_url_input = QLineEdit()
+        self.local_url_input.setPlaceholderText("http://127.0.0.1:8080/v1")
+        api_layout.addRow("Local Server URL:", self.local_url_input)
+
+        self.local_model_input = QLineEdit()
+        self.local_model_input.setPlaceholderText("local")
+        api_layout.addRow("Local Model:", self.local_model_input)
+
+        local_info = QLabel(
+            "Optional OpenAI-compatible server (llama.cpp server, vLLM...). "
+            "Transformations with \"backend: local\" in their frontmatter run here."
+        )
+        local_info.setWordWrap(True)
+        local_info.setStyleSheet("color: gray; font-size: 10pt;")
+        api_layout.addRow("", local_info)
+
         self.tab_widget.addTab(api_tab, "API Settings")
 
         # User Details tab
@@ -104,6 +134,38 @@ class SettingsDialog(QDialog):
 
         self.tab_widget.addTab(user_tab, "User Details")
 
+        # Performance tab
+        performance_tab = QWidget()
+        performance_layout = QFormLayout(performance_tab)
+
+        self.profiling_checkbox = QCheckBox("Enable profiling")
+        performance_layout.addRow("", self.profiling_checkbox)
+
+        performance_info = QLabel(
+            "Records timings of transforms, dialogs and database calls, CPU samples "
+            "and memory usage. View them under Performance (Ctrl+Shift+P).\n"
+            f"Profiles are written to {default_profiles_dir()}\n"
+            f"Can also be enabled for one session with {PROFILE_ENV}=1."
+        )
+        performance_info.setWordWrap(True)
+        performance_info.setStyleSheet("color: gray; font-size: 10pt;")
+        performance_layout.addRow("", performance_info)
+
+        self.clear_cache_button = QPushButton()
+        self.clear_cache_button.clicked.connect(self._clear_step_cache)
+        performance_layout.addRow("Step Cache:", self.clear_cache_button)
+        self._update_step_cache_button()
+
+        cache_info = QLabel(
+            "Cached outputs of pipeline steps and incremental paragraphs. Entries "
+            "older than 30 days are removed on startup."
+        )
+        cache_info.setWordWrap(True)
+        cache_info.setStyleSheet("color: gray; font-size: 10pt;")
+        performance_layout.addRow("", cache_info)
+
+        self.tab_widget.addTab(performance_tab, "Performance")
+
         layout.addWidget(self.tab_widget)
 
         # Buttons
@@ -122,6 +184,32 @@ class SettingsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+    def _update_step_cache_button(self):
+        """Show the step cache size on the clear button."""
+        count = self.db.count_cached_steps()
+        self.clear_cache_button.setText(f"Clear Step Cache ({count} entries)")
+        self.clear_cache_button.setEnabled(count > 0)
+
+    def _clear_step_cache(self):
+        """Remove every cached step output."""
+        self.db.clear_step_cache()
+        self._update_step_cache_button()
+
+    def _populate_models(self):
+        """Fill the model list: defaults first, then the cached provider catalog.
+
+        Each entry's tooltip shows its context length, pricing and measured speed.
+        """
+        model_ids = list(self.DEFAULT_MODELS)
+        model_ids += [m["id"] for m in self.models.catalog() if m["id"] not in model_ids]
+        for model_id in model_ids:
+            self.model_combo.addItem(model_id)
+            description = self.models.describe(model_id)
+            if description:
+                self.model_combo.setItemData(
+                    self.model_combo.count() - 1, description, Qt.ItemDataRole.ToolTipRole
+                )
+
     def _toggle_api_key_visibility(self):
         """Toggle API key visibility."""
         if self.api_key_input.echoMode() == QLineEdit.EchoMode.Password:
@@ -141,17 +229,27 @@ class SettingsDialog(QDialog):
             self.model_combo.setCurrentIndex(index)
         else:
             self.model_combo.setCurrentText(model)
+        self.auto_candidates_input.setText(
+            ", ".join(self.db.get_config("auto_model_candidates") or [])
+        )
+
+        self.local_url_input.setText(self.db.get_config("local_backend_url", ""))
+        self.local_model_input.setText(self.db.get_config("local_backend_model", ""))
 
         # User details
         self.name_input.setText(self.db.get_user_detail("name", ""))
         self.email_input.setText(self.db.get_user_detail("email", ""))
         self.additional_info.setPlainText(self.db.get_user_detail("additional_info", ""))
 
+        # Performance
+        self.profiling_checkbox.setChecked(bool(self.db.get_config("profiling_enabled", False)))
+
     def _save_settings(self):
         """Save settings to database."""
         # Validate API key
         api_key = self.api_key_input.text().strip()
-        if not api_key:
+        local_url = self.local_url_input.text().strip()
+        if not api_key and not local_url:
             reply = QMessageBox.question(
                 self,
                 "No API Key",
@@ -168,6 +266,13 @@ class SettingsDialog(QDialog):
         model = self.model_combo.currentText().strip()
         if model:
             self.db.set_config("model", model)
+        self.db.set_config("auto_model_candidates", [
+            candidate.strip() for candidate in self.auto_candidates_input.text().split(",")
+            if candidate.strip()
+        ])
+
+        self.db.set_config("local_backend_url", local_url)
+        self.db.set_config("local_backend_model", self.local_model_input.text().strip())
 
         # Save user details
         name = self.name_input.text().strip()
@@ -182,6 +287,8 @@ class SettingsDialog(QDialog):
         if additional:
             self.db.set_user_detail("additional_info", additional)
 
+        self.db.set_config("profiling_enabled", self.profiling_checkbox.isChecked())
+
         QMessageBox.information(
             self,
             "Settings Saved",
@@ -1,13 +1,18 @@
 """Dialog for selecting text transformations."""
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem,
-    QPushButton, QLabel, QLineEdit, QTabWidget, QWidget, QMessageBox
+    QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListView,
+    QPushButton, QLabel, QLineEdit, QTabBar, QMessageBox, QCheckBox, QApplication
 )
-from PyQt6.QtCore import Qt
-from typing import List, Tuple
+from PyQt6.QtCore import QEvent, QModelIndex, Qt
+from PyQt6.QtGui import QKeySequence, QShortcut
+from typing import List, Optional, Tuple
 
 from ..storage.database import ConfigDatabase
+from ..transforms.speculative import MAX_PINS
+from .transformation_model import (
+    TransformationFilterProxy, TransformationListModel, TransformationRole
+)
 
 
 class TransformDialog(QDialog):
@@ -15,15 +20,23 @@ class TransformDialog(QDialog):
 
     MAX_SELECTIONS = 5
 
-    def __init__(self, db: ConfigDatabase, parent=None):
+    # Keys that move through the results while typing in the search box
+    NAVIGATION_KEYS = (
+        Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_PageUp, Qt.Key.Key_PageDown
+    )
+
+    def __init__(self, db: ConfigDatabase, parent=None,
+                 model: Optional[TransformationListModel] = None):
         """Initialize transform dialog.
 
         Args:
             db: Database instance
             parent: Parent widget
+            model: Shared catalog model (default: load one from the database)
         """
         super().__init__(parent)
         self.db = db
+        self.model = model or TransformationListModel.from_database(db, self)
         self.selected_items = []
 
         self.setWindowTitle("Select Transformations")
@@ -46,15 +59,28 @@ class TransformDialog(QDialog):
         search_layout = QHBoxLayout()
         search_label = QLabel("Search:")
         self.search_box = QLineEdit()
-        self.search_box.setPlaceholderText("Type to filter transformations...")
+        self.search_box.setPlaceholderText(
+            "Type to search (↑/↓ to move, Enter to select, Ctrl+Enter to apply)"
+        )
         self.search_box.textChanged.connect(self._filter_transformations)
+        self.search_box.installEventFilter(self)
         search_layout.addWidget(search_label)
         search_layout.addWidget(self.search_box)
         layout.addLayout(search_layout)
 
-        # Tabs for categories
-        self.tab_widget = QTabWidget()
-        layout.addWidget(self.tab_widget)
+        # Category tabs over a single filtered view of the shared model
+        self.category_tabs = QTabBar()
+        self.category_tabs.setExpanding(False)
+        layout.addWidget(self.category_tabs)
+
+        self.proxy = TransformationFilterProxy(self)
+        self.proxy.setSourceModel(self.model)
+        self.list_view = QListView()
+        self.list_view.setModel(self.proxy)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.clicked.connect(self._on_item_clicked)
+        self.list_view.installEventFilter(self)
+        layout.addWidget(self.list_view)
 
         # Selected transformations display
         selected_label = QLabel("Selected transformations:")
@@ -63,12 +89,49 @@ class TransformDialog(QDialog):
         layout.addWidget(selected_label)
         layout.addWidget(self.selected_list)
 
+        # Pipeline mode toggle
+        self.pipeline_checkbox = QCheckBox(
+            "Run as pipeline (apply one at a time, reuse cached steps)"
+        )
+        self.pipeline_checkbox.setChecked(bool(self.db.get_config("pipeline_mode", False)))
+        layout.addWidget(self.pipeline_checkbox)
+
+        # Variants mode: each transformation (and model) as its own request
+        self.variants_checkbox = QCheckBox(
+            "Compare as variants (run each transformation separately, side by side)"
+        )
+        layout.addWidget(self.variants_checkbox)
+
+        models_layout = QHBoxLayout()
+        models_layout.addWidget(QLabel("Compare models:"))
+        self.variant_models_input = QLineEdit()
+        self.variant_models_input.setPlaceholderText(
+            "Optional, comma separated (e.g. openai/gpt-4o-mini, anthropic/claude-3-haiku)"
+        )
+        self.variant_models_input.setText(self.db.get_config("variant_models", ""))
+        models_layout.addWidget(self.variant_models_input)
+        layout.addLayout(models_layout)
+
+        # The modes are exclusive
+        self.pipeline_checkbox.toggled.connect(
+            lambda checked: checked and self.variants_checkbox.setChecked(False)
+        )
+        self.variants_checkbox.toggled.connect(self._on_variants_toggled)
+        self._on_variants_toggled(False)
+
         # Buttons
         button_layout = QHBoxLayout()
 
         self.clear_button = QPushButton("Clear Selection")
         self.clear_button.clicked.connect(self._clear_selection)
 
+        self.pin_button = QPushButton("Pin/Unpin Selected")
+        self.pin_button.setToolTip(
+            "Pinned transformations get a toolbar button and start in the "
+            "background as soon as text is pasted"
+        )
+        self.pin_button.clicked.connect(self._toggle_pins)
+
         self.ok_button = QPushButton("Apply Transformations")
         self.ok_button.clicked.connect(self.accept)
         self.ok_button.setDefault(True)
@@ -77,57 +140,123 @@ class TransformDialog(QDialog):
         cancel_button.clicked.connect(self.reject)
 
         button_layout.addWidget(self.clear_button)
+        button_layout.addWidget(self.pin_button)
         button_layout.addStretch()
         button_layout.addWidget(cancel_button)
         button_layout.addWidget(self.ok_button)
 
         layout.addLayout(button_layout)
 
-    def _load_transformations(self):
-        """Load transformations from database."""
-        # Get all categories
-        categories = self.db.get_categories()
+        # Keyboard-only use: Ctrl+Enter applies, Ctrl+F returns to the search box
+        for keys in ("Ctrl+Return", "Ctrl+Enter"):
+            QShortcut(QKeySequence(keys), self, activated=self.accept)
+        QShortcut(QKeySequence("Ctrl+F"), self, activated=self.search_box.setFocus)
+        self.search_box.setFocus()
+
+    def eventFilter(self, obj, event) -> bool:
+        """Handle keyboard selection from the search box and the list.
 
-        if not categories:
+        In the search box, arrow/page keys move through the results and Enter
+        toggles the current result; in the list, Enter or Space toggles it.
+        """
+        if event.type() != QEvent.Type.KeyPress:
+            return super().eventFilter(obj, event)
+
+        key = event.key()
+        plain = not (event.modifiers() & Qt.KeyboardModifier.ControlModifier)
+        if obj is self.search_box and key in self.NAVIGATION_KEYS:
+            QApplication.sendEvent(self.list_view, event)
+            return True
+        if plain and (
+            key in (Qt.Key.Key_Return, Qt.Key.Key_Enter) or
+            (obj is self.list_view and key == Qt.Key.Key_Space)
+        ):
+            index = self.list_view.currentIndex()
+            if index.isValid():
+                self._on_item_clicked(index)
+            return True
+        return super().eventFilter(obj, event)
+
+    def _on_variants_toggled(self, checked: bool):
+        """Enable the model list only in variants mode."""
+        if checked:
+            self.pipeline_checkbox.setChecked(False)
+        self.variant_models_input.setEnabled(checked)
+
+    def _select_first_result(self):
+        """Make the top result current so Enter picks it."""
+        if self.proxy.rowCount():
+            self.list_view.setCurrentIndex(self.proxy.index(0, 0))
+
+    def _load_transformations(self):
+        """Attach the catalog model and create one tab per category."""
+        if self.model.rowCount() == 0:
             # Show message if no transformations loaded
             QMessageBox.information(
                 self,
                 "No Transformations",
                 "No transformations found. Please load transformation prompts first."
             )
-            return
 
-        # Create a tab for each category
-        for category in categories:
-            list_widget = QListWidget()
-            list_widget.itemClicked.connect(self._on_item_clicked)
-
-            # Load transformations for this category
-            transformations = self.db.get_transformations(category)
-            for trans in transformations:
-                item = QListWidgetItem(trans['name'])
-                item.setData(Qt.ItemDataRole.UserRole, trans)
-                list_widget.addItem(item)
-
-            self.tab_widget.addTab(list_widget, category)
-
-        # Add "All" tab
-        all_list = QListWidget()
-        all_list.itemClicked.connect(self._on_item_clicked)
-        all_transformations = self.db.get_transformations()
-        for trans in all_transformations:
-            item = QListWidgetItem(f"{trans['name']} ({trans['category']})")
-            item.setData(Qt.ItemDataRole.UserRole, trans)
-            all_list.addItem(item)
-        self.tab_widget.insertTab(0, all_list, "All")
-
-    def _on_item_clicked(self, item: QListWidgetItem):
+        # Tabs only switch the proxy's category filter; there is a single view
+        self.category_tabs.addTab("All")
+        for category in self.model.categories():
+            self.category_tabs.addTab(category)
+        self.category_tabs.currentChanged.connect(self._on_tab_changed)
+
+    def _on_tab_changed(self, index: int):
+        """Show the category of the selected tab.
+
+        Args:
+            index: Tab index (0 is "All")
+        """
+        self.proxy.set_category(None if index <= 0 else self.category_tabs.tabText(index))
+        self._select_first_result()
+
+    def _ensure_category_tab(self, category: str):
+        """Add a tab for a category that appeared after the dialog opened.
+
+        Args:
+            category: Category name
+        """
+        for i in range(1, self.category_tabs.count()):
+            if self.category_tabs.tabText(i) == category:
+                return
+        self.category_tabs.addTab(category)
+
+    def upsert_transformation(self, trans: dict):
+        """Insert or update a transformation in place (e.g. after a prompt file changed).
+
+        Args:
+            trans: Transformation dictionary
+        """
+        self.model.upsert(trans)
+        self._ensure_category_tab(trans['category'])
+        self.proxy.refresh_search()
+
+        # Keep selections pointing at the latest prompt text
+        self.selected_items = [
+            trans if t['id'] == trans['id'] else t for t in self.selected_items
+        ]
+        self._update_selected_list()
+
+    def remove_transformation(self, transformation_id: int):
+        """Remove a transformation in place (e.g. after its prompt file was deleted).
+
+        Args:
+            transformation_id: Transformation ID
+        """
+        self.model.remove(transformation_id)
+        self.selected_items = [t for t in self.selected_items if t['id'] != transformation_id]
+        self._update_selected_list()
+
+    def _on_item_clicked(self, index: QModelIndex):
         """Handle transformation item click.
 
         Args:
-            item: Clicked list item
+            index: Clicked proxy index
         """
-        trans = item.data(Qt.ItemDataRole.UserRole)
+        trans = index.data(TransformationRole)
 
         # Check if already selected
         if any(t['id'] == trans['id'] for t in self.selected_items):
@@ -158,27 +287,37 @@ class TransformDialog(QDialog):
         self.selected_items = []
         self._update_selected_list()
 
+    def _toggle_pins(self):
+        """Pin the selected transformations, or unpin them if all are pinned."""
+        # Pins are keyed by prompt file: names are not unique and ids change on reseed
+        paths = [t['source_path'] for t in self.selected_items if t.get('source_path')]
+        if not paths:
+            return
+        pinned = self.db.get_config("pinned_transformations") or []
+        # Drop pins whose prompt file is gone so they don't count towards the limit
+        existing = {t['source_path'] for t in self.db.get_transformations_by_source(pinned)}
+        pinned = [path for path in pinned if path in existing]
+        if all(path in pinned for path in paths):
+            pinned = [path for path in pinned if path not in paths]
+        else:
+            pinned += [path for path in paths if path not in pinned]
+            if len(pinned) > MAX_PINS:
+                QMessageBox.warning(
+                    self,
+                    "Too Many Pins",
+                    f"You can pin up to {MAX_PINS} transformations."
+                )
+                return
+        self.db.set_config("pinned_transformations", pinned)
+
     def _filter_transformations(self, text: str):
-        """Filter transformations based on search text.
+        """Filter and rank transformations by fuzzy search text.
 
         Args:
             text: Search query
         """
-        text = text.lower()
-
-        # Filter each tab
-        for i in range(self.tab_widget.count()):
-            list_widget = self.tab_widget.widget(i)
-            if isinstance(list_widget, QListWidget):
-                for j in range(list_widget.count()):
-                    item = list_widget.item(j)
-                    trans = item.data(Qt.ItemDataRole.UserRole)
-                    # Show if name or category matches
-                    matches = (
-                        text in trans['name'].lower() or
-                        text in trans['category'].lower()
-                    )
-                    item.setHidden(not matches)
+        self.proxy.set_search_text(text)
+        self._select_first_result()
 
     def get_selected_transformations(self) -> List[Tuple[str, str]]:
         """Get selected transformations as (name, prompt) tuples.
@@ -187,3 +326,38 @@ class TransformDialog(QDialog):
             List of (name, prompt) tuples
         """
         return [(t['name'], t['prompt']) for t in self.selected_items]
+
+    def get_selected_metadata(self) -> List[dict]:
+        """Get frontmatter metadata of the selected transformations.
+
+        Returns:
+            List of metadata dictionaries, in selection order
+        """
+        return [t.get('metadata') or {} for t in self.selected_items]
+
+    def get_pipeline_mode(self) -> bool:
+        """Get whether selected transformations should run as a pipeline.
+
+        Returns:
+            True if pipeline mode is enabled
+        """
+        return self.pipeline_checkbox.isChecked()
+
+    def get_variants_mode(self) -> bool:
+        """Get whether selected transformations should be compared as variants.
+
+        Returns:
+            True if variants mode is enabled
+        """
+        return self.variants_checkbox.isChecked()
+
+    def get_variant_models(self) -> List[str]:
+        """Get the models to compare in variants mode.
+
+        Returns:
+            Model identifiers (empty to use the routed model)
+        """
+        return [
+            model.strip() for model in self.variant_models_input.text().split(",")
+            if model.strip()
+        ]
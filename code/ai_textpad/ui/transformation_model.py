@@ -0,0 +1,185 @@
+"""Item model over the transformation catalog, shared by all dialog tabs."""
+
+from typing import Dict, List, Optional
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, QSortFilterProxyModel, Qt
+
+from ..storage.database import ConfigDatabase
+from ..transforms.search import TrigramIndex
+
+# Custom item data roles
+TransformationRole = Qt.ItemDataRole.UserRole
+CategoryRole = Qt.ItemDataRole.UserRole + 1
+
+
+class TransformationListModel(QAbstractListModel):
+    """List model holding every transformation dictionary once.
+
+    A trigram search index over the catalog is built alongside and kept in
+    sync with upserts and removals.
+    """
+
+    def __init__(self, transformations: Optional[List[dict]] = None, parent=None,
+                 search_index: Optional[TrigramIndex] = None):
+        """Initialize transformation model.
+
+        Args:
+            transformations: Initial transformation dictionaries
+            parent: Parent QObject
+            search_index: Prebuilt index over transformations (default: build it)
+        """
+        super().__init__(parent)
+        self.transformations: List[dict] = list(transformations or [])
+        self._rows: Dict[int, int] = {}
+        self._reindex()
+
+        self.search_index = search_index or TrigramIndex.from_transformations(self.transformations)
+
+    @classmethod
+    def from_database(cls, db: ConfigDatabase, parent=None) -> "TransformationListModel":
+        """Build a model over all transformations in the database.
+
+        Args:
+            db: Database instance
+            parent: Parent QObject
+
+        Returns:
+            Loaded model
+        """
+        return cls(db.get_transformations(), parent)
+
+    def _reindex(self):
+        """Rebuild the id -> row lookup."""
+        self._rows = {trans['id']: row for row, trans in enumerate(self.transformations)}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Number of transformations."""
+        return 0 if parent.isValid() else len(self.transformations)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Item data for a row."""
+        if not index.isValid():
+            return None
+        trans = self.transformations[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return trans['name']
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return trans['category']
+        if role == TransformationRole:
+            return trans
+        if role == CategoryRole:
+            return trans['category']
+        return None
+
+    def categories(self) -> List[str]:
+        """Get the sorted distinct categories."""
+        return sorted({trans['category'] for trans in self.transformations})
+
+    def upsert(self, trans: dict):
+        """Insert a transformation or update it in place.
+
+        Args:
+            trans: Transformation dictionary
+        """
+        self.search_index.add(trans)
+
+        row = self._rows.get(trans['id'])
+        if row is not None:
+            self.transformations[row] = trans
+            index = self.index(row)
+            self.dataChanged.emit(index, index)
+            return
+
+        row = len(self.transformations)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.transformations.append(trans)
+        self._rows[trans['id']] = row
+        self.endInsertRows()
+
+    def remove(self, transformation_id: int):
+        """Remove a transformation if present.
+
+        Args:
+            transformation_id: Transformation ID
+        """
+        self.search_index.remove(transformation_id)
+
+        row = self._rows.get(transformation_id)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self.transformations[row]
+        self._reindex()
+        self.endRemoveRows()
+
+
+class TransformationFilterProxy(QSortFilterProxyModel):
+    """Filters the shared model by category and ranks it by fuzzy search."""
+
+    def __init__(self, parent=None):
+        """Initialize filter proxy.
+
+        Args:
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.category: Optional[str] = None
+        self.search_text = ""
+        self.scores: Dict[int, float] = {}
+
+    def set_category(self, category: Optional[str]):
+        """Show only one category (None shows all, labelled with their category).
+
+        Args:
+            category: Category name or None
+        """
+        self.category = category
+        self.invalidateFilter()
+        # Display text depends on the category filter
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, 0))
+
+    def set_search_text(self, text: str):
+        """Filter and rank by search text (empty restores catalog order).
+
+        Args:
+            text: Search query
+        """
+        self.search_text = text.strip()
+        self.refresh_search()
+
+    def refresh_search(self):
+        """Re-run the current search (e.g. after the catalog changed)."""
+        if self.search_text:
+            self.scores = dict(self.sourceModel().search_index.search(self.search_text))
+        else:
+            self.scores = {}
+        self.invalidateFilter()
+        if self.search_text:
+            self.sort(0, Qt.SortOrder.DescendingOrder)
+        else:
+            self.sort(-1)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        """Accept rows in the current category that match the search."""
+        trans = self.sourceModel().transformations[source_row]
+        if self.category is not None and trans['category'] != self.category:
+            return False
+        return not self.search_text or trans['id'] in self.scores
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        """Order by search score (ties keep catalog order)."""
+        model = self.sourceModel()
+        left_score = self.scores.get(model.transformations[left.row()]['id'], 0.0)
+        right_score = self.scores.get(model.transformations[right.row()]['id'], 0.0)
+        if left_score == right_score:
+            return left.row() > right.row()
+        return left_score < right_score
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Label items with their category in the "All" view."""
+        if role == Qt.ItemDataRole.DisplayRole and self.category is None:
+            trans = super().data(index, TransformationRole)
+            if trans is not None:
+                return f"{trans['name']} ({trans['category']})"
+        return super().data(index, role)
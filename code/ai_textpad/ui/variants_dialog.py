@@ -0,0 +1,151 @@
+"""Side-by-side comparison of variants streamed from concurrent requests."""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSplitter, QTextEdit, QWidget
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QTextCursor
+
+from ..transforms.variants import Variant, start_variants
+
+
+class VariantsDialog(QDialog):
+    """Window-modal dialog showing each variant in its own column as it streams."""
+
+    def __init__(self, variants: List[Variant], parent=None):
+        """Initialize variants dialog.
+
+        Args:
+            variants: Variants to compare
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.variants = variants
+        self.tasks: List[asyncio.Task] = []
+        self.outputs: Dict[int, str] = {}
+        self.chosen: Optional[int] = None
+        self.started_at = 0.0
+
+        self.setWindowTitle("Compare Variants")
+        self.setMinimumSize(min(300 * len(variants), 1400), 500)
+        self.setWindowModality(Qt.WindowModality.WindowModal)
+
+        self._setup_ui()
+
+    def _setup_ui(self):
+        """Set up the user interface."""
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel()
+        layout.addWidget(self.summary_label)
+
+        splitter = QSplitter(Qt.Orientation.Horizontal)
+        self.status_labels: List[QLabel] = []
+        self.text_edits: List[QTextEdit] = []
+        self.use_buttons: List[QPushButton] = []
+        for index, variant in enumerate(self.variants):
+            column = QWidget()
+            column_layout = QVBoxLayout(column)
+            column_layout.setContentsMargins(0, 0, 0, 0)
+
+            title = QLabel(f"<b>{variant.label}</b>")
+            title.setTextFormat(Qt.TextFormat.RichText)
+            status = QLabel("Waiting...")
+            text_edit = QTextEdit()
+            text_edit.setReadOnly(True)
+            use_button = QPushButton("Use This")
+            use_button.setEnabled(False)
+            use_button.clicked.connect(lambda _, index=index: self._choose(index))
+
+            column_layout.addWidget(title)
+            column_layout.addWidget(status)
+            column_layout.addWidget(text_edit)
+            column_layout.addWidget(use_button)
+            splitter.addWidget(column)
+
+            self.status_labels.append(status)
+            self.text_edits.append(text_edit)
+            self.use_buttons.append(use_button)
+        layout.addWidget(splitter)
+
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+        cancel_button = QPushButton("Discard All")
+        cancel_button.clicked.connect(self.reject)
+        button_layout.addWidget(cancel_button)
+        layout.addLayout(button_layout)
+
+    def start(self, backends, text: str, user_details: Optional[Dict[str, str]] = None):
+        """Send every variant's request at once.
+
+        Args:
+            backends: BackendRegistry used to route the requests
+            text: Text to transform
+            user_details: Optional user details to inject
+        """
+        self.started_at = time.perf_counter()
+        self.tasks = start_variants(backends, self.variants, text, user_details, self._append)
+        for index, task in enumerate(self.tasks):
+            self.status_labels[index].setText("Streaming...")
+            task.add_done_callback(lambda task, index=index: self._on_variant_done(index, task))
+        self._update_summary()
+
+    def _append(self, index: int, delta: str):
+        """Append a streamed fragment to a variant's column."""
+        text_edit = self.text_edits[index]
+        text_edit.moveCursor(QTextCursor.MoveOperation.End)
+        text_edit.insertPlainText(delta)
+
+    def _on_variant_done(self, index: int, task: asyncio.Task):
+        """Show a variant's final output or error."""
+        if task.cancelled():
+            return
+        elapsed = time.perf_counter() - self.started_at
+        error = task.exception()
+        if error is not None:
+            self.status_labels[index].setText(f"Failed after {elapsed:.1f}s: {error}")
+        else:
+            self.outputs[index] = task.result()
+            self.text_edits[index].setPlainText(self.outputs[index])
+            self.status_labels[index].setText(f"Done in {elapsed:.1f}s")
+            self.use_buttons[index].setEnabled(True)
+        self._update_summary()
+
+    def _update_summary(self):
+        """Show how many variants have finished."""
+        finished = sum(task.done() for task in self.tasks)
+        if finished < len(self.tasks):
+            self.summary_label.setText(
+                f"Comparing {len(self.tasks)} variants ({finished} finished)..."
+            )
+        else:
+            elapsed = time.perf_counter() - self.started_at
+            self.summary_label.setText(
+                f"All {len(self.tasks)} variants finished in {elapsed:.1f}s. "
+                f"Pick one to keep."
+            )
+
+    def _choose(self, index: int):
+        """Keep a variant and close the dialog."""
+        self.chosen = index
+        self.accept()
+
+    def chosen_variant(self) -> Optional[Tuple[str, str]]:
+        """Get the variant the user kept.
+
+        Returns:
+            Tuple of (label, output), or None if every variant was discarded
+        """
+        if self.chosen is None:
+            return None
+        return self.variants[self.chosen].label, self.outputs[self.chosen]
+
+    def done(self, result: int):
+        """Cancel requests still streaming when the dialog closes."""
+        for task in self.tasks:
+            task.cancel()
+        super().done(result)
@@ -0,0 +1 @@
+"""Benchmark suite for AI-Textpad (run with: python -m benchmarks)."""
@@ -0,0 +1,5 @@
+"""Allow running the benchmark suite with ``python -m benchmarks``."""
+
+from .run import main
+
+main()
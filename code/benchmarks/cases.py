@@ -0,0 +1,266 @@
+"""Benchmark cases for loader, database, search, version store and API client.
+
+Each case is registered with @benchmark and receives the shared
+BenchmarkContext and one parameter value. It performs any setup and returns
+the operation to time (a plain or async zero-argument callable).
+"""
+
+import asyncio
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from ai_textpad.api.openrouter import OpenRouterClient
+from ai_textpad.devtools.mock_server import MockOpenRouterServer
+from ai_textpad.storage.database import ConfigDatabase
+from ai_textpad.transforms.catalog_bundle import CatalogBundle
+from ai_textpad.transforms.incremental import IncrementalTransform
+from ai_textpad.transforms.loader import TransformLoader
+from ai_textpad.transforms.search import TrigramIndex
+from ai_textpad.transforms.version_manager import VersionManager
+
+from .fixtures import make_document, make_history, make_prompt_tree
+
+KB = 1024
+MB = 1024 * 1024
+
+
+class Case(NamedTuple):
+    """A registered benchmark case."""
+    name: str
+    func: Callable[..., Any]
+    params: List[Any]
+    quick_params: List[Any]
+    repeat: int
+
+
+CASES: List[Case] = []
+
+
+def benchmark(name: str, params: List[Any], quick: Optional[List[Any]] = None,
+              repeat: int = 5):
+    """Register a benchmark case.
+
+    Args:
+        name: Case name (parameter value is appended)
+        params: Parameter values for a full run
+        quick: Parameter values for --quick runs (default: first value)
+        repeat: Number of timed repetitions
+    """
+    def decorator(func):
+        CASES.append(Case(name, func, params, quick or params[:1], repeat))
+        return func
+    return decorator
+
+
+class BenchmarkContext:
+    """Shared fixtures (temporary directory, event loop, mock endpoint)."""
+
+    def __init__(self):
+        """Initialize benchmark context."""
+        self._tmp = tempfile.TemporaryDirectory(prefix="ai-textpad-bench-")
+        self.root = Path(self._tmp.name)
+        self.loop = asyncio.new_event_loop()
+        self._prompt_trees: Dict[int, Path] = {}
+        self._endpoint: Optional[MockOpenRouterServer] = None
+        self._clients: List[OpenRouterClient] = []
+
+    def prompt_tree(self, count: int) -> Path:
+        """Get (and cache) a synthetic prompt tree with count files."""
+        if count not in self._prompt_trees:
+            self._prompt_trees[count] = make_prompt_tree(self.root, count)
+        return self._prompt_trees[count]
+
+    def database(self, name: str, compress: bool = True) -> ConfigDatabase:
+        """Create a fresh database in the temporary directory."""
+        path = self.root / f"{name}.db"
+        if path.exists():
+            path.unlink()
+        return ConfigDatabase(path, compress=compress)
+
+    def endpoint(self) -> MockOpenRouterServer:
+        """Get the running mock chat completions endpoint."""
+        if self._endpoint is None:
+            self._endpoint = MockOpenRouterServer(seed=0)
+            self.loop.run_until_complete(self._endpoint.start())
+        return self._endpoint
+
+    def client(self) -> OpenRouterClient:
+        """Create an OpenRouterClient pointed at the mock endpoint."""
+        client = OpenRouterClient("bench-key", "bench/model", base_url=self.endpoint().base_url)
+        self._clients.append(client)
+        return client
+
+    def close(self):
+        """Release all fixtures."""
+        for client in self._clients:
+            self.loop.run_until_complete(client.close())
+        if self._endpoint:
+            self.loop.run_until_complete(self._endpoint.stop())
+        self.loop.close()
+        self._tmp.cleanup()
+
+
+# --- TransformLoader ---------------------------------------------------------
+
+@benchmark("loader.scan", [200, 2000, 20000], quick=[200, 2000], repeat=3)
+def loader_scan(ctx: BenchmarkContext, count: int):
+    loader = TransformLoader(ctx.prompt_tree(count), bundle_path=ctx.root / "missing.bundle")
+    return loader.load_from_directory
+
+
+@benchmark("loader.bundle", [200, 2000, 20000], quick=[200, 2000], repeat=3)
+def loader_bundle(ctx: BenchmarkContext, count: int):
+    prompts_dir = ctx.prompt_tree(count)
+    bundle_path = ctx.root / f"catalog_{count}.bundle"
+    CatalogBundle.build(TransformLoader(prompts_dir), bundle_path)
+
+    def load():
+        # A fresh loader per call, so each one maps and checks the bundle
+        loader = TransformLoader(prompts_dir, bundle_path=bundle_path)
+        try:
+            return loader.load_from_directory()
+        finally:
+            loader.close()
+    return load
+
+
+# --- ConfigDatabase ----------------------------------------------------------
+
+def _seeded_database(ctx: BenchmarkContext, count: int) -> ConfigDatabase:
+    db = ctx.database(f"seeded_{count}")
+    loader = TransformLoader(ctx.prompt_tree(count), bundle_path=ctx.root / "missing.bundle")
+    db.replace_default_transformations(loader.load_from_directory())
+    return db
+
+
+@benchmark("db.seed", [200, 2000, 20000], quick=[200, 2000], repeat=3)
+def db_seed(ctx: BenchmarkContext, count: int):
+    db = ctx.database(f"seed_{count}")
+    loader = TransformLoader(ctx.prompt_tree(count), bundle_path=ctx.root / "missing.bundle")
+    transformations = loader.load_from_directory()
+    return lambda: db.replace_default_transformations(transformations)
+
+
+@benchmark("db.get_transformations", [200, 2000, 20000], quick=[200, 2000])
+def db_get_transformations(ctx: BenchmarkContext, count: int):
+    db = _seeded_database(ctx, count)
+
+    def run():
+        db.get_categories()
+        db.get_transformations()
+    return run
+
+
+@benchmark("db.crud", [100, 1000], quick=[100])
+def db_crud(ctx: BenchmarkContext, count: int):
+    db = ctx.database(f"crud_{count}")
+
+    def run():
+        ids = [db.add_transformation(f"T{i}", "Bench", "prompt " * 50) for i in range(count)]
+        for transformation_id in ids:
+            db.update_transformation(transformation_id, prompt="updated " * 50)
+        for transformation_id in ids:
+            db.delete_transformation(transformation_id)
+        db.set_config("bench", {"value": count})
+        db.get_config("bench")
+    return run
+
+
+@benchmark("db.compressed_read", ["plain", "zlib"], quick=["plain", "zlib"])
+def db_compressed_read(ctx: BenchmarkContext, storage: str):
+    db = ctx.database(f"compressed_{storage}", compress=storage == "zlib")
+    loader = TransformLoader(ctx.prompt_tree(2000), bundle_path=ctx.root / "missing.bundle")
+    db.replace_default_transformations(loader.load_from_directory())
+    keys = [f"step-{i}" for i in range(200)]
+    for i, key in enumerate(keys):
+        db.set_cached_step(key, make_document(8 * KB, seed=i))
+    db.conn.execute("VACUUM")
+    print(f"{'':40s} database size {db.db_path.stat().st_size / KB:10.0f} KiB")
+
+    def run():
+        # Cold reads: every compressed value is inflated again
+        db.codec.clear_cache()
+        db.get_transformations()
+        for key in keys:
+            db.get_cached_step(key)
+    return run
+
+
+# --- Search index ------------------------------------------------------------
+
+@benchmark("search.build", [200, 2000], quick=[200])
+def search_build(ctx: BenchmarkContext, count: int):
+    transformations = _seeded_database(ctx, count).get_transformations()
+
+    return lambda: TrigramIndex.from_transformations(transformations)
+
+
+@benchmark("search.query", [200, 2000, 20000], quick=[200, 2000])
+def search_query(ctx: BenchmarkContext, count: int):
+    index = TrigramIndex.from_transformations(_seeded_database(ctx, count).get_transformations())
+    queries = ["shakespere", "uk eng", "email", "formal tone", "bulet", "transfrom 12"]
+
+    def run():
+        for query in queries:
+            index.search(query)
+    return run
+
+
+# --- VersionManager ----------------------------------------------------------
+
+@benchmark("versions.history", [1 * KB, 100 * KB, 10 * MB], quick=[1 * KB, 100 * KB], repeat=3)
+def versions_history(ctx: BenchmarkContext, size: int):
+    versions = 200 if size >= MB else 2000
+    history = make_history(make_document(size), versions)
+
+    def run():
+        manager = VersionManager(history[0])
+        for text in history[1:]:
+            manager.add_version(text)
+        while manager.can_go_back():
+            manager.go_back()
+        while manager.can_go_forward():
+            manager.go_forward()
+        manager.restore_original()
+    return run
+
+
+# --- OpenRouterClient --------------------------------------------------------
+
+@benchmark("client.roundtrip", [1 * KB, 100 * KB, 10 * MB], quick=[1 * KB, 100 * KB])
+def client_roundtrip(ctx: BenchmarkContext, size: int):
+    client = ctx.client()
+    document = make_document(size)
+
+    async def run():
+        await client.transform_text(document, ["Fix punctuation."])
+    return run
+
+
+@benchmark("client.concurrent", [8, 64], quick=[8])
+def client_concurrent(ctx: BenchmarkContext, concurrency: int):
+    client = ctx.client()
+    documents = [make_document(2 * KB, seed=i) for i in range(concurrency)]
+
+    async def run():
+        await asyncio.gather(*[
+            client.transform_text(document, ["Fix punctuation."]) for document in documents
+        ])
+    return run
+
+
+@benchmark("incremental.rerun", [100 * KB, 1 * MB], quick=[100 * KB])
+def incremental_rerun(ctx: BenchmarkContext, size: int):
+    client = ctx.client()
+    db = ctx.database(f"incremental-{size}")
+    document = make_document(size)
+    prompts = ["Fix punctuation."]
+    ctx.loop.run_until_complete(IncrementalTransform(client, db).run(document, prompts))
+    edits = iter(range(1_000_000))
+
+    async def run():
+        # A fresh one-word edit each repetition, so exactly one paragraph is resent
+        edited = document.replace(".", f" edit{next(edits)}.", 1)
+        await IncrementalTransform(client, db).run(edited, prompts)
+    return run
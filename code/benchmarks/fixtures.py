@@ -0,0 +1,98 @@
+"""Synthetic data for benchmarks: prompt trees, documents, version histories."""
+
+import random
+from pathlib import Path
+from typing import List
+
+WORDS = (
+    "the quick brown fox jumps over lazy dog email meeting report draft "
+    "summary clarity formal casual tone bullet paragraph heading rewrite "
+    "voice note transcript punctuation grammar invitation proposal agenda"
+).split()
+
+CATEGORIES = [
+    "voice-processing", "formats", "styles", "word-count", "simplification",
+    "formatting", "grammar", "style-guides", "creative", "specialized",
+]
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    """Generate one pseudo-random sentence."""
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def make_prompt_tree(root: Path, count: int, seed: int = 0) -> Path:
+    """Write a synthetic prompts directory.
+
+    Files are spread over category subdirectories and look like the real
+    prompt files (H1 title, sections, fenced system prompt); one in ten has
+    frontmatter.
+
+    Args:
+        root: Directory to create the tree in
+        count: Number of prompt files
+        seed: Random seed
+
+    Returns:
+        Path to the prompts directory
+    """
+    rng = random.Random(seed)
+    prompts_dir = root / f"prompts_{count}"
+    for category in CATEGORIES:
+        (prompts_dir / category).mkdir(parents=True, exist_ok=True)
+
+    for i in range(count):
+        category = CATEGORIES[i % len(CATEGORIES)]
+        title = f"Transform {i} {rng.choice(WORDS).title()}"
+        body = " ".join(_sentence(rng) for _ in range(rng.randint(4, 30)))
+        frontmatter = ""
+        if i % 10 == 0:
+            frontmatter = "---\nmodel: openai/gpt-4o-mini\nmax_tokens: 1024\n---\n"
+        (prompts_dir / category / f"transform_{i:05d}.md").write_text(
+            f"{frontmatter}# {title}\n\n## Name\n{title}\n\n"
+            f"## System Prompt Text\n```\n{body}\n```\n",
+            encoding="utf-8"
+        )
+
+    return prompts_dir
+
+
+def make_document(size: int, seed: int = 0) -> str:
+    """Generate a markdown-ish document of roughly the given size.
+
+    Args:
+        size: Target size in bytes
+        seed: Random seed
+
+    Returns:
+        Document text
+    """
+    rng = random.Random(seed)
+    paragraphs = []
+    total = 0
+    while total < size:
+        paragraph = " ".join(_sentence(rng) for _ in range(rng.randint(2, 8)))
+        paragraphs.append(paragraph)
+        total += len(paragraph) + 2
+    return "\n\n".join(paragraphs)[:size]
+
+
+def make_history(document: str, versions: int, seed: int = 0) -> List[str]:
+    """Generate successive versions of a document with small edits.
+
+    Args:
+        document: Starting document
+        versions: Number of versions
+        seed: Random seed
+
+    Returns:
+        List of document versions
+    """
+    rng = random.Random(seed)
+    history = []
+    text = document
+    for _ in range(versions):
+        position = rng.randrange(max(len(text), 1))
+        text = text[:position] + rng.choice(WORDS) + text[position:]
+        history.append(text)
+    return history
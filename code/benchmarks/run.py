@@ -0,0 +1,173 @@
+"""Benchmark runner with JSON baselines and regression detection.
+
+Usage (from the code/ directory):
+
+    python -m benchmarks                    # run and compare against baseline
+    python -m benchmarks --quick            # smaller sizes only
+    python -m benchmarks --save-baseline    # record current results as baseline
+    python -m benchmarks -k loader          # only cases whose name contains "loader"
+
+Exits with status 1 if any case is slower than its baseline median by more
+than the threshold (default 25%).
+"""
+
+import argparse
+import inspect
+import json
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+from .cases import CASES, BenchmarkContext
+
+BENCH_DIR = Path(__file__).parent
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+DEFAULT_RESULTS = BENCH_DIR / "results" / "latest.json"
+
+
+def _time_case(ctx: BenchmarkContext, operation, repeat: int) -> List[float]:
+    """Time an operation repeat times (after one warm-up run).
+
+    Args:
+        ctx: Benchmark context (provides the event loop for async operations)
+        operation: Zero-argument callable or coroutine function
+        repeat: Number of timed runs
+
+    Returns:
+        List of durations in seconds
+    """
+    if inspect.iscoroutinefunction(operation):
+        def call():
+            ctx.loop.run_until_complete(operation())
+    else:
+        call = operation
+
+    call()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        call()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def run_benchmarks(quick: bool = False, pattern: str = "") -> Dict[str, Dict[str, Any]]:
+    """Run all registered benchmark cases.
+
+    Args:
+        quick: Use the reduced parameter sets
+        pattern: Only run cases whose name contains this text
+
+    Returns:
+        Dictionary mapping case id -> timing statistics
+    """
+    results = {}
+    ctx = BenchmarkContext()
+    try:
+        for case in CASES:
+            for param in (case.quick_params if quick else case.params):
+                case_id = f"{case.name}[{param}]"
+                if pattern and pattern not in case_id:
+                    continue
+                operation = case.func(ctx, param)
+                timings = _time_case(ctx, operation, case.repeat)
+                results[case_id] = {
+                    "median": statistics.median(timings),
+                    "min": min(timings),
+                    "max": max(timings),
+                    "repeat": case.repeat,
+                }
+                print(f"{case_id:40s} median {results[case_id]['median'] * 1000:10.2f} ms"
+                      f"   min {results[case_id]['min'] * 1000:10.2f} ms")
+                sys.stdout.flush()
+    finally:
+        ctx.close()
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[str]:
+    """Find cases that regressed against the baseline.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        threshold: Allowed relative slowdown (0.25 = 25%)
+
+    Returns:
+        List of human-readable regression descriptions
+    """
+    regressions = []
+    for case_id, current in results.items():
+        previous = baseline.get(case_id)
+        if not previous:
+            continue
+        ratio = current["median"] / previous["median"] if previous["median"] else 1.0
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{case_id}: {previous['median'] * 1000:.2f} ms -> "
+                f"{current['median'] * 1000:.2f} ms ({(ratio - 1) * 100:+.0f}%)"
+            )
+    return regressions
+
+
+def _write_json(path: Path, results: Dict[str, Dict[str, Any]]):
+    """Write results with environment information."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps({
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }, indent=2), encoding="utf-8")
+
+
+def main():
+    """Benchmark runner entry point."""
+    parser = argparse.ArgumentParser(description="AI-Textpad benchmark suite")
+    parser.add_argument("--quick", action="store_true", help="Run reduced sizes only")
+    parser.add_argument("-k", dest="pattern", default="", help="Only run matching cases")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE,
+                        help="Baseline JSON file (default: benchmarks/baseline.json)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_RESULTS,
+                        help="Where to write results (default: benchmarks/results/latest.json)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Store results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed slowdown before failing (default: 0.25)")
+    args = parser.parse_args()
+
+    results = run_benchmarks(quick=args.quick, pattern=args.pattern)
+    _write_json(args.output, results)
+
+    if args.save_baseline:
+        if args.baseline.exists():
+            # Keep cases that were not part of this run
+            merged = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+            merged.update(results)
+            results = merged
+        _write_json(args.baseline, results)
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["results"]
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+        for regression in regressions:
+            print(f"  {regression}")
+        sys.exit(1)
+
+    print(f"\nNo regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,10 @@ echo "Version: $VERSION"
 echo "Cleaning previous builds..."
 rm -rf build/ dist/ *.egg-info debian/
 
+# Compile prompt catalog bundle
+echo "Building prompt catalog bundle..."
+python3 -m ai_textpad.transforms.catalog_bundle build
+
 # Build Python wheel
 echo "Building Python package..."
 python3 setup.py sdist bdist_wheel
@@ -57,7 +61,24 @@ cd /opt/ai-textpad
 exec python3 -m ai_textpad.main "$@"
 EOF
 
-chmod +x debian/usr/local/bin/ai-textpad
+# Create daemon and CLI client launchers
+cat > debian/usr/local/bin/ai-textpad-daemon <<'EOF'
+#!/bin/bash
+# Headless resident daemon for AI-Textpad
+
+cd /opt/ai-textpad
+exec python3 -m ai_textpad.daemon "$@"
+EOF
+
+cat > debian/usr/local/bin/ai-textpad-cli <<'EOF'
+#!/bin/bash
+# Thin stdin/stdout client for the AI-Textpad daemon
+
+cd /opt/ai-textpad
+exec python3 -m ai_textpad.cli "$@"
+EOF
+
+chmod +x debian/usr/local/bin/ai-textpad debian/usr/local/bin/ai-textpad-daemon debian/usr/local/bin/ai-textpad-cli
 
 # Create desktop entry
 cat > debian/usr/share/applications/ai-textpad.desktop <<EOF
@@ -22,6 +22,8 @@ setup(
     entry_points={
         "console_scripts": [
             "ai-textpad=ai_textpad.main:main",
+            "ai-textpad-daemon=ai_textpad.daemon:main",
+            "ai-textpad-cli=ai_textpad.cli:main",
         ],
     },
     classifiers=[
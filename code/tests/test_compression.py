@@ -0,0 +1,133 @@
+"""Round-trip tests for compressed text columns."""
+
+import json
+
+from ai_textpad.storage.compression import COMPRESS_MIN_BYTES, TextCodec
+from ai_textpad.storage.database import ConfigDatabase
+
+TOPICS = ["emails", "meeting notes", "reports", "blog posts", "invitations",
+          "agendas", "summaries", "letters", "proposals", "tweets"]
+
+
+def sample_prompts(style: str = "clear"):
+    """Prompts that share enough phrasing to train a dictionary."""
+    return [
+        f"Take the text provided by the user and reformat it into {topic}. "
+        f"Keep the tone {style} and professional, ensure adequate paragraph "
+        f"spacing, and return only the edited text without any other messages. "
+        f"Edit the text lightly for clarity, coherence and flow. Make no other changes."
+        for topic in TOPICS
+    ]
+
+
+def test_short_text_stays_plain(tmp_path):
+    """Values below COMPRESS_MIN_BYTES are stored and read back as text."""
+    db = ConfigDatabase(tmp_path / "config.db")
+    text = "x" * (COMPRESS_MIN_BYTES - 1)
+    assert db.codec.encode(text) == text
+
+    db.set_config("short", text)
+    stored = db.conn.execute("SELECT value FROM config WHERE key = 'short'").fetchone()[0]
+    assert isinstance(stored, str)
+    assert db.get_config("short") == text
+
+
+def test_compressed_value_after_training(tmp_path):
+    """Long values become smaller blobs naming the trained dictionary."""
+    db = ConfigDatabase(tmp_path / "config.db")
+    dictionary_id = db.codec.train(sample_prompts())
+    assert dictionary_id is not None
+
+    prompt = sample_prompts()[0] * 2
+    blob = db.codec.encode(prompt)
+    assert isinstance(blob, bytes)
+    assert len(blob) < len(prompt.encode("utf-8"))
+    assert int.from_bytes(blob[1:3], "big") == dictionary_id
+    assert db.codec.decode(blob) == prompt
+
+    transformation_id = db.add_transformation("Reformat", "General", prompt)
+    stored = db.conn.execute(
+        "SELECT prompt FROM transformations WHERE id = ?", (transformation_id,)
+    ).fetchone()[0]
+    assert isinstance(stored, bytes)
+    assert db.get_transformation(transformation_id)['prompt'] == prompt
+
+
+def test_old_dictionary_decodes_after_retraining(tmp_path):
+    """Values written under a replaced dictionary still decode, also after reopening."""
+    path = tmp_path / "config.db"
+    db = ConfigDatabase(path)
+    first = db.codec.train(sample_prompts())
+    old_prompt = sample_prompts()[1] * 2
+    old_blob = db.codec.encode(old_prompt)
+    transformation_id = db.add_transformation("Old", "General", old_prompt)
+
+    second = db.codec.train(sample_prompts("warm") + ["A different corpus entirely. " * 20] * 8)
+    assert second is not None and second != first
+    assert db.codec.dictionary_id == second
+    assert db.codec.decode(old_blob) == old_prompt
+    db.close()
+
+    reopened = ConfigDatabase(path)
+    reopened.codec.clear_cache()
+    assert reopened.get_transformation(transformation_id)['prompt'] == old_prompt
+    new_prompt = sample_prompts("warm")[2] * 2
+    assert int.from_bytes(reopened.codec.encode(new_prompt)[1:3], "big") == second
+
+
+def test_plain_rows_from_older_databases(tmp_path):
+    """Rows written as plain TEXT before compression existed read back unchanged."""
+    db = ConfigDatabase(tmp_path / "config.db")
+    db.codec.train(sample_prompts())
+    prompt = sample_prompts()[3] * 2
+    catalog = {"models": ["model-%d" % i for i in range(50)]}
+    db.conn.execute(
+        "INSERT INTO transformations (name, category, prompt, user_created) VALUES (?, ?, ?, 1)",
+        ("Legacy", "General", prompt)
+    )
+    db.conn.execute(
+        "INSERT INTO config (key, value) VALUES (?, ?)", ("catalog", json.dumps(catalog))
+    )
+    db.conn.commit()
+
+    legacy = next(t for t in db.get_transformations() if t['name'] == "Legacy")
+    assert legacy['prompt'] == prompt
+    assert db.get_config("catalog") == catalog
+
+    # Rewriting a plain row compresses it
+    db.update_transformation(legacy['id'], prompt=prompt)
+    stored = db.conn.execute(
+        "SELECT prompt FROM transformations WHERE id = ?", (legacy['id'],)
+    ).fetchone()[0]
+    assert isinstance(stored, bytes)
+    assert db.get_transformation(legacy['id'])['prompt'] == prompt
+
+
+def test_disabled_codec_still_decodes(tmp_path):
+    """A codec that no longer compresses reads blobs written by one that did."""
+    db = ConfigDatabase(tmp_path / "config.db")
+    db.codec.train(sample_prompts())
+    prompt = sample_prompts()[4] * 2
+    blob = db.codec.encode(prompt)
+
+    plain = TextCodec(db.conn, enabled=False)
+    assert plain.encode(prompt) == prompt
+    assert plain.decode(blob) == prompt
+
+
+def test_listing_decodes_prompts_lazily(tmp_path):
+    """Listing transformations inflates a prompt only when it is read."""
+    db = ConfigDatabase(tmp_path / "config.db")
+    db.codec.train(sample_prompts())
+    prompts = [p * 2 for p in sample_prompts()]
+    for number, prompt in enumerate(prompts):
+        db.add_transformation(f"T{number}", "General", prompt)
+    db.codec.clear_cache()
+
+    listed = db.get_transformations()
+    assert db.codec._inflate.cache_info().currsize == 0
+    by_name = {t['name']: t for t in listed}
+    assert by_name["T0"]['prompt'] == prompts[0]
+    assert db.codec._inflate.cache_info().currsize == 1
+    assert json.loads(json.dumps(by_name["T1"]))['prompt'] == prompts[1]
+    assert dict(by_name["T2"])['prompt'] == prompts[2]
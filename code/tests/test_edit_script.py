@@ -0,0 +1,105 @@
+"""Tests for parsing and applying edit scripts."""
+
+import asyncio
+
+import pytest
+
+from ai_textpad.transforms.edit_script import (
+    EDIT_SCRIPT_INSTRUCTIONS, EditScriptTransform, apply_edits, parse_edit_script
+)
+
+TEXT = "Teh cat sat on teh mat. The dog sat too."
+
+
+class FakeClient:
+    """Returns queued responses and records each request's output instructions."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    async def transform_text(self, text, prompts, user_details=None, **options):
+        self.requests.append(options.get("output_instructions"))
+        return self.responses.pop(0)
+
+
+def test_parse_fenced_script():
+    """A script in a JSON code fence is parsed into (find, replace) pairs."""
+    output = '```json\n{"edits": [{"find": "Teh", "replace": "The"}]}\n```'
+    assert parse_edit_script(output) == [("Teh", "The")]
+
+
+@pytest.mark.parametrize("output", [
+    "The cat sat on the mat.",
+    '{"changes": []}',
+    '{"edits": [{"find": "", "replace": "x"}]}',
+    '{"edits": [{"find": "Teh"}]}',
+    '{"edits": ["Teh"]}',
+])
+def test_parse_rejects_malformed_scripts(output):
+    """Anything but a list of non-empty finds with replacements is rejected."""
+    with pytest.raises(ValueError):
+        parse_edit_script(output)
+
+
+def test_replace_not_found():
+    """An edit whose text does not occur is rejected."""
+    with pytest.raises(ValueError, match="not found"):
+        apply_edits(TEXT, [("The bird", "A bird")])
+
+
+def test_replace_several_matches_is_ambiguous():
+    """A find occurring more often than it is listed is rejected."""
+    with pytest.raises(ValueError, match="ambiguous"):
+        apply_edits(TEXT, [("sat", "stood")])
+
+
+def test_repeated_edit_replaces_each_match():
+    """An edit listed once per occurrence replaces every occurrence."""
+    assert apply_edits(TEXT, [("sat", "stood"), ("sat", "stood")]) == (
+        "Teh cat stood on teh mat. The dog stood too."
+    )
+
+
+def test_edits_apply_in_text_order():
+    """Edits listed out of order are anchored in the original text."""
+    edits = [("teh mat", "the mat"), ("Teh cat", "The cat")]
+    assert apply_edits(TEXT, edits) == "The cat sat on the mat. The dog sat too."
+
+
+def test_overlapping_edits():
+    """Edits whose spans overlap are rejected."""
+    with pytest.raises(ValueError, match="overlap"):
+        apply_edits(TEXT, [("cat sat", "cat stood"), ("sat on", "sits on")])
+
+
+def test_no_edits_keeps_text():
+    """An empty script leaves the text unchanged."""
+    assert apply_edits(TEXT, parse_edit_script('{"edits": []}')) == TEXT
+
+
+def test_applied_script_is_not_rewritten():
+    """A valid script is applied locally with a single request."""
+    client = FakeClient('{"edits": [{"find": "Teh", "replace": "The"}, '
+                        '{"find": "teh", "replace": "the"}]}')
+    transform = EditScriptTransform(client)
+
+    result = asyncio.run(transform.transform_text(TEXT, ["Fix typos"]))
+    assert result == "The cat sat on the mat. The dog sat too."
+    assert client.requests == [EDIT_SCRIPT_INSTRUCTIONS]
+    assert (transform.edits_applied, transform.fallbacks) == (2, 0)
+
+
+@pytest.mark.parametrize("script", [
+    "Sorry, here is the corrected text.",
+    '{"edits": [{"find": "sat", "replace": "stood"}]}',
+])
+def test_rejected_script_falls_back_to_rewrite(script):
+    """A malformed or unappliable script is followed by a full rewrite."""
+    rewrite = "The cat sat on the mat. The dog sat too."
+    client = FakeClient(script, rewrite)
+    transform = EditScriptTransform(client)
+
+    assert asyncio.run(transform.transform_text(TEXT, ["Fix typos"])) == rewrite
+    assert client.requests == [EDIT_SCRIPT_INSTRUCTIONS, None]
+    assert (transform.edits_applied, transform.fallbacks) == (0, 1)
@@ -0,0 +1,48 @@
+"""Regression tests for JobRunner scheduling."""
+
+import asyncio
+
+from ai_textpad.storage.database import ConfigDatabase
+from ai_textpad.storage.job_queue import PRIORITY_BATCH, JobQueue
+from ai_textpad.transforms.jobs import JobRunner
+
+
+def test_background_cap_does_not_busy_loop(tmp_path):
+    """A job held back by the background cap waits for a slot without polling."""
+    queue = JobQueue(ConfigDatabase(tmp_path / "config.db"))
+    claims = 0
+    claim = queue.claim
+
+    def counting_claim(*args, **kwargs):
+        nonlocal claims
+        claims += 1
+        return claim(*args, **kwargs)
+
+    queue.claim = counting_claim
+
+    async def scenario():
+        release = asyncio.Event()
+        runner = JobRunner(queue, max_workers=3)
+
+        async def handler(job, report_progress):
+            await release.wait()
+            return job['id']
+
+        runner.register("batch", handler)
+        runner.start()
+        job_ids = [runner.submit("batch", {}, PRIORITY_BATCH) for _ in range(3)]
+        results = [runner.wait(job_id) for job_id in job_ids]
+
+        await asyncio.sleep(0.5)
+        polls = claims
+        running = runner._background_running
+
+        release.set()
+        done = await asyncio.wait_for(asyncio.gather(*results), 5)
+        await runner.stop()
+        return polls, running, done
+
+    polls, running, done = asyncio.run(scenario())
+    assert running == 2
+    assert polls < 20
+    assert len(done) == 3